@@ -9,9 +9,71 @@ load_dotenv()
 # All persistent data stored under /app/data/ directory
 APP_ROOT = Path(__file__).resolve().parent.parent
 DATA_ROOT = APP_ROOT / "data"
-DB_DIR = DATA_ROOT / "db"
-UPLOADS_DIR = DATA_ROOT / "uploads"
-DB_PATH = DB_DIR / "database.db"
+UPLOADS_DIR = Path(os.getenv("UPLOADS_DIR", str(DATA_ROOT / "uploads")))
+# DB_PATH can point the app to another database, e.g. a throwaway benchmark one
+DB_PATH = Path(os.getenv("DB_PATH", str(DATA_ROOT / "db" / "database.db")))
+DB_DIR = DB_PATH.parent
+# Fingerprinted and compressed static files built on startup, served at /static
+STATIC_BUILD_DIR = Path(os.getenv("STATIC_BUILD_DIR", str(DATA_ROOT / "static")))
+# Compiled templates kept between restarts and shared by the app workers, an
+# empty TEMPLATE_CACHE_DIR disables it. TEMPLATE_WARMUP=0 skips compiling all
+# templates on startup, they are then compiled on their first render
+TEMPLATE_CACHE_DIR_ENV = os.getenv("TEMPLATE_CACHE_DIR", str(DATA_ROOT / "jinja_cache"))
+TEMPLATE_CACHE_DIR = Path(TEMPLATE_CACHE_DIR_ENV) if TEMPLATE_CACHE_DIR_ENV else None
+TEMPLATE_WARMUP = os.getenv("TEMPLATE_WARMUP", "1") != "0"
+
+# Connection pool sizing for the SQLite data layer, the pool holds up to
+# DB_POOL_SIZE read connections plus one dedicated writer connection
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "5"))
+DB_POOL_TIMEOUT = float(os.getenv("DB_POOL_TIMEOUT", "30"))
+
+# In-process assessment Q&A cache, capped by number of cached assessments and
+# by estimated memory in bytes, QA_CACHE_SIZE=0 disables the cache
+QA_CACHE_SIZE = int(os.getenv("QA_CACHE_SIZE", "256"))
+QA_CACHE_MAX_BYTES = int(os.getenv("QA_CACHE_MAX_BYTES", str(32 * 1024 * 1024)))
+
+# In-process caches of verified access tokens and of the users they belong to,
+# entries live at most AUTH_CACHE_TTL seconds, which is also how long another
+# app process can keep serving a user changed elsewhere, 0 disables the caches
+AUTH_CACHE_SIZE = int(os.getenv("AUTH_CACHE_SIZE", "1024"))
+AUTH_CACHE_TTL = float(os.getenv("AUTH_CACHE_TTL", "30"))
+
+# Number of threads hashing and verifying passwords, bcrypt is cpu bound so
+# more threads than cores only queue up, the login requests wait for a free one
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", str(os.cpu_count() or 1)))
+
+# bcrypt work factor of new password hashes, unset the app measures bcrypt on
+# startup and picks the highest work factor hashing within BCRYPT_TARGET_MS
+BCRYPT_ROUNDS_ENV = os.getenv("BCRYPT_ROUNDS")
+BCRYPT_ROUNDS = int(BCRYPT_ROUNDS_ENV) if BCRYPT_ROUNDS_ENV else None
+BCRYPT_TARGET_MS = float(os.getenv("BCRYPT_TARGET_MS", "250"))
+
+# Token bucket limits of the login and password reset, each bucket holds the
+# given number of attempts and refills completely over RATE_LIMIT_PERIOD
+# seconds. RATE_LIMIT_BACKEND=sqlite shares the buckets between app workers
+RATE_LIMIT_BACKEND = os.getenv("RATE_LIMIT_BACKEND", "memory")
+RATE_LIMIT_PERIOD = float(os.getenv("RATE_LIMIT_PERIOD", "900"))
+RATE_LIMIT_MAX_KEYS = int(os.getenv("RATE_LIMIT_MAX_KEYS", "100000"))
+LOGIN_ATTEMPTS_PER_IP = int(os.getenv("LOGIN_ATTEMPTS_PER_IP", "30"))
+LOGIN_ATTEMPTS_PER_USER = int(os.getenv("LOGIN_ATTEMPTS_PER_USER", "10"))
+PASSWORD_RESETS_PER_IP = int(os.getenv("PASSWORD_RESETS_PER_IP", "10"))
+PASSWORD_RESETS_PER_EMAIL = int(os.getenv("PASSWORD_RESETS_PER_EMAIL", "3"))
+
+if RATE_LIMIT_BACKEND not in ("memory", "sqlite"):
+    raise InvalidConstantValue("RATE_LIMIT_BACKEND must be memory or sqlite. Exitting")
+
+# Requests running more SQL statements than this are counted and printed
+# with their most repeated statement, 0 disables the check. /metrics requires
+# METRICS_TOKEN as bearer token, unset /metrics answers 404
+SQL_QUERIES_WARN = int(os.getenv("SQL_QUERIES_WARN", "20"))
+METRICS_TOKEN = os.getenv("METRICS_TOKEN")
+
+# Html, svg and json responses of at least this many bytes are compressed
+# with brotli or gzip, smaller ones are sent as they are
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))
+
+# Number of items loaded at once by the paginated dashboard lists
+DASHBOARD_PAGE_SIZE = int(os.getenv("DASHBOARD_PAGE_SIZE", "30"))
 
 SECRET_KEY_ENV = os.getenv("SECRET_KEY")
 if SECRET_KEY_ENV is None:
@@ -60,12 +122,32 @@ if ( SMTP_LOGIN is None or SMTP_PASSWORD is None or SMTP_EMAIL is None
 else:
     SMTP_ENABLED = True
 
+# ssl connects with implicit TLS, starttls upgrades a plain connection and
+# none sends in plain text, only meant for a local test SMTP server
+SMTP_SECURITY = os.getenv("SMTP_SECURITY", "ssl")
+if SMTP_SECURITY not in ("ssl", "starttls", "none"):
+    raise InvalidConstantValue("SMTP_SECURITY must be ssl, starttls or none. Exitting")
+
+# E-mails are queued in the outbox and sent by a background worker in batches
+# of OUTBOX_BATCH_SIZE over one SMTP session, which is closed after
+# SMTP_IDLE_SECONDS without e-mails. Failed e-mails are retried after
+# OUTBOX_RETRY_SECONDS, doubled with every attempt, OUTBOX_MAX_ATTEMPTS times
+OUTBOX_BATCH_SIZE = int(os.getenv("OUTBOX_BATCH_SIZE", "20"))
+OUTBOX_POLL_SECONDS = float(os.getenv("OUTBOX_POLL_SECONDS", "5"))
+OUTBOX_RETRY_SECONDS = float(os.getenv("OUTBOX_RETRY_SECONDS", "30"))
+OUTBOX_MAX_ATTEMPTS = int(os.getenv("OUTBOX_MAX_ATTEMPTS", "6"))
+SMTP_IDLE_SECONDS = float(os.getenv("SMTP_IDLE_SECONDS", "60"))
+
 
 
 SECRET_KEY = str(SECRET_KEY_ENV)
 ALGORITHM = str(ALGORITHM_ENV)
 ACCESS_TOKEN_EXPIRE_MINUTES = int(ACCESS_TOKEN_EXPIRE_MINUTES_ENV)
 
+# Authenticated requests arriving less than SESSION_RENEW_WINDOW seconds before
+# the access token expires get a fresh token cookie
+SESSION_RENEW_WINDOW = int(os.getenv("SESSION_RENEW_WINDOW", "180"))
+
 DEFAULT_USER = str(DEFAULT_USER_ENV)
 DEFAULT_EMAIL = str(DEFAULT_EMAIL_ENV)
 DEFAULT_PASSWORD = str(DEFAULT_PASSWORD_ENV)
@@ -1,8 +1,9 @@
 from uuid import uuid4
 from babel.dates import format_datetime
-from datetime import datetime
-from app.data.init import conn, curs
-import app.data.question as question_data
+from datetime import datetime, timedelta, timezone
+from sqlite3 import Cursor
+from app.data.init import pool
+from app.data.pagination import keyset, to_page
 from app.exception.database import RecordNotFound
 from app.model.assesment import (
     Assessment,
@@ -10,55 +11,20 @@ from app.model.assesment import (
     AssessmentChown,
     AssessmentNew,
     AssessmentQA,
+    AssessmentVersion,
 )
-from app.model.question import Question, QuestionCategory
+from app.model.pagination import AssessmentListQuery, Page
 from app.model.user import User
 
 
-curs.execute(
-    """create table if not exists assessments(
-    assessment_id text primary key,
-    assessment_name text,
-    owner_id text references users( user_id ),
-    last_edit text,
-    last_editor text
-    )"""
-)
-
-
-curs.execute(
-    """create table if not exists assessments_questions(
-    question_id integer PRIMARY KEY,
-    assessment_id text references assessments( assessment_id ),
-    category_id references assessments_questions_categories( category_id ),
-    question text,
-    question_description text,
-    question_order integer,
-    option_yes text,
-    option_mid text,
-    option_no text)"""
-)
-
-
-curs.execute(
-    """create table if not exists assessments_questions_categories(
-    category_id integer primary key,
-    assessment_id text references assessments( assessment_id ),
-    category_name text,
-    category_order integer
-    )"""
-)
-
-
-curs.execute(
-    """create table if not exists assessments_answers(
-    answer_id text pirmary key,
-    assessment_id text references assessments( assessment_id ),
-    question_id integer references assessments_questions( question_id ),
-    answer_option text,
-    answer_description text
-    )"""
-)
+# Sort keys of the paginated assessment list and the expressions they sort
+# by, coalesce keeps NULLs out of the keyset comparison and matches the
+# expression indexes
+ASSESSMENT_SORTS = {
+    "name": "coalesce(a.assessment_name, '')",
+    "owner": "coalesce(u1.username, '')",
+    "last_edit": "coalesce(a.last_edit_at, '')",
+}
 
 
 # -------------------------------
@@ -76,8 +42,10 @@ def assessment_row_to_model(row: tuple) -> Assessment:
         last_editor,
         last_editor_name,
         last_edit,
+        *has_reports,
     ) = row
 
+    # Queries listing assessments for their owner add has_reports column
     return Assessment(
         assessment_id=assessment_id,
         assessment_name=assessment_name,
@@ -86,7 +54,7 @@ def assessment_row_to_model(row: tuple) -> Assessment:
         last_editor=last_editor,
         last_editor_name=last_editor_name,
         last_edit=last_edit,
-        has_reports=None,
+        has_reports=bool(has_reports[0]) if has_reports else None,
     )
 
 
@@ -111,6 +79,7 @@ def assessment_question_row_to_model(row: tuple) -> AssessmentQA:
         answer_id,
         answer_option,
         answer_description,
+        version,
     ) = row
 
     return AssessmentQA(
@@ -132,146 +101,150 @@ def assessment_question_row_to_model(row: tuple) -> AssessmentQA:
         answer_id=answer_id,
         answer_option=answer_option,
         answer_description=answer_description,
+        version=version,
     )
 
 
-# -------------------------------
-#   assessment preparation
-# -------------------------------
-
-
-def create_assessment(assessment_new: AssessmentNew) -> Assessment:
+def bump_version(cursor: Cursor, assessment_id: str) -> int | None:
+    """Bumps the version of the assessment within the write transaction of
+    <cursor>, returns the new version or None when there is no such
+    assessment"""
 
-    # Create new assessment entry
-    qry = """insert into assessments(assessment_id, assessment_name, owner_id)
-    values(:assessment_id, :assessment_name, :owner_id)"""
+    qry = """
+    update
+        assessments
+    set
+        version = version + 1,
+        updated_at = :updated_at
+    where
+        assessment_id = :assessment_id
+    returning
+        version
+    """
 
     params = {
-        "assessment_id": assessment_new.assessment_id,
-        "assessment_name": assessment_new.assessment_name,
-        "owner_id": assessment_new.owner_id,
+        "updated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "assessment_id": assessment_id,
     }
 
-    cursor = conn.cursor()
+    cursor.execute(qry, params)
+    row = cursor.fetchone()
+    return row[0] if row else None
+
 
-    try:
-        cursor.execute(qry, params)
-        conn.commit()
-        category_id_map: dict = freeze_questions_categories(
-            assessment_new.assessment_id
-        )
-        freeze_questions(
-            assessment_id=assessment_new.assessment_id, category_id_map=category_id_map
-        )
-        prepare_answers(assessment_id=assessment_new.assessment_id)
-        prepare_notes(assessment_id=assessment_new.assessment_id)
-        return get_one(assessment_id=assessment_new.assessment_id)
-    finally:
-        cursor.close()
+# -------------------------------
+#   assessment preparation
+# -------------------------------
 
 
-def freeze_questions_categories(assessment_id: str) -> dict:
+def create_assessment(assessment_new: AssessmentNew) -> Assessment:
+
+    return create_assessments(assessments_new=[assessment_new])[0]
 
-    questions_cateogies: list[QuestionCategory] = question_data.get_all_categories()
-    category_id_map: dict = {}
 
-    for category in questions_cateogies:
+def create_assessments(assessments_new: list[AssessmentNew]) -> list[Assessment]:
+    """Creates the assessments together with their frozen copy of the current
+    questions, categories, empty answers and notes in a single transaction."""
 
-        qry = """insert into
-        assessments_questions_categories(assessment_id, category_name, category_order)
-        values(:assessment_id, :category_name, :category_order)"""
+    if not assessments_new:
+        return []
 
-        params = {
-            "assessment_id": assessment_id,
-            "category_name": category.category_name,
-            "category_order": category.category_order,
-        }
+    ids = [{"assessment_id": a.assessment_id} for a in assessments_new]
 
+    with pool.write() as conn:
         cursor = conn.cursor()
         try:
-            cursor.execute(qry, params)
-            category_id_map[category.category_name] = cursor.lastrowid
-            conn.commit()
+            cursor.executemany(
+                """insert into assessments(assessment_id, assessment_name, owner_id)
+                values(:assessment_id, :assessment_name, :owner_id)""",
+                [a.model_dump() for a in assessments_new],
+            )
+            freeze_questions_categories(cursor=cursor, ids=ids)
+            freeze_questions(cursor=cursor, ids=ids)
+            prepare_answers(cursor=cursor, ids=ids)
+            prepare_notes(cursor=cursor, ids=ids)
         finally:
             cursor.close()
 
-    return category_id_map
+        return [get_one(assessment_id=a.assessment_id) for a in assessments_new]
 
 
-def freeze_questions(assessment_id: str, category_id_map: dict) -> bool:
+def freeze_questions_categories(cursor: Cursor, ids: list[dict]):
 
-    questions: list[Question] = question_data.get_all()
+    qry = """insert into
+    assessments_questions_categories(assessment_id, category_name, category_order)
+    select
+        :assessment_id, category_name, category_order
+    from
+        questions_categories
+    order by
+        category_order asc"""
 
-    for question in questions:
-        qry = """insert into
-        assessments_questions(assessment_id, category_id, question, question_description,
-                              question_order, option_yes, option_mid, option_no)
-        values(:assessment_id, :category_id, :question, :question_description,
-               :question_order, :option_yes, :option_mid, :option_no)
-        """
+    cursor.executemany(qry, ids)
 
-        category_id = category_id_map[question.category_name]
 
-        params = {
-            "assessment_id": assessment_id,
-            "category_id": category_id,
-            "question": question.question,
-            "question_description": question.question_description,
-            "question_order": question.question_order,
-            "option_yes": question.option_yes,
-            "option_mid": question.option_mid,
-            "option_no": question.option_no,
-        }
+def freeze_questions(cursor: Cursor, ids: list[dict]):
 
-        cursor = conn.cursor()
-        try:
-            cursor.execute(qry, params)
-            conn.commit()
-        finally:
-            cursor.close()
+    # Frozen questions point to the frozen copy of their category, matched
+    # through the category order which is unique within the assessment
+    qry = """insert into
+    assessments_questions(assessment_id, category_id, question, question_description,
+                          question_order, option_yes, option_mid, option_no)
+    select
+        aqc.assessment_id, aqc.category_id, q.question, q.question_description,
+        q.question_order, q.option_yes, q.option_mid, q.option_no
+    from
+        questions as q
+    join
+        questions_categories as qc
+        on q.category_id = qc.category_id
+    join
+        assessments_questions_categories as aqc
+        on aqc.assessment_id = :assessment_id
+        and aqc.category_order = qc.category_order
+    order by
+        qc.category_order asc,
+        q.question_order asc"""
 
-    return True
+    cursor.executemany(qry, ids)
 
+    if cursor.rowcount < 1:
+        raise RecordNotFound(msg="No questions found to create the assessment from.")
 
-def prepare_answers(assessment_id: str) -> bool:
 
-    questions: list[AssessmentQA] = (
-        filter_assessment_qa_by_category_order_and_question_id(
-            assessment_id=assessment_id
-        )
-    )
+def prepare_answers(cursor: Cursor, ids: list[dict]):
+
+    qry_questions = """select question_id from assessments_questions
+    where assessment_id = :assessment_id"""
 
     qry = """insert into assessments_answers(answer_id, assessment_id, question_id)
     values(:answer_id, :assessment_id, :question_id)"""
 
-    cursor = conn.cursor()
-    try:
-        for question in questions:
-            params = {
-                "answer_id": str(uuid4()),
-                "assessment_id": assessment_id,
-                "question_id": question.question_id,
-            }
-            cursor.execute(qry, params)
-        conn.commit()
-        return True
-    finally:
-        cursor.close()
+    answers: list[dict] = []
+    for params in ids:
+        for (question_id,) in cursor.execute(qry_questions, params).fetchall():
+            answers.append(
+                {
+                    "answer_id": str(uuid4()),
+                    "assessment_id": params["assessment_id"],
+                    "question_id": question_id,
+                }
+            )
 
+    cursor.executemany(qry, answers)
 
-def prepare_notes(assessment_id: str) -> bool:
+
+def prepare_notes(cursor: Cursor, ids: list[dict]):
 
     qry = """insert into assessments_notes(assessment_id, category_order)
-    values(:assessment_id, :category_order)"""
+    select
+        assessment_id, category_order
+    from
+        assessments_questions_categories
+    where
+        assessment_id = :assessment_id"""
 
-    cursor = conn.cursor()
-    try:
-        for i in range(0, 13):
-            cursor.execute(qry, {"assessment_id": assessment_id, "category_order": i})
-        conn.commit()
-        return True
-    finally:
-        cursor.close()
+    cursor.executemany(qry, ids)
 
 
 # -------------------------------
@@ -302,16 +275,30 @@ def get_one(assessment_id: str) -> Assessment:
 
     params = {"assessment_id": assessment_id}
 
-    cursor = conn.cursor()
-    try:
-        cursor.execute(qry, params)
-        row = cursor.fetchone()
-        if row:
-            return assessment_row_to_model(row)
-        else:
-            raise RecordNotFound(msg="Requested assessment was not found.")
-    finally:
-        cursor.close()
+    with pool.read() as conn:
+        cursor = conn.cursor()
+        try:
+            cursor.execute(qry, params)
+            row = cursor.fetchone()
+            if row:
+                return assessment_row_to_model(row)
+            else:
+                raise RecordNotFound(msg="Requested assessment was not found.")
+        finally:
+            cursor.close()
+
+
+def any_exist() -> bool:
+
+    qry = """select exists (select 1 from assessments)"""
+
+    with pool.read() as conn:
+        cursor = conn.cursor()
+        try:
+            cursor.execute(qry)
+            return bool(cursor.fetchone()[0])
+        finally:
+            cursor.close()
 
 
 def get_all_for_user(user_id: str) -> list[Assessment]:
@@ -324,7 +311,11 @@ def get_all_for_user(user_id: str) -> list[Assessment]:
         u1.username as owner_name,
         a.last_editor,
         u2.username as last_editor_name,
-        a.last_edit
+        a.last_edit,
+        EXISTS (
+            SELECT 1 FROM reports r
+            WHERE r.assessment_id = a.assessment_id AND r.public = 1
+        ) as has_reports
     FROM
         assessments a
     LEFT JOIN
@@ -335,19 +326,17 @@ def get_all_for_user(user_id: str) -> list[Assessment]:
         owner_id = :user_id
     """
 
-    cursor = conn.cursor()
-    try:
-        cursor.execute(qry, {"user_id": user_id})
-        rows = cursor.fetchall()
-        if rows:
-            return [assessment_row_to_model(row) for row in rows]
-        else:
-            return []
-    finally:
-        cursor.close()
-    qry = """
-    seelct
-    """
+    with pool.read() as conn:
+        cursor = conn.cursor()
+        try:
+            cursor.execute(qry, {"user_id": user_id})
+            rows = cursor.fetchall()
+            if rows:
+                return [assessment_row_to_model(row) for row in rows]
+            else:
+                return []
+        finally:
+            cursor.close()
 
 
 def get_one_for_user(assessment_id: str, user_id: str) -> Assessment:
@@ -374,16 +363,17 @@ def get_one_for_user(assessment_id: str, user_id: str) -> Assessment:
 
     params = {"assessment_id": assessment_id, "user_id": user_id}
 
-    cursor = conn.cursor()
-    try:
-        cursor.execute(qry, params)
-        row = cursor.fetchone()
-        if row:
-            return assessment_row_to_model(row)
-        else:
-            raise RecordNotFound(msg="Requested assessment was not found.")
-    finally:
-        cursor.close()
+    with pool.read() as conn:
+        cursor = conn.cursor()
+        try:
+            cursor.execute(qry, params)
+            row = cursor.fetchone()
+            if row:
+                return assessment_row_to_model(row)
+            else:
+                raise RecordNotFound(msg="Requested assessment was not found.")
+        finally:
+            cursor.close()
 
 
 def get_all() -> list[Assessment]:
@@ -405,16 +395,83 @@ def get_all() -> list[Assessment]:
         users u2 ON a.last_editor = u2.user_id
     """
 
-    cursor = conn.cursor()
-    try:
-        cursor.execute(qry)
-        rows = cursor.fetchall()
-        if rows:
-            return [assessment_row_to_model(row) for row in rows]
-        else:
-            return []
-    finally:
-        cursor.close()
+    with pool.read() as conn:
+        cursor = conn.cursor()
+        try:
+            cursor.execute(qry)
+            rows = cursor.fetchall()
+            if rows:
+                return [assessment_row_to_model(row) for row in rows]
+            else:
+                return []
+        finally:
+            cursor.close()
+
+
+def get_page(query: AssessmentListQuery, limit: int) -> Page[Assessment]:
+    """Returns one page of assessments matching the filters of <query>."""
+
+    sort_column = ASSESSMENT_SORTS[query.sort]
+    page_condition, order_by, params = keyset(
+        sort_column=sort_column,
+        id_column="a.assessment_id",
+        descending=query.descending,
+        cursor=query.cursor,
+    )
+
+    conditions = [page_condition]
+    if query.name:
+        conditions.append("instr(lower(a.assessment_name), lower(:name)) > 0")
+        params["name"] = query.name
+    if query.owner:
+        conditions.append("instr(lower(u1.username), lower(:owner)) > 0")
+        params["owner"] = query.owner
+    if query.edited_after:
+        conditions.append("a.last_edit_at >= :edited_after")
+        params["edited_after"] = query.edited_after.isoformat()
+    if query.edited_before:
+        # Whole day of edited_before is included
+        conditions.append("a.last_edit_at < :edited_before")
+        params["edited_before"] = (query.edited_before + timedelta(days=1)).isoformat()
+
+    qry = f"""
+    SELECT
+        a.assessment_id,
+        a.assessment_name,
+        a.owner_id,
+        u1.username as owner_name,
+        a.last_editor,
+        u2.username as last_editor_name,
+        a.last_edit,
+        {sort_column} as sort_value
+    FROM
+        assessments a
+    LEFT JOIN
+        users u1 ON a.owner_id = u1.user_id
+    LEFT JOIN
+        users u2 ON a.last_editor = u2.user_id
+    WHERE
+        {" AND ".join(conditions)}
+    ORDER BY
+        {order_by}
+    LIMIT
+        :limit
+    """
+    params["limit"] = limit + 1
+
+    with pool.read() as conn:
+        cursor = conn.cursor()
+        try:
+            cursor.execute(qry, params)
+            rows = cursor.fetchall()
+            return to_page(
+                rows=rows,
+                limit=limit,
+                row_to_model=lambda row: assessment_row_to_model(row[:-1]),
+                cursor_values=lambda row: (row[-1], row[0]),
+            )
+        finally:
+            cursor.close()
 
 
 def delete_assessment(assessment_id: str) -> Assessment:
@@ -430,18 +487,18 @@ def delete_assessment(assessment_id: str) -> Assessment:
 
     params = {"assessment_id": assessment_id}
 
-    cursor = conn.cursor()
-    try:
-        cursor.execute(qry_rp, params)
-        cursor.execute(qry_qa, params)
-        cursor.execute(qry_an, params)
-        cursor.execute(qry_q, params)
-        cursor.execute(qry_qc, params)
-        cursor.execute(qry, params)
-        conn.commit()
-        return assessment
-    finally:
-        cursor.close()
+    with pool.write() as conn:
+        cursor = conn.cursor()
+        try:
+            cursor.execute(qry_rp, params)
+            cursor.execute(qry_qa, params)
+            cursor.execute(qry_an, params)
+            cursor.execute(qry_q, params)
+            cursor.execute(qry_qc, params)
+            cursor.execute(qry, params)
+            return assessment
+        finally:
+            cursor.close()
 
 
 def filter_assessment_qa_by_category_order_and_question_id(
@@ -466,7 +523,8 @@ def filter_assessment_qa_by_category_order_and_question_id(
         qc.category_order,
         aw.answer_id,
         aw.answer_option,
-        aw.answer_description
+        aw.answer_description,
+        a.version
     from 
         assessments_questions as q
     left join 
@@ -487,51 +545,88 @@ def filter_assessment_qa_by_category_order_and_question_id(
 
     params = {"assessment_id": assessment_id}
 
-    cursor = conn.cursor()
-    try:
-        _ = cursor.execute(qry, params)
-        rows = _.fetchall()
-        if rows:
-            return [assessment_question_row_to_model(question) for question in rows]
-        else:
-            raise RecordNotFound(
-                msg=f"Question for assessment: {assessment_id} was not found."
-            )
-    finally:
-        cursor.close()
+    with pool.read() as conn:
+        cursor = conn.cursor()
+        try:
+            _ = cursor.execute(qry, params)
+            rows = _.fetchall()
+            if rows:
+                return [assessment_question_row_to_model(question) for question in rows]
+            else:
+                raise RecordNotFound(
+                    msg=f"Question for assessment: {assessment_id} was not found."
+                )
+        finally:
+            cursor.close()
 
 
-def save_answer(answer_data: AssessmentAnswerPost):
+def get_version(assessment_id: str) -> AssessmentVersion:
+
+    qry = """
+    select
+        assessment_id,
+        version,
+        updated_at
+    from
+        assessments
+    where
+        assessment_id = :assessment_id
+    """
+
+    params = {"assessment_id": assessment_id}
+
+    with pool.read() as conn:
+        cursor = conn.cursor()
+        try:
+            cursor.execute(qry, params)
+            row = cursor.fetchone()
+            if row:
+                assessment_id, version, updated_at = row
+                return AssessmentVersion(
+                    assessment_id=assessment_id, version=version, updated_at=updated_at
+                )
+            else:
+                raise RecordNotFound(msg="Requested assessment was not found.")
+        finally:
+            cursor.close()
+
+
+def save_answer(answer_data: AssessmentAnswerPost) -> int | None:
+    """Saves the answer, returns the new version of the assessment"""
 
     qry = """
     update assessments_answers set 
         answer_option = :answer_option,
         answer_description = :answer_description
     where
-        answer_id = :answer_id
+        answer_id = :answer_id and
+        assessment_id = :assessment_id
     """
 
     params = {
         "answer_option": answer_data.answer_option,
         "answer_description": answer_data.answer_description,
         "answer_id": answer_data.answer_id,
+        "assessment_id": answer_data.assessment_id,
     }
 
-    cursor = conn.cursor()
-    try:
-        cursor.execute(qry, params)
-        conn.commit()
-    finally:
-        cursor.close()
+    with pool.write() as conn:
+        cursor = conn.cursor()
+        try:
+            cursor.execute(qry, params)
+            return bump_version(cursor=cursor, assessment_id=answer_data.assessment_id)
+        finally:
+            cursor.close()
 
 
-def update_last_edit(assessment_id: str, current_user: User) -> bool:
+def update_last_edit(assessment_id: str, current_user: User) -> str:
 
     qry = """
     update
         assessments
     set
         last_edit = :last_edit,
+        last_edit_at = :last_edit_at,
         last_editor = :last_editor
     where
         assessment_id = :assessment_id
@@ -542,20 +637,22 @@ def update_last_edit(assessment_id: str, current_user: User) -> bool:
 
     params = {
         "last_edit": formatted_date,
+        "last_edit_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
         "last_editor": current_user.user_id,
         "assessment_id": assessment_id,
     }
 
-    cursor = conn.cursor()
-    try:
-        cursor.execute(qry, params)
-        conn.commit()
-        return True
-    finally:
-        cursor.close()
+    with pool.write() as conn:
+        cursor = conn.cursor()
+        try:
+            cursor.execute(qry, params)
+            return formatted_date
+        finally:
+            cursor.close()
 
 
-def chown(assessment_chown: AssessmentChown) -> bool:
+def chown(assessment_chown: AssessmentChown) -> int | None:
+    """Changes the owner, returns the new version of the assessment"""
 
     qry = """
     update
@@ -571,16 +668,18 @@ def chown(assessment_chown: AssessmentChown) -> bool:
         "assessment_id": assessment_chown.assessment_id,
     }
 
-    cursor = conn.cursor()
-    try:
-        cursor.execute(qry, params)
-        conn.commit()
-        return True
-    finally:
-        cursor.close()
+    with pool.write() as conn:
+        cursor = conn.cursor()
+        try:
+            cursor.execute(qry, params)
+            return bump_version(cursor=cursor, assessment_id=assessment_chown.assessment_id)
+        finally:
+            cursor.close()
 
 
-def rename(assessment: Assessment) -> bool:
+def rename(assessment: Assessment) -> int | None:
+    """Renames the assessment, returns its new version or None when there is
+    no such assessment"""
 
     qry = """
         update
@@ -594,14 +693,14 @@ def rename(assessment: Assessment) -> bool:
 
     params = assessment.model_dump()
 
-    cursor = conn.cursor()
-    try:
-        cursor.execute(qry, params)
-        row = cursor.fetchone()
-        conn.commit()
-        if row:
-            return True
-        else:
-            return False
-    finally:
-        cursor.close()
+    with pool.write() as conn:
+        cursor = conn.cursor()
+        try:
+            cursor.execute(qry, params)
+            row = cursor.fetchone()
+            if row:
+                return bump_version(cursor=cursor, assessment_id=assessment.assessment_id)
+            else:
+                return None
+        finally:
+            cursor.close()
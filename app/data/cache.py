@@ -0,0 +1,147 @@
+"""Bounded in-process cache with per-entry expiry.
+
+Used for small, hot lookups in front of the database and the token decoding,
+where serving a value a few seconds stale is fine but every write must be
+visible right away in this process. Writers call invalidate() for the keys
+they change, the TTL bounds how long other processes can see an old value.
+"""
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Callable, Generic, Hashable, TypeVar
+
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+@dataclass
+class TTLCacheStats:
+    name: str
+    hits: int = 0
+    misses: int = 0
+    expirations: int = 0
+    evictions: int = 0
+    invalidations: int = 0
+    entries: int = 0
+    max_entries: int = 0
+    hit_ratio: float = field(init=False, default=0.0)
+
+    def __post_init__(self):
+        lookups = self.hits + self.misses
+        self.hit_ratio = self.hits / lookups if lookups else 0.0
+
+
+class TTLCache(Generic[K, V]):
+    """Least recently used cache of at most <max_entries> values, each kept
+    for <ttl> seconds or until the expiry passed to set(), whichever is
+    sooner. max_entries=0 or ttl=0 disables the cache."""
+
+    def __init__(self, name: str, max_entries: int, ttl: float):
+
+        self.name = name
+        self.max_entries = max_entries
+        self.ttl = ttl
+        # key -> (monotonic expiry, value)
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+        self._expirations = 0
+        self._evictions = 0
+        self._invalidations = 0
+        # Bumped by every invalidation, a load that raced with one is not stored
+        self._generation = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 and self.ttl > 0
+
+    def get(self, key: K) -> V | None:
+
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                self._misses += 1
+                return None
+            expires, value = item
+            if expires <= time.monotonic():
+                del self._entries[key]
+                self._expirations += 1
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def set(self, key: K, value: V, expires_at: float | None = None, generation: int | None = None):
+        """Stores <value> under <key>. <expires_at> is a unix timestamp which
+        shortens the ttl, e.g. the exp claim of a token. With <generation>
+        the value is only stored when no invalidation happened since it was
+        taken by generation()."""
+
+        if not self.enabled:
+            return
+
+        now = time.monotonic()
+        expires = now + self.ttl
+        if expires_at is not None:
+            expires = min(expires, now + expires_at - time.time())
+        if expires <= now:
+            return
+
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            self._entries[key] = (expires, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def generation(self) -> int:
+
+        with self._lock:
+            return self._generation
+
+    def get_or_load(self, key: K, load: Callable[[K], V]) -> V:
+        """Returns the cached value of <key> or calls <load> and caches its
+        result. Exceptions of <load> are not cached."""
+
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        generation = self.generation()
+        value = load(key)
+        self.set(key, value, generation=generation)
+        return value
+
+    def invalidate(self, key: K):
+
+        with self._lock:
+            self._generation += 1
+            if self._entries.pop(key, None) is not None:
+                self._invalidations += 1
+
+    def clear(self):
+
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+    def stats(self) -> TTLCacheStats:
+
+        with self._lock:
+            return TTLCacheStats(
+                name=self.name,
+                hits=self._hits,
+                misses=self._misses,
+                expirations=self._expirations,
+                evictions=self._evictions,
+                invalidations=self._invalidations,
+                entries=len(self._entries),
+                max_entries=self.max_entries,
+            )
@@ -1,42 +1,186 @@
-import os
-from pathlib import Path
+import threading
+import time
+from contextlib import contextmanager
+from queue import Empty, Queue
 from sqlite3 import connect, Connection, Cursor
-from app.config import DB_PATH, DB_DIR
+from typing import Iterator
+from app.config import DB_PATH, DB_DIR, DB_POOL_SIZE, DB_POOL_TIMEOUT
+from app.service.metrics import record_query
 
-# Global variables for the database connection and cursor, along with an initialization flag
-conn: Connection
-curs: Cursor
-db_initialized: bool = False
 
-def get_db(name: str | None = None):
-    global conn, curs, db_initialized
+class InstrumentedCursor(Cursor):
+    """Cursor reporting the time of every statement to the metrics. The time
+    covers the execute call, for selects that is the search up to the first
+    row, reading the rows with fetchall is not included."""
 
-    # Check if the connection is already initialized and if reset is not requested
-    if db_initialized:
-        return conn, curs
+    def execute(self, sql, parameters=(), /):
 
-    # Determine database path - use centralized config
-    if not name:
-        db_path = str(DB_PATH)
-    else:
-        db_path = name
+        start = time.perf_counter()
+        try:
+            return super().execute(sql, parameters)
+        finally:
+            record_query(sql, time.perf_counter() - start)
 
-    # Ensure database directory exists
-    DB_DIR.mkdir(parents=True, exist_ok=True)
+    def executemany(self, sql, seq_of_parameters, /):
 
-    # Establish new connection and cursor
-    conn = connect(db_path, check_same_thread=False)
-    curs = conn.cursor()
+        start = time.perf_counter()
+        try:
+            return super().executemany(sql, seq_of_parameters)
+        finally:
+            record_query(sql, time.perf_counter() - start)
 
-    # Enable foreign key support and mark initialization
-    conn.execute("PRAGMA foreign_keys = ON")
-    conn.execute("PRAGMA journal_mode = WAL")
-    conn.execute("PRAGMA synchronous = normal")
-    db_initialized = True
+    def executescript(self, sql_script, /):
 
-    return conn, curs
+        start = time.perf_counter()
+        try:
+            return super().executescript(sql_script)
+        finally:
+            record_query(sql_script, time.perf_counter() - start)
 
-# Initialize if not already done
-if not db_initialized:
-    conn, curs = get_db()
 
+class InstrumentedConnection(Connection):
+    """Connection handing out InstrumentedCursors, also to its execute
+    shortcuts which otherwise use a plain cursor"""
+
+    def cursor(self, factory=InstrumentedCursor):
+
+        return super().cursor(factory)
+
+    def execute(self, sql, parameters=(), /):
+
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql, seq_of_parameters, /):
+
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+    def executescript(self, sql_script, /):
+
+        return self.cursor().executescript(sql_script)
+
+
+class ConnectionPool:
+    """Pool of SQLite connections shared by the data modules.
+
+    SQLite in WAL mode allows many concurrent readers but only one writer, so
+    the pool keeps a single writer connection guarded by a lock and a bounded
+    set of read-only connections that are checked out per operation.
+
+    Usage:
+        with pool.read() as conn:
+            conn.execute("select ...")
+
+        with pool.write() as conn:
+            conn.execute("update ...")
+
+    The write context commits on clean exit and rolls back on error. Nested
+    write contexts on the same thread share the outer transaction, and reads
+    issued while the thread holds the writer use the writer connection so they
+    see the uncommitted changes."""
+
+    def __init__(self, db_path: str, size: int = 5, timeout: float = 30.0):
+        self.db_path = db_path
+        self.size = size
+        self.timeout = timeout
+
+        self._readers: Queue[Connection] = Queue(maxsize=size)
+        self._readers_created: int = 0
+        self._readers_lock = threading.Lock()
+
+        self._writer: Connection | None = None
+        self._writer_lock = threading.RLock()
+        self._local = threading.local()
+
+    def _connect(self, read_only: bool = False) -> Connection:
+
+        # Ensure database directory exists
+        DB_DIR.mkdir(parents=True, exist_ok=True)
+
+        conn = connect(
+            self.db_path,
+            timeout=self.timeout,
+            check_same_thread=False,
+            factory=InstrumentedConnection,
+        )
+        conn.execute("PRAGMA foreign_keys = ON")
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA synchronous = normal")
+        if read_only:
+            conn.execute("PRAGMA query_only = ON")
+
+        return conn
+
+    def _checkout_reader(self) -> Connection:
+
+        try:
+            return self._readers.get_nowait()
+        except Empty:
+            pass
+
+        with self._readers_lock:
+            if self._readers_created < self.size:
+                self._readers_created += 1
+                try:
+                    return self._connect(read_only=True)
+                except Exception:
+                    self._readers_created -= 1
+                    raise
+
+        try:
+            return self._readers.get(timeout=self.timeout)
+        except Empty:
+            raise TimeoutError("Timed out waiting for a free database connection.")
+
+    @contextmanager
+    def read(self) -> Iterator[Connection]:
+
+        # Reads inside a write on the same thread must see its changes
+        if getattr(self._local, "write_depth", 0):
+            yield self._writer
+            return
+
+        conn = self._checkout_reader()
+        try:
+            yield conn
+        finally:
+            if conn.in_transaction:
+                conn.rollback()
+            self._readers.put(conn)
+
+    @contextmanager
+    def write(self) -> Iterator[Connection]:
+
+        with self._writer_lock:
+            if self._writer is None:
+                self._writer = self._connect()
+
+            depth = getattr(self._local, "write_depth", 0)
+            self._local.write_depth = depth + 1
+            try:
+                yield self._writer
+                if depth == 0:
+                    self._writer.commit()
+            except BaseException:
+                if depth == 0:
+                    self._writer.rollback()
+                raise
+            finally:
+                self._local.write_depth = depth
+
+    def close(self):
+
+        with self._writer_lock:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+
+        with self._readers_lock:
+            while True:
+                try:
+                    self._readers.get_nowait().close()
+                except Empty:
+                    break
+            self._readers_created = 0
+
+
+pool = ConnectionPool(db_path=str(DB_PATH), size=DB_POOL_SIZE, timeout=DB_POOL_TIMEOUT)
@@ -0,0 +1,155 @@
+"""Versioned schema migrations.
+
+Migrations are the numbered sql files in app/data/migrations, named
+NNNN_description.sql and applied in order. The number of the last applied
+migration is stored in the sqlite header through PRAGMA user_version, so
+checking whether the schema is current costs a single pragma read.
+
+Command line usage (from the repository root):
+
+    python -m app.data.migrate              # apply all pending migrations
+    python -m app.data.migrate status       # show applied and pending ones
+    python -m app.data.migrate upgrade --to 2
+"""
+
+import argparse
+import re
+import sqlite3
+from dataclasses import dataclass
+from functools import cache
+from pathlib import Path
+
+from app.data.init import pool
+
+
+MIGRATIONS_DIR = Path(__file__).resolve().parent / "migrations"
+MIGRATION_FILENAME = re.compile(r"^(\d{4})_(\w+)\.sql$")
+
+
+@dataclass(frozen=True)
+class Migration:
+    version: int
+    name: str
+    path: Path
+
+    def statements(self) -> list[str]:
+        """Splits the migration file into individual statements. Those are
+        executed one by one so the whole migration shares one transaction."""
+
+        statements: list[str] = []
+        buffer = ""
+        for line in self.path.read_text().splitlines(keepends=True):
+            if not buffer and (not line.strip() or line.lstrip().startswith("--")):
+                continue
+            buffer += line
+            if sqlite3.complete_statement(buffer):
+                statements.append(buffer.strip())
+                buffer = ""
+
+        if buffer.strip():
+            raise ValueError(f"Incomplete statement at the end of {self.path.name}")
+
+        return statements
+
+
+@cache
+def get_migrations() -> tuple[Migration, ...]:
+
+    migrations: list[Migration] = []
+    for path in MIGRATIONS_DIR.iterdir():
+        if match := MIGRATION_FILENAME.match(path.name):
+            migrations.append(
+                Migration(version=int(match[1]), name=match[2], path=path)
+            )
+
+    migrations.sort(key=lambda migration: migration.version)
+
+    for expected, migration in enumerate(migrations, start=1):
+        if migration.version != expected:
+            raise ValueError(
+                f"Migrations must be numbered without gaps, expected {expected:04} got {migration.path.name}"
+            )
+
+    return tuple(migrations)
+
+
+def latest_version() -> int:
+
+    migrations = get_migrations()
+    return migrations[-1].version if migrations else 0
+
+
+def get_schema_version() -> int:
+
+    with pool.read() as conn:
+        return conn.execute("pragma user_version").fetchone()[0]
+
+
+def apply_migration(migration: Migration) -> bool:
+    """Applies single migration in its own transaction. Returns False when
+    another process already applied it in the meantime."""
+
+    with pool.write() as conn:
+        # Immediate transaction takes the write lock up front, so two workers
+        # starting at once can't both apply the same migration
+        conn.execute("begin immediate")
+
+        if conn.execute("pragma user_version").fetchone()[0] >= migration.version:
+            return False
+
+        for statement in migration.statements():
+            conn.execute(statement)
+        conn.execute(f"pragma user_version = {migration.version}")
+
+    return True
+
+
+def migrate(target: int | None = None) -> int:
+    """Applies pending migrations up to <target> (latest when not set) and
+    returns the version the database ended up on. When the schema is already
+    current this only reads the version and returns."""
+
+    if target is None:
+        target = latest_version()
+
+    version = get_schema_version()
+    if version >= target:
+        return version
+
+    for migration in get_migrations():
+        if version < migration.version <= target:
+            print(f"Applying migration {migration.path.name}")
+            apply_migration(migration)
+            version = migration.version
+
+    return version
+
+
+# -------------------------------
+#   Command line
+# -------------------------------
+
+
+def main(argv: list[str] | None = None):
+
+    parser = argparse.ArgumentParser(
+        prog="python -m app.data.migrate", description="Manage database schema migrations."
+    )
+    parser.add_argument("command", nargs="?", default="upgrade", choices=["upgrade", "status"])
+    parser.add_argument("--to", type=int, default=None, help="Target schema version.")
+    args = parser.parse_args(argv)
+
+    if args.command == "status":
+        version = get_schema_version()
+        print(f"Schema version: {version} (latest: {latest_version()})")
+        for migration in get_migrations():
+            state = "applied" if migration.version <= version else "pending"
+            print(f"  {migration.path.name:<40} {state}")
+        return
+
+    version = migrate(target=args.to)
+    print(f"Schema is at version {version}.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+-- Baseline schema, as created by the data modules before migrations existed.
+-- Every statement is idempotent so unversioned databases pass through safely.
+
+create table if not exists users(
+    user_id text PRIMARY KEY,
+    username text unique,
+    email text unique,
+    hash text,
+    role text,
+    password_reset_token text,
+    reset_token_expires int
+);
+
+create table if not exists questions_categories(
+    category_id integer primary key,
+    category_name text,
+    category_order integer
+);
+
+create table if not exists questions(
+    question_id integer PRIMARY KEY,
+    category_id integer references questions_categories,
+    question text,
+    question_description text,
+    question_order integer,
+    option_yes text,
+    option_mid text,
+    option_no text
+);
+
+create table if not exists assessments(
+    assessment_id text primary key,
+    assessment_name text,
+    owner_id text references users( user_id ),
+    last_edit text,
+    last_editor text
+);
+
+create table if not exists assessments_questions(
+    question_id integer PRIMARY KEY,
+    assessment_id text references assessments( assessment_id ),
+    category_id references assessments_questions_categories( category_id ),
+    question text,
+    question_description text,
+    question_order integer,
+    option_yes text,
+    option_mid text,
+    option_no text
+);
+
+create table if not exists assessments_questions_categories(
+    category_id integer primary key,
+    assessment_id text references assessments( assessment_id ),
+    category_name text,
+    category_order integer
+);
+
+create table if not exists assessments_answers(
+    answer_id text primary key,
+    assessment_id text references assessments( assessment_id ),
+    question_id integer references assessments_questions( question_id ),
+    answer_option text,
+    answer_description text
+);
+
+create table if not exists assessments_notes(
+    note_id integer primary key,
+    assessment_id text references assessments( assessment_id ),
+    category_order int,
+    note_content text
+);
+
+create table if not exists reports(
+    report_id text primary key,
+    assessment_id text references assessments( assessment_id ),
+    public integer default 0,
+    key text,
+    report_name text,
+    wheel_filename text,
+    summary text,
+    recommendation_title_1 text,
+    recommendation_content_1 text,
+    recommendation_title_2 text,
+    recommendation_content_2 text,
+    recommendation_title_3 text,
+    recommendation_content_3 text
+);
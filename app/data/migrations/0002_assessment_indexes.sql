@@ -0,0 +1,38 @@
+-- assessments_answers.answer_id becomes the primary key. Databases created
+-- before this migration declared it as "pirmary key" so sqlite never created
+-- one, and sqlite can't alter a primary key in place so the table is rebuilt.
+
+create table assessments_answers_v2(
+    answer_id text primary key,
+    assessment_id text references assessments( assessment_id ),
+    question_id integer references assessments_questions( question_id ),
+    answer_option text,
+    answer_description text
+);
+
+insert into assessments_answers_v2(
+    answer_id, assessment_id, question_id, answer_option, answer_description
+)
+select
+    answer_id, assessment_id, question_id, answer_option, answer_description
+from
+    assessments_answers;
+
+drop table assessments_answers;
+alter table assessments_answers_v2 rename to assessments_answers;
+
+-- Indexes on assessment_id for every table hanging off assessments, so the
+-- per-assessment lookups stop scanning every assessment ever created.
+
+create index if not exists idx_assessments_owner_id
+    on assessments( owner_id );
+create index if not exists idx_assessments_questions_assessment_id
+    on assessments_questions( assessment_id );
+create index if not exists idx_assessments_questions_categories_assessment_id
+    on assessments_questions_categories( assessment_id, category_order );
+create index if not exists idx_assessments_answers_assessment_id
+    on assessments_answers( assessment_id, question_id );
+create index if not exists idx_assessments_notes_assessment_id
+    on assessments_notes( assessment_id, category_order );
+create index if not exists idx_reports_assessment_id
+    on reports( assessment_id, public );
@@ -0,0 +1,5 @@
+-- Dashboard report list is paged by (report name, report_id). The index is
+-- on the same coalesce expression the query sorts by, so sqlite reads pages
+-- straight from the index instead of sorting the whole table.
+
+create index if not exists idx_reports_report_name on reports(coalesce(report_name, ''), report_id);
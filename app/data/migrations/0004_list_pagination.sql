@@ -0,0 +1,16 @@
+-- Sort orders of the paginated dashboard lists. Every index is on the same
+-- coalesce expression the list query sorts by plus the id used as the keyset
+-- tie breaker, so sqlite reads a page straight from the index.
+--
+-- assessments.last_edit is a formatted display string which can't be sorted
+-- or filtered by date, last_edit_at keeps the same moment as UTC ISO 8601.
+-- Assessments edited before this migration keep it empty until next edit.
+
+alter table assessments add column last_edit_at text;
+
+create index if not exists idx_assessments_assessment_name on assessments(coalesce(assessment_name, ''), assessment_id);
+create index if not exists idx_assessments_last_edit_at on assessments(coalesce(last_edit_at, ''), assessment_id);
+
+create index if not exists idx_users_username on users(coalesce(username, ''), user_id);
+create index if not exists idx_users_email on users(coalesce(email, ''), user_id);
+create index if not exists idx_users_role on users(coalesce(role, ''), user_id);
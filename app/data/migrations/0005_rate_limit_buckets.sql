@@ -0,0 +1,12 @@
+-- Token buckets of the login and password reset rate limiter, used when
+-- RATE_LIMIT_BACKEND=sqlite so that all app workers share the same limits.
+-- updated_at is a unix timestamp, rows untouched for a whole refill period
+-- describe a full bucket and are deleted.
+
+create table if not exists rate_limit_buckets (
+    bucket_key text primary key,
+    tokens real not null,
+    updated_at real not null
+) without rowid;
+
+create index if not exists idx_rate_limit_buckets_updated_at on rate_limit_buckets(updated_at);
@@ -0,0 +1,19 @@
+-- Outbox of e-mails, the web handlers only insert here and a background
+-- worker sends them. next_attempt_at (unix timestamp) is when a pending
+-- e-mail is due, for e-mails claimed by a worker it is the end of the claim,
+-- so e-mails of a worker that died are picked up again once it passes.
+
+create table if not exists email_outbox (
+    email_id integer primary key autoincrement,
+    recipient text not null,
+    subject text not null,
+    html text not null,
+    status text not null default 'pending' check (status in ('pending', 'sending', 'sent', 'failed')),
+    attempts integer not null default 0,
+    next_attempt_at real not null,
+    last_error text,
+    created_at real not null,
+    sent_at real
+);
+
+create index if not exists idx_email_outbox_due on email_outbox(next_attempt_at) where status in ('pending', 'sending');
@@ -0,0 +1,5 @@
+-- Plain text alternative of the e-mail, sent together with the html one as
+-- multipart/alternative. E-mails queued before this migration have none and
+-- are sent as html only.
+
+alter table email_outbox add column text text;
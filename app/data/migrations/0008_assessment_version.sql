@@ -0,0 +1,10 @@
+-- Version of the assessment content, bumped in the same transaction as every
+-- change of its answers, notes, name or owner. Caches and ETags compare it
+-- instead of the answers themselves. updated_at is the UTC ISO 8601 moment of
+-- the last bump, unlike last_edit_at it also moves on notes, renames and
+-- owner changes.
+
+alter table assessments add column version integer not null default 0;
+alter table assessments add column updated_at text;
+
+update assessments set updated_at = last_edit_at;
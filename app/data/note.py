@@ -1,26 +1,12 @@
 import json
 
-from app.data.init import conn
+from app.data.assessment import bump_version
+from app.data.init import pool
 from app.exception.database import RecordNotFound
 from app.model.assesment import AssessmentNote, AssessmentNoteExtended
 
 
 
-# -------------------------------
-#   Table creation
-# -------------------------------
-
-
-conn.execute("""
-             create table if not exists assessments_notes(
-                 note_id integer primary key,
-                 assessment_id text references assessments( assessment_id ),
-                 category_order int,
-                 note_content text
-                 )
-             """)
-
-
 # -------------------------------
 #   Central Functions
 # -------------------------------
@@ -80,14 +66,14 @@ def create_notes(assessment_id: str, category_order: int) -> bool:
         values(:assessment_id, :category_order)
     """
 
-    cursor = conn.cursor()
+    with pool.write() as conn:
+        cursor = conn.cursor()
 
-    try:
-        cursor.execute(qry, {"assessment_id": assessment_id, "category_order": category_order})
-        conn.commit()
-        return True
-    finally:
-        cursor.close()
+        try:
+            cursor.execute(qry, {"assessment_id": assessment_id, "category_order": category_order})
+            return True
+        finally:
+            cursor.close()
 
 
 def get_assessment_notes(assessment_id: str) -> list[AssessmentNoteExtended]:
@@ -111,17 +97,18 @@ def get_assessment_notes(assessment_id: str) -> list[AssessmentNoteExtended]:
             "assessment_id": assessment_id,
             }
 
-    cursor = conn.cursor()
+    with pool.read() as conn:
+        cursor = conn.cursor()
 
-    try:
-        cursor.execute(qry, params)
-        rows = cursor.fetchall()
-        if rows:
-            return [row_to_extended_note_model(row) for row in rows]
-        else:
-            raise RecordNotFound(msg="No note found.")
-    finally:
-        cursor.close()
+        try:
+            cursor.execute(qry, params)
+            rows = cursor.fetchall()
+            if rows:
+                return [row_to_extended_note_model(row) for row in rows]
+            else:
+                raise RecordNotFound(msg="No note found.")
+        finally:
+            cursor.close()
 
 
 def get_note(assessment_id: str, category_order: int) -> AssessmentNote:
@@ -144,17 +131,18 @@ def get_note(assessment_id: str, category_order: int) -> AssessmentNote:
             "category_order": category_order
             }
 
-    cursor = conn.cursor()
+    with pool.read() as conn:
+        cursor = conn.cursor()
 
-    try:
-        cursor.execute(qry, params)
-        row = cursor.fetchone()
-        if row:
-            return row_to_note_model(row)
-        else:
-            raise RecordNotFound(msg="No note found.")
-    finally:
-        cursor.close()
+        try:
+            cursor.execute(qry, params)
+            row = cursor.fetchone()
+            if row:
+                return row_to_note_model(row)
+            else:
+                raise RecordNotFound(msg="No note found.")
+        finally:
+            cursor.close()
 
 
 def get_note_by_id(note_id: int) -> AssessmentNote:
@@ -175,17 +163,18 @@ def get_note_by_id(note_id: int) -> AssessmentNote:
             "note_id": note_id
             }
 
-    cursor = conn.cursor()
+    with pool.read() as conn:
+        cursor = conn.cursor()
 
-    try:
-        cursor.execute(qry, params)
-        row = cursor.fetchone()
-        if row:
-            return row_to_note_model(row)
-        else:
-            raise RecordNotFound(msg="No note found.")
-    finally:
-        cursor.close()
+        try:
+            cursor.execute(qry, params)
+            row = cursor.fetchone()
+            if row:
+                return row_to_note_model(row)
+            else:
+                raise RecordNotFound(msg="No note found.")
+        finally:
+            cursor.close()
 
 
 def update_note(note_id: int, note_content: dict) -> AssessmentNote:
@@ -208,11 +197,13 @@ def update_note(note_id: int, note_content: dict) -> AssessmentNote:
             "note_content":note_to_save
             }
 
-    cursor = conn.cursor()
-    try:
-        cursor.execute(qry, params)
-        conn.commit()
-        return get_note_by_id(note_id=note_id)
-    finally:
-        cursor.close()
+    with pool.write() as conn:
+        cursor = conn.cursor()
+        try:
+            cursor.execute(qry, params)
+            note = get_note_by_id(note_id=note_id)
+            bump_version(cursor=cursor, assessment_id=note.assessment_id)
+            return note
+        finally:
+            cursor.close()
 
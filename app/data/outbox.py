@@ -0,0 +1,178 @@
+from app.data.init import pool
+from app.model.outbox import OutboxEmail, OutboxEmailCreate
+
+
+# -------------------------------
+#   Central Functions
+# -------------------------------
+
+
+def row_to_model(row: tuple) -> OutboxEmail:
+
+    email_id, recipient, subject, html, text, attempts = row
+
+    return OutboxEmail(
+        email_id=email_id,
+        recipient=recipient,
+        subject=subject,
+        html=html,
+        text=text,
+        attempts=attempts
+    )
+
+
+# -------------------------------
+#   Outbox
+# -------------------------------
+
+
+def enqueue(emails: list[OutboxEmailCreate], now: float) -> list[int]:
+    """Inserts <emails> in one transaction, due right away"""
+
+    qry = """
+    insert into email_outbox(recipient, subject, html, text, next_attempt_at, created_at)
+    values(:recipient, :subject, :html, :text, :now, :now)
+    returning email_id
+    """
+
+    with pool.write() as conn:
+        cursor = conn.cursor()
+        try:
+            ids: list[int] = []
+            for email in emails:
+                cursor.execute(qry, {**email.model_dump(), "now": now})
+                ids.append(cursor.fetchone()[0])
+            return ids
+        finally:
+            cursor.close()
+
+
+def claim_due(now: float, claim_until: float, limit: int) -> list[OutboxEmail]:
+    """Claims up to <limit> e-mails due at <now> for sending until
+    <claim_until>, other workers skip them until then."""
+
+    qry = """
+    update
+        email_outbox
+    set
+        status = 'sending',
+        next_attempt_at = :claim_until
+    where
+        email_id in (
+            select
+                email_id
+            from
+                email_outbox
+            where
+                status in ('pending', 'sending') and
+                next_attempt_at <= :now
+            order by
+                next_attempt_at
+            limit
+                :limit
+        )
+    returning
+        email_id,
+        recipient,
+        subject,
+        html,
+        text,
+        attempts
+    """
+
+    params = {"now": now, "claim_until": claim_until, "limit": limit}
+
+    with pool.write() as conn:
+        cursor = conn.cursor()
+        try:
+            cursor.execute(qry, params)
+            rows = cursor.fetchall()
+            return sorted((row_to_model(row) for row in rows), key=lambda e: e.email_id)
+        finally:
+            cursor.close()
+
+
+def mark_sent(email_ids: list[int], now: float):
+
+    qry = """
+    update
+        email_outbox
+    set
+        status = 'sent',
+        attempts = attempts + 1,
+        sent_at = :now,
+        last_error = NULL
+    where
+        email_id = :email_id
+    """
+
+    with pool.write() as conn:
+        conn.executemany(qry, [{"email_id": email_id, "now": now} for email_id in email_ids])
+
+
+def mark_retry(email_id: int, next_attempt_at: float, error: str):
+
+    qry = """
+    update
+        email_outbox
+    set
+        status = 'pending',
+        attempts = attempts + 1,
+        next_attempt_at = :next_attempt_at,
+        last_error = :error
+    where
+        email_id = :email_id
+    """
+
+    params = {"email_id": email_id, "next_attempt_at": next_attempt_at, "error": error}
+
+    with pool.write() as conn:
+        conn.execute(qry, params)
+
+
+def mark_failed(email_id: int, error: str):
+
+    qry = """
+    update
+        email_outbox
+    set
+        status = 'failed',
+        attempts = attempts + 1,
+        last_error = :error
+    where
+        email_id = :email_id
+    """
+
+    with pool.write() as conn:
+        conn.execute(qry, {"email_id": email_id, "error": error})
+
+
+def release(email_ids: list[int], now: float):
+    """Makes claimed e-mails due again without counting an attempt"""
+
+    qry = """
+    update
+        email_outbox
+    set
+        status = 'pending',
+        next_attempt_at = :now
+    where
+        email_id = :email_id and
+        status = 'sending'
+    """
+
+    with pool.write() as conn:
+        conn.executemany(qry, [{"email_id": email_id, "now": now} for email_id in email_ids])
+
+
+def delete_sent_before(sent_before: float) -> int:
+
+    qry = "delete from email_outbox where status = 'sent' and sent_at < :sent_before"
+
+    with pool.write() as conn:
+        cursor = conn.cursor()
+        try:
+            cursor.execute(qry, {"sent_before": sent_before})
+            return cursor.rowcount
+        finally:
+            cursor.close()
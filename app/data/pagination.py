@@ -0,0 +1,111 @@
+"""Keyset pagination helpers.
+
+Pages are fetched with "where (sort_column, id_column) > (last values)"
+instead of OFFSET, so every page costs the same index range scan no matter
+how deep the user scrolled. The last values of a page are handed to the
+client as an opaque cursor.
+
+A page is fetched into memory before it is rendered, at most limit + 1 rows,
+so a streamed response never holds a read connection of the pool while the
+client downloads it.
+"""
+
+import base64
+import json
+import math
+from typing import Callable, TypeVar
+
+from app.exception.database import InvalidCursor
+from app.model.pagination import Page
+
+
+T = TypeVar("T")
+
+SQLITE_MIN_INT = -(2**63)
+SQLITE_MAX_INT = 2**63 - 1
+
+
+def encode_cursor(sort_value, last_id) -> str:
+
+    payload = json.dumps([sort_value, last_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple:
+    """Returns sort value and id of the last row of the previous page, raises
+    InvalidCursor for a cursor not written by encode_cursor, e.g. an edited
+    url"""
+
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (ValueError, TypeError) as e:
+        raise InvalidCursor(msg="Invalid page cursor. Reload the page and try again.") from e
+
+    if not (
+        isinstance(values, list)
+        and len(values) == 2
+        and is_sql_value(values[0])
+        and isinstance(values[1], str)
+        and is_sql_value(values[1])
+    ):
+        raise InvalidCursor(msg="Invalid page cursor. Reload the page and try again.")
+
+    sort_value, last_id = values
+    return sort_value, last_id
+
+
+def is_sql_value(value) -> bool:
+    """Whether sqlite can bind <value>: a string encodable as utf-8, an int
+    within its signed 64 bit range or a finite float"""
+
+    if isinstance(value, bool):
+        return False
+    if isinstance(value, int):
+        return SQLITE_MIN_INT <= value <= SQLITE_MAX_INT
+    if isinstance(value, float):
+        return math.isfinite(value)
+    if isinstance(value, str):
+        try:
+            value.encode()
+        except UnicodeEncodeError:
+            return False
+        return True
+    return False
+
+
+def keyset(
+    sort_column: str, id_column: str, descending: bool, cursor: str | None
+) -> tuple[str, str, dict]:
+    """Returns where condition, order by clause and its params for the page
+    following <cursor>. Sort column must not evaluate to NULL, row value
+    comparison with NULL would silently skip the rows."""
+
+    direction = "desc" if descending else "asc"
+    order_by = f"{sort_column} {direction}, {id_column} {direction}"
+
+    if cursor is None:
+        return "1 = 1", order_by, {}
+
+    sort_value, last_id = decode_cursor(cursor)
+    operator = "<" if descending else ">"
+    condition = f"({sort_column}, {id_column}) {operator} (:cursor_sort_value, :cursor_last_id)"
+
+    return condition, order_by, {"cursor_sort_value": sort_value, "cursor_last_id": last_id}
+
+
+def to_page(
+    rows: list[tuple],
+    limit: int,
+    row_to_model: Callable[[tuple], T],
+    cursor_values: Callable[[tuple], tuple],
+) -> Page[T]:
+    """Builds page from rows fetched with limit + 1, the extra row only tells
+    whether there is a next page."""
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(*cursor_values(rows[-1]))
+
+    return Page(items=[row_to_model(row) for row in rows], next_cursor=next_cursor)
+
@@ -1,26 +1,7 @@
-from app.data.init import conn, curs
+from app.data.init import pool
 from app.model.question import Question, QuestionCategory, QuestionCategoryRename, QuestionCategoryReorderItem, QuestionEditContent
 from app.exception.database import RecordNotFound
 
-curs.execute("""create table if not exists questions_categories(
-    category_id integer primary key,
-    category_name text,
-    category_order integer
-    )""")
-
-curs.execute("""create table if not exists questions(
-    question_id integer PRIMARY KEY,
-    category_id integer references questions_categories,
-    question text,
-    question_description text,
-    question_order integer,
-    option_yes text,
-    option_mid text,
-    option_no text
-    )""")
-
-
-
 # -------------------------------
 #   CRUDs
 # -------------------------------
@@ -60,16 +41,17 @@ def get_all() -> list[Question]:
     option_yes, option_mid, option_no, category_id, category_name,
     category_order from questions natural join questions_categories"""
 
-    cursor = conn.cursor()
-    try:
-        cursor.execute(qry)
-        rows = cursor.fetchall()
-        if rows:
-            return [row_to_model_question(row) for row in rows]
-        else:
-            raise RecordNotFound(msg="Questions were found.")
-    finally:
-        cursor.close()
+    with pool.read() as conn:
+        cursor = conn.cursor()
+        try:
+            cursor.execute(qry)
+            rows = cursor.fetchall()
+            if rows:
+                return [row_to_model_question(row) for row in rows]
+            else:
+                raise RecordNotFound(msg="Questions were found.")
+        finally:
+            cursor.close()
 
 
 def get_all_categories() -> list[QuestionCategory]:
@@ -77,16 +59,17 @@ def get_all_categories() -> list[QuestionCategory]:
     qry = """select category_id, category_name,
     category_order from questions_categories order by category_order asc"""
 
-    cursor = conn.cursor()
-    try:
-        cursor.execute(qry)
-        rows = cursor.fetchall()
-        if rows:
-            return [row_to_model_question_category(row) for row in rows]
-        else:
-            raise RecordNotFound(msg="No categories were found")
-    finally:
-        cursor.close()
+    with pool.read() as conn:
+        cursor = conn.cursor()
+        try:
+            cursor.execute(qry)
+            rows = cursor.fetchall()
+            if rows:
+                return [row_to_model_question_category(row) for row in rows]
+            else:
+                raise RecordNotFound(msg="No categories were found")
+        finally:
+            cursor.close()
 
 
 def get_all_questions_for_category(category_id: int) -> list[Question]:
@@ -98,16 +81,17 @@ def get_all_questions_for_category(category_id: int) -> list[Question]:
 
     params = {"category_id":category_id}
 
-    cursor = conn.cursor()
-    try:
-        cursor.execute(qry, params)
-        rows = cursor.fetchall()
-        if rows:
-            return [row_to_model_question(row) for row in rows]
-        else:
-            raise RecordNotFound(msg="No questions were found")
-    finally:
-        cursor.close()
+    with pool.read() as conn:
+        cursor = conn.cursor()
+        try:
+            cursor.execute(qry, params)
+            rows = cursor.fetchall()
+            if rows:
+                return [row_to_model_question(row) for row in rows]
+            else:
+                raise RecordNotFound(msg="No questions were found")
+        finally:
+            cursor.close()
 
 def get_questions_category(category_id: int) -> QuestionCategory:
 
@@ -115,16 +99,17 @@ def get_questions_category(category_id: int) -> QuestionCategory:
     category_order from questions_categories where category_id = :category_id"""
 
     params = {"category_id":category_id}
-    cursor = conn.cursor()
-    try:
-        cursor.execute(qry, params)
-        row = cursor.fetchone()
-        if row:
-            return row_to_model_question_category(row)
-        else:
-            raise RecordNotFound(msg="No category with provided id was found")
-    finally:
-        cursor.close()
+    with pool.read() as conn:
+        cursor = conn.cursor()
+        try:
+            cursor.execute(qry, params)
+            row = cursor.fetchone()
+            if row:
+                return row_to_model_question_category(row)
+            else:
+                raise RecordNotFound(msg="No category with provided id was found")
+        finally:
+            cursor.close()
 
 def rename_questions_category(category_rename: QuestionCategoryRename) -> QuestionCategory:
 
@@ -136,12 +121,13 @@ def rename_questions_category(category_rename: QuestionCategoryRename) -> Questi
             "category_name":category_rename.category_name,
             }
 
-    cursor = conn.cursor()
-    try:
-        cursor.execute(qry, params)
-        return get_questions_category(category_id=category_rename.category_id)
-    finally:
-        cursor.close()
+    with pool.write() as conn:
+        cursor = conn.cursor()
+        try:
+            cursor.execute(qry, params)
+            return get_questions_category(category_id=category_rename.category_id)
+        finally:
+            cursor.close()
 
 def reorder_questions_category(category_reorder_item: QuestionCategoryReorderItem) -> bool:
 
@@ -153,12 +139,13 @@ def reorder_questions_category(category_reorder_item: QuestionCategoryReorderIte
             "category_order":category_reorder_item.category_order,
             }
 
-    cursor = conn.cursor()
-    try:
-        cursor.execute(qry, params)
-        return True
-    finally:
-        cursor.close()
+    with pool.write() as conn:
+        cursor = conn.cursor()
+        try:
+            cursor.execute(qry, params)
+            return True
+        finally:
+            cursor.close()
 
 
 def get_one(question_id: int) -> Question:
@@ -170,16 +157,17 @@ def get_one(question_id: int) -> Question:
 
     params = {"question_id":question_id}
 
-    cursor = conn.cursor()
-    try:
-        cursor.execute(qry, params)
-        row = cursor.fetchone()
-        if row:
-            return row_to_model_question(row)
-        else:
-            raise RecordNotFound(msg="Questions were found.")
-    finally:
-        cursor.close()
+    with pool.read() as conn:
+        cursor = conn.cursor()
+        try:
+            cursor.execute(qry, params)
+            row = cursor.fetchone()
+            if row:
+                return row_to_model_question(row)
+            else:
+                raise RecordNotFound(msg="Questions were found.")
+        finally:
+            cursor.close()
 
 def update_question_content(question_edit_content: QuestionEditContent) -> Question:
     
@@ -200,24 +188,25 @@ def update_question_content(question_edit_content: QuestionEditContent) -> Quest
             "question_id":question_edit_content.question_id
             }
 
-    cursor = conn.cursor()
-    try:
-        cursor.execute(qry, params)
-        return get_one(question_id=question_edit_content.question_id)
-    finally:
-        cursor.close()
+    with pool.write() as conn:
+        cursor = conn.cursor()
+        try:
+            cursor.execute(qry, params)
+            return get_one(question_id=question_edit_content.question_id)
+        finally:
+            cursor.close()
 # -------------------------------
 #   Default actions
 # -------------------------------
 
 def delete_categories() -> bool:
-    conn.execute("delete from questions_categories")
-    conn.commit()
+    with pool.write() as conn:
+        conn.execute("delete from questions_categories")
     return True
 
 def delete_questions() -> bool:
-    conn.execute("delete from questions")
-    conn.commit()
+    with pool.write() as conn:
+        conn.execute("delete from questions")
     return True
 
 def load_category(category_name: str, category_order: int) -> int | None:
@@ -229,13 +218,13 @@ def load_category(category_name: str, category_order: int) -> int | None:
 
     params = {"category_name": category_name, "category_order": category_order}
 
-    temp_cursor = conn.cursor()
-    try:
-        temp_cursor.execute(qry, params)
-        conn.commit()
-        return temp_cursor.lastrowid
-    finally:
-        temp_cursor.close()
+    with pool.write() as conn:
+        temp_cursor = conn.cursor()
+        try:
+            temp_cursor.execute(qry, params)
+            return temp_cursor.lastrowid
+        finally:
+            temp_cursor.close()
 
 
     return temp_cursor.lastrowid
@@ -256,10 +245,10 @@ def load_question(question:str, question_description: str, question_order: int,
             "category_id":category_id,
             }
 
-    cursor = conn.cursor()
-    try:
-        cursor.execute(qry, params)
-        conn.commit()
-        return cursor.lastrowid
-    finally:
-        cursor.close()
+    with pool.write() as conn:
+        cursor = conn.cursor()
+        try:
+            cursor.execute(qry, params)
+            return cursor.lastrowid
+        finally:
+            cursor.close()
@@ -0,0 +1,91 @@
+from typing import Callable
+from app.data.init import pool
+
+
+# -------------------------------
+#   Token buckets
+# -------------------------------
+
+
+def update_bucket(
+        bucket_key: str,
+        update: Callable[[tuple[float, float] | None], tuple[float, float]]
+        ) -> tuple[float, float]:
+    """Reads (tokens, updated_at) of the bucket, or None when there is no
+    row, and stores what <update> returns for it. Both happen in one
+    immediate transaction, holding the database write lock from the read on,
+    so workers of other processes can't take the same token."""
+
+    select_qry = """
+    select
+        tokens,
+        updated_at
+    from
+        rate_limit_buckets
+    where
+        bucket_key = :bucket_key
+    """
+
+    upsert_qry = """
+    insert into rate_limit_buckets(bucket_key, tokens, updated_at)
+    values(:bucket_key, :tokens, :updated_at)
+    on conflict(bucket_key) do update set
+        tokens = excluded.tokens,
+        updated_at = excluded.updated_at
+    """
+
+    with pool.write() as conn:
+        # sqlite3 only begins a transaction at the upsert, the select would
+        # read the bucket without the write lock
+        if not conn.in_transaction:
+            conn.execute("begin immediate")
+
+        cursor = conn.cursor()
+        try:
+            cursor.execute(select_qry, {"bucket_key": bucket_key})
+            row = cursor.fetchone()
+            tokens, updated_at = update(tuple(row) if row else None)
+            cursor.execute(upsert_qry, {
+                "bucket_key": bucket_key,
+                "tokens": tokens,
+                "updated_at": updated_at
+                })
+            return tokens, updated_at
+        finally:
+            cursor.close()
+
+
+def get_bucket(bucket_key: str) -> tuple[float, float] | None:
+
+    qry = """
+    select
+        tokens,
+        updated_at
+    from
+        rate_limit_buckets
+    where
+        bucket_key = :bucket_key
+    """
+
+    with pool.read() as conn:
+        cursor = conn.cursor()
+        try:
+            cursor.execute(qry, {"bucket_key": bucket_key})
+            row = cursor.fetchone()
+            return tuple(row) if row else None
+        finally:
+            cursor.close()
+
+
+def delete_buckets_before(updated_before: float) -> int:
+    """Deletes buckets untouched since <updated_before>, returns their count"""
+
+    qry = "delete from rate_limit_buckets where updated_at < :updated_before"
+
+    with pool.write() as conn:
+        cursor = conn.cursor()
+        try:
+            cursor.execute(qry, {"updated_before": updated_before})
+            return cursor.rowcount
+        finally:
+            cursor.close()
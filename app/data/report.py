@@ -1,30 +1,18 @@
-from app.data.init import conn, curs
+from app.data.init import pool
+from app.data.pagination import keyset, to_page
 from app.exception.database import RecordNotFound
-from app.model.report import Report, ReportUpdate
+from app.model.pagination import Page, ReportListQuery
+from app.model.report import Report, ReportExtended, ReportUpdate
 
 
-# -------------------------------
-#   Table1 creation
-# -------------------------------
-
-
-curs.execute("""
-             create table if not exists reports(
-                 report_id text primary key,
-                 assessment_id text references assessments( assessment_id ),
-                 public integer default 0,
-                 key text,
-                 report_name text,
-                 wheel_filename text,
-                 summary text,
-                 recommendation_title_1 text,
-                 recommendation_content_1 text,
-                 recommendation_title_2 text,
-                 recommendation_content_2 text,
-                 recommendation_title_3 text,
-                 recommendation_content_3 text
-                 )
-             """)
+# Sort keys accepted by get_all_extended and the expressions they sort by,
+# coalesce keeps NULLs out of the keyset comparison and matches the
+# expression index on report names
+REPORT_SORTS = {
+    "name": "coalesce(r.report_name, '')",
+    "assessment": "coalesce(a.assessment_name, '')",
+    "owner": "coalesce(u.username, '')",
+}
 
 
 # -------------------------------
@@ -64,6 +52,43 @@ def report_row_to_model(row: tuple) -> Report:
              )
 
 
+def report_extended_row_to_model(row: tuple) -> ReportExtended:
+
+     report_id, \
+     assessment_id, \
+     public, \
+     key, \
+     report_name, \
+     wheel_filename, \
+     summary, \
+     recommendation_title_1, \
+     recommendation_content_1, \
+     recommendation_title_2, \
+     recommendation_content_2, \
+     recommendation_title_3, \
+     recommendation_content_3, \
+     assessment_name, \
+     assessment_owner = row[:15]
+
+     return ReportExtended(
+             report_id=report_id,
+             report_name=report_name,
+             assessment_id=assessment_id,
+             assessment_name=assessment_name,
+             assessment_owner=assessment_owner,
+             public=public,
+             key=key,
+             wheel_filename=wheel_filename,
+             summary=summary,
+             recommendation_title_1=recommendation_title_1,
+             recommendation_content_1=recommendation_content_1,
+             recommendation_title_2=recommendation_title_2,
+             recommendation_content_2=recommendation_content_2,
+             recommendation_title_3=recommendation_title_3,
+             recommendation_content_3=recommendation_content_3
+             )
+
+
 # -------------------------------
 #   CRUDS
 # -------------------------------
@@ -101,13 +126,13 @@ def create_report(report: Report) -> Report:
             )
     """
 
-    cursor = conn.cursor()
-    try:
-        cursor.execute(qry, report.model_dump())
-        conn.commit()
-        return report
-    finally:
-        cursor.close()
+    with pool.write() as conn:
+        cursor = conn.cursor()
+        try:
+            cursor.execute(qry, report.model_dump())
+            return report
+        finally:
+            cursor.close()
 
 def get_report(report_id: str) -> Report:
 
@@ -132,13 +157,14 @@ def get_report(report_id: str) -> Report:
         report_id = :report_id
     """
 
-    cursor = conn.cursor()
-    try:
-        cursor.execute(qry, {"report_id":report_id})
-        row = cursor.fetchone()
-        return report_row_to_model(row)
-    finally:
-        cursor.close()
+    with pool.read() as conn:
+        cursor = conn.cursor()
+        try:
+            cursor.execute(qry, {"report_id":report_id})
+            row = cursor.fetchone()
+            return report_row_to_model(row)
+        finally:
+            cursor.close()
 
 
 def get_all_reports() -> list[Report]:
@@ -161,16 +187,115 @@ def get_all_reports() -> list[Report]:
     from
         reports
     """
-    cursor = conn.cursor()
-    try:
-        cursor.execute(qry)
-        rows = cursor.fetchall()
-        if rows:
-            return [report_row_to_model(row) for row in rows]
-        else:
-            return []
-    finally:
-        cursor.close() 
+    with pool.read() as conn:
+        cursor = conn.cursor()
+        try:
+            cursor.execute(qry)
+            rows = cursor.fetchall()
+            if rows:
+                return [report_row_to_model(row) for row in rows]
+            else:
+                return []
+        finally:
+            cursor.close() 
+
+
+EXTENDED_COLUMNS = """
+        r.report_id,
+        r.assessment_id,
+        r.public,
+        r.key,
+        r.report_name,
+        r.wheel_filename,
+        r.summary,
+        r.recommendation_title_1,
+        r.recommendation_content_1,
+        r.recommendation_title_2,
+        r.recommendation_content_2,
+        r.recommendation_title_3,
+        r.recommendation_content_3,
+        a.assessment_name,
+        u.username as assessment_owner"""
+
+EXTENDED_TABLES = """
+        reports r
+    join
+        assessments a on r.assessment_id = a.assessment_id
+    left join
+        users u on a.owner_id = u.user_id"""
+
+
+def get_report_extended(report_id: str) -> ReportExtended:
+
+    qry = f"""
+    select{EXTENDED_COLUMNS}
+    from{EXTENDED_TABLES}
+    where
+        r.report_id = :report_id
+    """
+
+    with pool.read() as conn:
+        cursor = conn.cursor()
+        try:
+            cursor.execute(qry, {"report_id":report_id})
+            row = cursor.fetchone()
+            if row:
+                return report_extended_row_to_model(row)
+            else:
+                raise RecordNotFound(msg="Requested report wasn't found.")
+        finally:
+            cursor.close()
+
+
+def get_all_extended(query: ReportListQuery, limit: int) -> Page[ReportExtended]:
+    """Returns one page of reports joined with their assessment and owner,
+    matching the filters of <query>."""
+
+    sort_column = REPORT_SORTS[query.sort]
+    page_condition, order_by, params = keyset(
+            sort_column=sort_column,
+            id_column="r.report_id",
+            descending=query.descending,
+            cursor=query.cursor
+            )
+
+    conditions = [page_condition]
+    if query.assessment_filter:
+        conditions.append("r.assessment_id = :assessment_id")
+        params["assessment_id"] = query.assessment_filter
+    if query.name:
+        conditions.append("instr(lower(r.report_name), lower(:name)) > 0")
+        params["name"] = query.name
+    if query.owner:
+        conditions.append("instr(lower(u.username), lower(:owner)) > 0")
+        params["owner"] = query.owner
+
+    qry = f"""
+    select{EXTENDED_COLUMNS},
+        {sort_column} as sort_value
+    from{EXTENDED_TABLES}
+    where
+        {" and ".join(conditions)}
+    order by
+        {order_by}
+    limit
+        :limit
+    """
+    params["limit"] = limit + 1
+
+    with pool.read() as conn:
+        db_cursor = conn.cursor()
+        try:
+            db_cursor.execute(qry, params)
+            rows = db_cursor.fetchall()
+            return to_page(
+                    rows=rows,
+                    limit=limit,
+                    row_to_model=report_extended_row_to_model,
+                    cursor_values=lambda row: (row[-1], row[0])
+                    )
+        finally:
+            db_cursor.close()
 
 
 def get_public_reports_for_assessment(assessment_id: str) -> list[Report]:
@@ -197,16 +322,17 @@ def get_public_reports_for_assessment(assessment_id: str) -> list[Report]:
         public = 1
     """
     
-    cursor = conn.cursor()
-    try:
-        cursor.execute(qry, {"assessment_id":assessment_id})
-        rows = cursor.fetchall()
-        if rows:
-            return [report_row_to_model(row) for row in rows]
-        else:
-            return []
-    finally:
-        cursor.close()
+    with pool.read() as conn:
+        cursor = conn.cursor()
+        try:
+            cursor.execute(qry, {"assessment_id":assessment_id})
+            rows = cursor.fetchall()
+            if rows:
+                return [report_row_to_model(row) for row in rows]
+            else:
+                return []
+        finally:
+            cursor.close()
 
 
 def get_public_report_for_user(report_id: str) -> Report:
@@ -233,16 +359,17 @@ def get_public_report_for_user(report_id: str) -> Report:
         public = 1
     """
     
-    cursor = conn.cursor()
-    try:
-        cursor.execute(qry, {"report_id":report_id})
-        row = cursor.fetchone()
-        if row:
-            return report_row_to_model(row)
-        else:
-            raise RecordNotFound(msg="Requested report wasn't found.")
-    finally:
-        cursor.close()
+    with pool.read() as conn:
+        cursor = conn.cursor()
+        try:
+            cursor.execute(qry, {"report_id":report_id})
+            row = cursor.fetchone()
+            if row:
+                return report_row_to_model(row)
+            else:
+                raise RecordNotFound(msg="Requested report wasn't found.")
+        finally:
+            cursor.close()
 
 
 
@@ -267,13 +394,13 @@ def update_report(report_update: ReportUpdate) -> Report:
         report_id = :report_id
     """
 
-    cursor = conn.cursor()
-    try:
-        cursor.execute(qry, report_update.model_dump())
-        conn.commit()
-        return get_report(report_id=report_update.report_id)
-    finally:
-        cursor.close()
+    with pool.write() as conn:
+        cursor = conn.cursor()
+        try:
+            cursor.execute(qry, report_update.model_dump())
+            return get_report(report_id=report_update.report_id)
+        finally:
+            cursor.close()
 
 
 def delete_report(report_id: str) -> Report:
@@ -287,13 +414,13 @@ def delete_report(report_id: str) -> Report:
         report_id = :report_id
     """
 
-    cursor = conn.cursor()
-    try:
-        cursor.execute(qry, {"report_id":report_id})
-        conn.commit()
-        return report
-    finally:
-        cursor.close()
+    with pool.write() as conn:
+        cursor = conn.cursor()
+        try:
+            cursor.execute(qry, {"report_id":report_id})
+            return report
+        finally:
+            cursor.close()
 
 
 def publish_report(report_id: str, public: bool) -> Report:
@@ -311,10 +438,10 @@ def publish_report(report_id: str, public: bool) -> Report:
             "public":public
             }
 
-    cursor = conn.cursor()
-    try:
-        cursor.execute(qry, params)
-        conn.commit()
-        return get_report(report_id=report_id)
-    finally:
-        cursor.close()
+    with pool.write() as conn:
+        cursor = conn.cursor()
+        try:
+            cursor.execute(qry, params)
+            return get_report(report_id=report_id)
+        finally:
+            cursor.close()
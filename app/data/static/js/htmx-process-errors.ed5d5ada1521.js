@@ -0,0 +1,12 @@
+document.addEventListener("DOMContentLoaded", ()=>{
+    document.body.addEventListener('htmx:beforeOnLoad', function (evt) {
+        if (
+            evt.detail.xhr.status === 422 ||
+            evt.detail.xhr.status === 401 ||
+            evt.detail.xhr.status === 429
+        ) {
+            evt.detail.shouldSwap = true;
+            evt.detail.isError = false;
+        }
+    });
+})
@@ -0,0 +1,123 @@
+class JwtManager {
+    constructor() {
+        this.expiryKey = "jwt_expiry_time";
+        this.expiryHeader = "X-Session-Expires";
+        this.renewBeforeSec = 60; // renew 1 minute before the session expires
+        this.jitterSec = 30; // spreads renewals of tabs opened at the same time
+        this.timerId = null;
+    }
+
+    init() {
+        // Server sends the session expiry with every authenticated response
+        // and renews the cookie itself when the session is about to expire
+        document.body.addEventListener("htmx:afterRequest", (event) => {
+            const xhr = event.detail.xhr;
+            if (xhr) {
+                this.updateExpiry(xhr.getResponseHeader(this.expiryHeader));
+            }
+        });
+
+        // Cookie is shared by all tabs, follow renewals done by the others
+        window.addEventListener("storage", (event) => {
+            if (event.key === this.expiryKey) {
+                this.schedule();
+            }
+        });
+
+        if (this.getStoredExpiry() > this.now()) {
+            this.schedule();
+        }
+    }
+
+    now() {
+        return Math.floor(Date.now() / 1000);
+    }
+
+    /**
+     * Store expiry timestamp (seconds) from the response header and
+     * reschedule the renewal when it changed.
+     * @param {string|null} value
+     */
+    updateExpiry(value) {
+        const expiry = parseInt(value, 10);
+        if (!expiry) return;
+        if (expiry === this.getStoredExpiry() && this.timerId) return;
+
+        this.storeExpiry(expiry);
+        this.schedule();
+    }
+
+    /**
+     * Single timer firing shortly before the stored expiry, replaces
+     * polling of the token state.
+     */
+    schedule() {
+        if (this.timerId) clearTimeout(this.timerId);
+        this.timerId = null;
+
+        const expiry = this.getStoredExpiry();
+        if (!expiry) return;
+
+        const jitter = Math.random() * this.jitterSec;
+        const delaySec = expiry - this.renewBeforeSec - jitter - this.now();
+        this.timerId = setTimeout(() => this.onTimer(), Math.max(delaySec, 0) * 1000);
+    }
+
+    async onTimer() {
+        this.timerId = null;
+
+        const remaining = this.getStoredExpiry() - this.now();
+        if (remaining <= 0) {
+            // Session is over, next request redirects to the login
+            return;
+        }
+        if (remaining > this.renewBeforeSec + this.jitterSec) {
+            // Another tab or request renewed the session meanwhile
+            this.schedule();
+            return;
+        }
+
+        await this.renew();
+    }
+
+    async renew() {
+        const controller = new AbortController();
+        const timeout = setTimeout(() => controller.abort(), 5000); // 5s timeout
+
+        try {
+            const resp = await fetch(tokenRenewUrl, {
+                method: "GET",
+                signal: controller.signal,
+            });
+
+            if (!resp.ok) {
+                console.warn("Session renewal failed with status:", resp.status);
+                return;
+            }
+
+            const expiry = resp.headers.get(this.expiryHeader);
+            if (!expiry) {
+                console.warn("Session renewal response missing expiry");
+                return;
+            }
+            this.updateExpiry(expiry);
+        } catch (err) {
+            if (err.name === "AbortError") {
+                console.warn("Session renewal request timed out");
+            } else {
+                console.error("Error renewing session:", err);
+            }
+        } finally {
+            clearTimeout(timeout);
+        }
+    }
+
+    storeExpiry(expiry) {
+        localStorage.setItem(this.expiryKey, expiry.toString());
+    }
+
+    getStoredExpiry() {
+        const val = localStorage.getItem(this.expiryKey);
+        return val ? parseInt(val, 10) : null;
+    }
+}
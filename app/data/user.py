@@ -1,18 +1,28 @@
+import json
 from sqlite3 import IntegrityError
-from app.data.init import conn, curs
+from app.config import AUTH_CACHE_SIZE, AUTH_CACHE_TTL
+from app.data.cache import TTLCache
+from app.data.init import pool
+from app.data.pagination import keyset, to_page
+from app.model.pagination import Page, UserListQuery
 from app.model.user import User, UserPasswordResetToken
 from app.exception.database import RecordNotFound, UsernameOrEmailNotUnique
 
 
-curs.execute("""create table if not exists users(
-    user_id text PRIMARY KEY,
-    username text unique,
-    email text unique,
-    hash text,
-    role text,
-    password_reset_token text,
-    reset_token_expires int
-    )""")
+# Sort keys of the paginated user list and the expressions they sort by,
+# coalesce keeps NULLs out of the keyset comparison and matches the
+# expression indexes
+USER_SORTS = {
+    "username": "coalesce(username, '')",
+    "email": "coalesce(email, '')",
+    "role": "coalesce(role, '')",
+}
+
+# Users looked up by every authenticated request, invalidated by the functions
+# below which change or delete a user
+user_cache: TTLCache[str, User] = TTLCache(
+    name="users", max_entries=AUTH_CACHE_SIZE, ttl=AUTH_CACHE_TTL
+)
 
 
 # -------------------------------
@@ -66,31 +76,87 @@ def get_one(user_id: str | None) -> User:
     qry = "select * from users where user_id = :user_id"
     params = {"user_id": user_id}
 
-    cursor = conn.cursor()
-    try:
-        cursor.execute(qry, params)
-        row = cursor.fetchone()
-        if row:
-            return row_to_model(row)
-        else:
-            raise RecordNotFound(msg="User was not found")
-    finally:
-        cursor.close()
+    with pool.read() as conn:
+        cursor = conn.cursor()
+        try:
+            cursor.execute(qry, params)
+            row = cursor.fetchone()
+            if row:
+                return row_to_model(row)
+            else:
+                raise RecordNotFound(msg="User was not found")
+        finally:
+            cursor.close()
+
+
+def get_one_cached(user_id: str) -> User:
+    """Same as get_one, but served from user_cache when possible"""
+
+    return user_cache.get_or_load(user_id, get_one)
 
 
 def get_all() -> list[User]:
     qry = "select * from users"
 
-    cursor = conn.cursor()
-    try:
-        cursor.execute(qry)
-        rows = cursor.fetchall()
-        if rows:
-            return [row_to_model(row) for row in rows]
-        else:
-            raise RecordNotFound(msg="Questions were found.")
-    finally:
-        cursor.close()
+    with pool.read() as conn:
+        cursor = conn.cursor()
+        try:
+            cursor.execute(qry)
+            rows = cursor.fetchall()
+            if rows:
+                return [row_to_model(row) for row in rows]
+            else:
+                raise RecordNotFound(msg="Questions were found.")
+        finally:
+            cursor.close()
+
+
+def get_page(query: UserListQuery, limit: int) -> Page[User]:
+
+    sort_column = USER_SORTS[query.sort]
+    page_condition, order_by, params = keyset(
+            sort_column=sort_column,
+            id_column="user_id",
+            descending=query.descending,
+            cursor=query.cursor
+            )
+
+    conditions = [page_condition]
+    if query.name:
+        conditions.append("(instr(lower(username), lower(:name)) > 0 or instr(email, lower(:name)) > 0)")
+        params["name"] = query.name
+    if query.role:
+        conditions.append("role = :role")
+        params["role"] = query.role
+
+    qry = f"""
+    select
+        *,
+        {sort_column} as sort_value
+    from
+        users
+    where
+        {" and ".join(conditions)}
+    order by
+        {order_by}
+    limit
+        :limit
+    """
+    params["limit"] = limit + 1
+
+    with pool.read() as conn:
+        cursor = conn.cursor()
+        try:
+            cursor.execute(qry, params)
+            rows = cursor.fetchall()
+            return to_page(
+                    rows=rows,
+                    limit=limit,
+                    row_to_model=lambda row: row_to_model(row[:-1]),
+                    cursor_values=lambda row: (row[-1], row[0])
+                    )
+        finally:
+            cursor.close()
 
 
 def get_by(field: str, value: str|int ) -> User:
@@ -99,16 +165,17 @@ def get_by(field: str, value: str|int ) -> User:
             "value": value,
         }
 
-    cursor = conn.cursor()
-    try:
-        cursor.execute(qry, params)
-        row = cursor.fetchone()
-        if row:
-            return row_to_model(row)
-        else:
-            raise RecordNotFound(f"Record for {field}: {value} was not found")
-    finally:
-        cursor.close()
+    with pool.read() as conn:
+        cursor = conn.cursor()
+        try:
+            cursor.execute(qry, params)
+            row = cursor.fetchone()
+            if row:
+                return row_to_model(row)
+            else:
+                raise RecordNotFound(f"Record for {field}: {value} was not found")
+        finally:
+            cursor.close()
 
 
 def get_by_token(token: str) -> User:
@@ -123,16 +190,17 @@ def get_by_token(token: str) -> User:
     """
     params = {"token": token}
 
-    cursor = conn.cursor()
-    try:
-        cursor.execute(qry, params)
-        row = cursor.fetchone()
-        if row:
-            return row_to_model(row)
-        else:
-            raise RecordNotFound(msg="User was not found")
-    finally:
-        cursor.close()
+    with pool.read() as conn:
+        cursor = conn.cursor()
+        try:
+            cursor.execute(qry, params)
+            row = cursor.fetchone()
+            if row:
+                return row_to_model(row)
+            else:
+                raise RecordNotFound(msg="User was not found")
+        finally:
+            cursor.close()
 
 
 def username_from_mail(email: str) -> str:
@@ -148,16 +216,17 @@ def username_from_mail(email: str) -> str:
 
     params = {"email":email}
 
-    cursor = conn.cursor()
-    try:
-        cursor.execute(qry, params)
-        row = cursor.fetchone()
-        if row:
-            return row[0]
-        else:
-            raise RecordNotFound(msg="No user with this email found.")
-    finally:
-        cursor.close()
+    with pool.read() as conn:
+        cursor = conn.cursor()
+        try:
+            cursor.execute(qry, params)
+            row = cursor.fetchone()
+            if row:
+                return row[0]
+            else:
+                raise RecordNotFound(msg="No user with this email found.")
+        finally:
+            cursor.close()
 
 
 def create(user: User) -> User:
@@ -168,18 +237,74 @@ def create(user: User) -> User:
     params = model_to_dict(user)
     params["email"] = params["email"].lower()
 
-    cursor = conn.cursor()
-    try:
-        cursor.execute(qry, params)
-        inserted_row = cursor.fetchone()
-        conn.commit()
-        if inserted_row:
-            return row_to_model(inserted_row)
-    except IntegrityError as e:
-        conn.rollback()
-        raise UsernameOrEmailNotUnique(msg="Username or email already exists. Check list of users and try again.")
-    finally:
-        cursor.close()
+    with pool.write() as conn:
+        cursor = conn.cursor()
+        try:
+            cursor.execute(qry, params)
+            inserted_row = cursor.fetchone()
+            if inserted_row:
+                return row_to_model(inserted_row)
+        except IntegrityError as e:
+            raise UsernameOrEmailNotUnique(msg="Username or email already exists. Check list of users and try again.")
+        finally:
+            cursor.close()
+
+
+def create_many(users: list[User]) -> list[User]:
+    """Inserts all <users> in one transaction, none of them when one fails"""
+
+    qry = """insert into users(user_id, username, email, hash, role)
+            values( :user_id, :username, :email, :hash, :role)"""
+
+    params = [model_to_dict(user) for user in users]
+    for user_params in params:
+        user_params["email"] = user_params["email"].lower()
+
+    with pool.write() as conn:
+        cursor = conn.cursor()
+        try:
+            cursor.executemany(qry, params)
+        except IntegrityError as e:
+            raise UsernameOrEmailNotUnique(msg="Username or email already exists. Check list of users and try again.")
+        finally:
+            cursor.close()
+
+    return users
+
+
+def find_taken(usernames: list[str], emails: list[str]) -> tuple[set[str], set[str]]:
+    """Returns which of <usernames> and <emails> are already used"""
+
+    qry = """
+    select
+        username,
+        email
+    from
+        users
+    where
+        username in (select value from json_each(:usernames)) or
+        email in (select value from json_each(:emails))
+    """
+
+    params = {
+            "usernames": json.dumps(usernames),
+            "emails": json.dumps(emails)
+            }
+
+    with pool.read() as conn:
+        cursor = conn.cursor()
+        try:
+            cursor.execute(qry, params)
+            rows = cursor.fetchall()
+        finally:
+            cursor.close()
+
+    wanted_usernames = set(usernames)
+    wanted_emails = set(emails)
+    taken_usernames = {username for username, _ in rows if username in wanted_usernames}
+    taken_emails = {email for _, email in rows if email in wanted_emails}
+
+    return taken_usernames, taken_emails
 
 
 def modify(user_id: str, user_updated: User) -> User:
@@ -194,20 +319,23 @@ def modify(user_id: str, user_updated: User) -> User:
     params["email"] = params["email"].lower()
     params["user_id"] = user_id
 
-    cursor = conn.cursor()
+    # Invalidated once the write is over, so no reader caches the old row
     try:
-        cursor.execute(qry, params)
-        conn.commit()
-        update_user: User = get_one(user_id=user_id)
-        return update_user
-    except IntegrityError as e:
-        conn.rollback()
-        if "UNIQUE constraint failed: user.email" in str(e):
-            raise UsernameOrEmailNotUnique(msg="Email needs to be unique. Provided e-mail is already in use. Try different one.")
-        if "UNIQUE constraint failed: user.username" in str(e):
-            raise UsernameOrEmailNotUnique(msg="Username needs to be unique. Provided username is used. Try different one.")
+        with pool.write() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute(qry, params)
+                update_user: User = get_one(user_id=user_id)
+                return update_user
+            except IntegrityError as e:
+                if "UNIQUE constraint failed: user.email" in str(e):
+                    raise UsernameOrEmailNotUnique(msg="Email needs to be unique. Provided e-mail is already in use. Try different one.")
+                if "UNIQUE constraint failed: user.username" in str(e):
+                    raise UsernameOrEmailNotUnique(msg="Username needs to be unique. Provided username is used. Try different one.")
+            finally:
+                cursor.close()
     finally:
-        cursor.close()
+        user_cache.invalidate(user_id)
 
      
 def delete(user_id: str) -> User:
@@ -217,11 +345,39 @@ def delete(user_id: str) -> User:
     params = {
             "user_id": user_id
         }
-    conn.execute(qry, params)
-    conn.commit()
+    with pool.write() as conn:
+        conn.execute(qry, params)
+    user_cache.invalidate(user_id)
     return deleted_user
 
 
+def set_hash(user_id: str, old_hash: str, new_hash: str):
+    """Replaces password hash of the user, unless the password was changed
+    since <old_hash> was read."""
+
+    qry = """
+    update
+        users
+    set
+        hash = :new_hash
+    where
+        user_id = :user_id and
+        hash = :old_hash
+    """
+
+    params = {
+            "user_id": user_id,
+            "old_hash": old_hash,
+            "new_hash": new_hash
+            }
+
+    try:
+        with pool.write() as conn:
+            conn.execute(qry, params)
+    finally:
+        user_cache.invalidate(user_id)
+
+
 def set_password_reset_token(user_id: str, token: str, token_expires: int) -> UserPasswordResetToken:
 
     qry = """
@@ -240,13 +396,13 @@ def set_password_reset_token(user_id: str, token: str, token_expires: int) -> Us
             "reset_token_expires":token_expires
             }
 
-    cursor = conn.cursor()
-    try:
-        cursor.execute(qry, params)
-        conn.commit()
-        return get_password_reset_token(user_id=user_id)
-    finally:
-        cursor.close()
+    with pool.write() as conn:
+        cursor = conn.cursor()
+        try:
+            cursor.execute(qry, params)
+            return get_password_reset_token(user_id=user_id)
+        finally:
+            cursor.close()
 
 
 def get_password_reset_token(user_id: str) -> UserPasswordResetToken:
@@ -266,17 +422,18 @@ def get_password_reset_token(user_id: str) -> UserPasswordResetToken:
 
     params = {"user_id":user_id}
 
-    cursor = conn.cursor()
-    try:
-        cursor.execute(qry, params)
-        row = cursor.fetchone()
-        if row:
-            token = token_row_to_model(row)
-            return token
-        else:
-            raise RecordNotFound(msg="No record found for password reset token.")
-    finally:
-        cursor.close()
+    with pool.read() as conn:
+        cursor = conn.cursor()
+        try:
+            cursor.execute(qry, params)
+            row = cursor.fetchone()
+            if row:
+                token = token_row_to_model(row)
+                return token
+            else:
+                raise RecordNotFound(msg="No record found for password reset token.")
+        finally:
+            cursor.close()
 
 
 def del_password_reset_token(user_id: str):
@@ -293,12 +450,12 @@ def del_password_reset_token(user_id: str):
 
     params = {"user_id":user_id}
 
-    cursor = conn.cursor()
-    try:
-        cursor.execute(qry, params)
-        conn.commit()
-    finally:
-        cursor.close()
+    with pool.write() as conn:
+        cursor = conn.cursor()
+        try:
+            cursor.execute(qry, params)
+        finally:
+            cursor.close()
 
 
 def set_password_from_token(user_id: str, token: str, password_hash: str) -> User:
@@ -319,16 +476,14 @@ def set_password_from_token(user_id: str, token: str, password_hash: str) -> Use
             "password_hash":password_hash
             }
 
-    cursor = conn.cursor()
     try:
-        cursor.execute(qry, params)
-        conn.commit()
-        del_password_reset_token(user_id=user_id)
-        return get_one(user_id=user_id)
-    except Exception as e:
-        conn.rollback()
-        raise e
+        with pool.write() as conn:
+            cursor = conn.cursor()
+            try:
+                cursor.execute(qry, params)
+                del_password_reset_token(user_id=user_id)
+                return get_one(user_id=user_id)
+            finally:
+                cursor.close()
     finally:
-        cursor.close()
-
-
+        user_cache.invalidate(user_id)
@@ -41,3 +41,13 @@ class SendingEmailFailed(Exception):
 class PasswordResetTokenExpired(Exception):
     def __init__(self, msg: str):
         self.msg = msg
+
+class TooManyRequests(Exception):
+    def __init__(self, msg: str, retry_after: int):
+        self.msg = msg
+        self.retry_after = retry_after
+
+class InvalidImportRows(Exception):
+    def __init__(self, msg: str, errors: list[str]):
+        self.msg = msg
+        self.errors = errors
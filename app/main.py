@@ -10,13 +10,43 @@ from app.exception.web import (
 )
 from pathlib import Path
 
-from app.config import FORCE_HTTPS_PATHS_ENV, APP_ROOT, DATA_ROOT, DB_DIR, UPLOADS_DIR
+from app.config import (
+    FORCE_HTTPS_PATHS_ENV,
+    APP_ROOT,
+    BCRYPT_ROUNDS,
+    DATA_ROOT,
+    DB_DIR,
+    STATIC_BUILD_DIR,
+    TEMPLATE_WARMUP,
+    UPLOADS_DIR,
+)
 
+from app.data.migrate import migrate
 from app.service.user import add_default_user
 from app.service.question import add_default_questions
+from app.service import qa_cache
+from app.service import static_assets
+from app.template import init as templates
+from app.template import wheel
+from app.service.outbox import worker as outbox_worker
+from app.service.authentication import (
+    close_cf_client,
+    configure_password_hashing,
+    token_cache,
+)
+from app.data.user import user_cache
 
 from app.api.auth import router as auth_api_router
 
+from app.web.middleware import (
+    CompressionMiddleware,
+    ETagMiddleware,
+    MetricsMiddleware,
+    SlidingSessionMiddleware,
+)
+from app.web.metrics import router as metrics_router
+from app.web.static import PrecompressedStaticFiles
+
 from app.web.public import router as public_router
 from app.web.dashboard.dashboard import router as dashboard_router
 from app.web.dashboard.users import router as dashboard_users_router
@@ -37,12 +67,55 @@ async def lifespan(app: FastAPI):
     DATA_ROOT.mkdir(parents=True, exist_ok=True)
     DB_DIR.mkdir(parents=True, exist_ok=True)
     UPLOADS_DIR.mkdir(parents=True, exist_ok=True)
+    STATIC_BUILD_DIR.mkdir(parents=True, exist_ok=True)
+
+    static_assets.build()
+
+    if TEMPLATE_WARMUP:
+        warmup = templates.warm_up()
+        wheels = wheel.warm_up()
+        print(
+            f"Templates: {warmup.templates} loaded in {warmup.seconds * 1000:.0f} ms, "
+            f"{warmup.loaded} from the bytecode cache, {warmup.compiled} compiled, "
+            f"{wheels} wheel templates split"
+        )
+
+    bcrypt_rounds = configure_password_hashing(rounds=BCRYPT_ROUNDS)
+    print(f"Password hashing: bcrypt with {bcrypt_rounds} rounds")
 
+    migrate()
     add_default_user()
     add_default_questions()
+    outbox_worker.start()
 
     yield
 
+    outbox_worker.stop()
+    print(
+        f"E-mail outbox: {outbox_worker.stats.sent} sent, "
+        f"{outbox_worker.stats.retried} retried, {outbox_worker.stats.failed} failed"
+    )
+
+    await close_cf_client()
+
+    cache_stats = qa_cache.stats()
+    print(
+        f"Q&A cache: {cache_stats.hit_ratio:.1%} hit ratio "
+        f"({cache_stats.hits} hits, {cache_stats.misses} misses, "
+        f"{cache_stats.evictions} evictions, {cache_stats.stale} stale), "
+        f"{cache_stats.entries} entries "
+        f"using {cache_stats.size} of {cache_stats.max_bytes} bytes"
+    )
+    for auth_cache in (token_cache, user_cache):
+        auth_stats = auth_cache.stats()
+        print(
+            f"{auth_stats.name.capitalize()} cache: {auth_stats.hit_ratio:.1%} hit ratio "
+            f"({auth_stats.hits} hits, {auth_stats.misses} misses, "
+            f"{auth_stats.expirations} expirations, {auth_stats.evictions} evictions, "
+            f"{auth_stats.invalidations} invalidations), "
+            f"{auth_stats.entries} of {auth_stats.max_entries} entries"
+        )
+
 
 # Main app to start
 app = FastAPI(lifespan=lifespan)
@@ -55,14 +128,30 @@ class HTTPSRedirectMiddleware(BaseHTTPMiddleware):
         return await call_next(request)
 
 
+app.add_middleware(SlidingSessionMiddleware)
+
 if FORCE_HTTPS_PATHS_ENV:
     app.add_middleware(HTTPSRedirectMiddleware)
 
+# The ETag is the hash of the uncompressed body, compression runs after it
+app.add_middleware(ETagMiddleware)
+app.add_middleware(CompressionMiddleware)
+
+# Added last so it is the outermost middleware and times all the others
+app.add_middleware(MetricsMiddleware)
+
 
 app.add_exception_handler(NonHTMXRequestException, non_htmx_request_exception_handler)
 app.add_exception_handler(RedirectToLoginException, redirect_to_login_exception_handler)
 
-# Mount static files directories
+# Mount static files directories, /static serves the fingerprinted and
+# compressed files templates link through static_url, the plain directories
+# stay for links to files outside the build
+app.mount(
+    "/static",
+    PrecompressedStaticFiles(directory=STATIC_BUILD_DIR, check_dir=False),
+    name="static",
+)
 app.mount("/js", StaticFiles(directory=APP_ROOT / "static" / "js"), name="js")
 app.mount("/css", StaticFiles(directory=APP_ROOT / "static" / "css"), name="css")
 app.mount("/images", StaticFiles(directory=APP_ROOT / "static" / "images"), name="images")
@@ -73,6 +162,9 @@ app.mount("/uploads", StaticFiles(directory=UPLOADS_DIR), name="uploads")
 # API routers
 app.include_router(auth_api_router, prefix="/api/v1/auth")
 
+# Prometheus metrics
+app.include_router(metrics_router)
+
 # Dashboard routers
 app.include_router(public_router)
 app.include_router(dashboard_router, prefix="/dashboard")
@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, field_validator
 
 
 class Assessment(BaseModel):
@@ -17,6 +17,18 @@ class AssessmentPost(BaseModel):
     owner_id: str
 
 
+class AssessmentBatchPost(BaseModel):
+    assessment_name: str
+    owner_ids: list[str] = Field(..., min_length=1)
+
+    @field_validator("owner_ids", mode="before")
+    def single_owner_to_list(cls, value):
+        # Multi-select with single option picked is sent as plain string
+        if isinstance(value, str):
+            return [value]
+        return value
+
+
 class AssessmentAnswerPost(BaseModel):
     answer_id: str
     assessment_id: str
@@ -50,6 +62,13 @@ class AssessmentQA(BaseModel):
     answer_id: str | None
     answer_option: str | None
     answer_description: str | None
+    version: int = 0
+
+
+class AssessmentVersion(BaseModel):
+    assessment_id: str
+    version: int
+    updated_at: str | None
 
 
 class AssessmentQuestionCategory(BaseModel):
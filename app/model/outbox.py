@@ -0,0 +1,17 @@
+from pydantic import BaseModel
+
+
+class OutboxEmailCreate(BaseModel):
+    recipient: str
+    subject: str
+    html: str
+    text: str | None = None
+
+
+class OutboxEmail(BaseModel):
+    email_id: int
+    recipient: str
+    subject: str
+    html: str
+    text: str | None = None
+    attempts: int
@@ -0,0 +1,44 @@
+from datetime import date
+from typing import Generic, Literal, TypeVar
+from pydantic import BaseModel, field_validator
+
+
+T = TypeVar("T")
+
+
+class Page(BaseModel, Generic[T]):
+    items: list[T]
+    next_cursor: str | None
+
+
+class ListQuery(BaseModel):
+    descending: bool = False
+    cursor: str | None = None
+
+    @field_validator("*", mode="before")
+    def empty_string_to_none(cls, value):
+        # Filter form sends empty inputs as empty strings
+        if value == "":
+            return None
+        return value
+
+
+class AssessmentListQuery(ListQuery):
+    sort: Literal["name", "owner", "last_edit"] = "name"
+    name: str | None = None
+    owner: str | None = None
+    edited_after: date | None = None
+    edited_before: date | None = None
+
+
+class UserListQuery(ListQuery):
+    sort: Literal["username", "email", "role"] = "username"
+    name: str | None = None
+    role: Literal["admin", "coach", "user"] | None = None
+
+
+class ReportListQuery(ListQuery):
+    sort: Literal["name", "assessment", "owner"] = "name"
+    assessment_filter: str | None = None
+    name: str | None = None
+    owner: str | None = None
@@ -0,0 +1,47 @@
+from enum import Enum
+from pydantic import BaseModel, EmailStr, Field, field_validator
+from app.model.user import UserRoleEnum
+
+
+class UserImportRow(BaseModel):
+    username: str = Field(..., min_length=1, pattern=r"^[A-Za-z0-9]+$")
+    email: EmailStr
+    password: str | None = Field(None, min_length=12, max_length=128)
+    role: UserRoleEnum = UserRoleEnum.user
+
+    @field_validator("password", mode="before")
+    def empty_string_to_none(cls, value):
+        if value == "":
+            return None
+        return value
+
+    @field_validator("role", mode="before")
+    def empty_role_to_user(cls, value):
+        if value == "" or value is None:
+            return UserRoleEnum.user
+        return value
+
+
+class UserImportStatusEnum(Enum):
+    hashing = "hashing"
+    inserting = "inserting"
+    queueing = "queueing"
+    done = "done"
+    failed = "failed"
+
+
+class UserImportJob(BaseModel):
+    job_id: str
+    owner_id: str
+    total: int
+    hashed: int = 0
+    created: int = 0
+    emails_queued: int = 0
+    status: UserImportStatusEnum = UserImportStatusEnum.hashing
+    message: str | None = None
+    started_at: float
+    finished_at: float | None = None
+
+    @property
+    def running(self) -> bool:
+        return self.status not in (UserImportStatusEnum.done, UserImportStatusEnum.failed)
@@ -1,19 +1,24 @@
 from uuid import uuid4
+from markupsafe import Markup
+from app.config import DASHBOARD_PAGE_SIZE
 from app.exception.database import RecordNotFound
 from app.model.assesment import (
     Assessment,
     AssessmentAnswerPost,
+    AssessmentBatchPost,
     AssessmentChown,
     AssessmentNew,
     AssessmentPost,
     AssessmentQA,
 )
+from app.model.pagination import AssessmentListQuery, Page
 from app.model.user import User
 from app.exception.service import Unauthorized
 from app.template.init import jinja
+from app.template import wheel
 
 import app.data.assessment as data
-from app.service import report as report_service
+from app.service import qa_cache
 
 
 def create_assessment(
@@ -34,6 +39,28 @@ def create_assessment(
     return created_assessment
 
 
+def create_assessments(
+    assessment_batch: AssessmentBatchPost, current_user: User
+) -> list[Assessment]:
+
+    if not current_user.can_manage_assessments():
+        raise Unauthorized(msg="You cannot manage assessments.")
+
+    # dict.fromkeys drops duplicate owners while keeping the order
+    assessments_new: list[AssessmentNew] = [
+        AssessmentNew(
+            assessment_id=str(uuid4()),
+            assessment_name=assessment_batch.assessment_name,
+            owner_id=owner_id,
+        )
+        for owner_id in dict.fromkeys(assessment_batch.owner_ids)
+    ]
+    created_assessments: list[Assessment] = data.create_assessments(
+        assessments_new=assessments_new
+    )
+    return created_assessments
+
+
 def get_assessment(assessment_id: str, current_user: User) -> Assessment:
 
     assessment = data.get_one(assessment_id=assessment_id)
@@ -50,6 +77,7 @@ def get_assessment(assessment_id: str, current_user: User) -> Assessment:
 def delete_assessment(assessment_id: str, current_user: User) -> Assessment:
 
     assessment = data.delete_assessment(assessment_id=assessment_id)
+    qa_cache.invalidate(assessment_id=assessment_id)
 
     if not current_user.can_manage_assessments():
         raise Unauthorized(msg="You cannot access this assessment.")
@@ -65,6 +93,22 @@ def get_all(current_user: User) -> list[Assessment]:
     return data.get_all()
 
 
+def get_page(query: AssessmentListQuery, current_user: User) -> Page[Assessment]:
+
+    if not current_user.can_manage_assessments():
+        raise Unauthorized(msg="You cannot view all assessments.")
+
+    return data.get_page(query=query, limit=DASHBOARD_PAGE_SIZE)
+
+
+def any_exist(current_user: User) -> bool:
+
+    if not current_user.can_manage_assessments():
+        raise Unauthorized(msg="You cannot view all assessments.")
+
+    return data.any_exist()
+
+
 def get_all_for_user(current_user: User) -> list[Assessment]:
 
     if current_user.user_id == None:
@@ -72,13 +116,13 @@ def get_all_for_user(current_user: User) -> list[Assessment]:
             msg="Seems that you are not authorized. Try logging in again."
         )
 
+    # has_reports flag comes with the assessments from the same query
     assessments = data.get_all_for_user(user_id=current_user.user_id)
     for assessment in assessments:
-        reports = report_service.get_public_reports_for_assessment(
-            assessment_id=assessment.assessment_id, current_user=current_user
-        )
-        if reports:
-            assessment.has_reports = True
+        if assessment.owner_id != current_user.user_id:
+            raise Unauthorized(
+                msg="This assessment doesn't belong to you. You can not view it's content"
+            )
 
     return assessments
 
@@ -100,46 +144,53 @@ def get_for_user(assessment_id: str | None, current_user: User) -> Assessment:
 
 def get_all_qa(assessment_id: str, current_user: User) -> list[AssessmentQA]:
 
-    assessment = data.get_one(assessment_id=assessment_id)
+    # Owner comes along with the cached Q&A, so a cache hit only checks the
+    # version
+    assessment_qa = qa_cache.get(assessment_id=assessment_id)
 
     if (
         not current_user.can_manage_assessments()
-        and current_user.user_id != assessment.owner_id
+        and current_user.user_id != assessment_qa[0].owner_id
     ):
         raise Unauthorized(msg="You cannot access this assessment data.")
 
-    return data.filter_assessment_qa_by_category_order_and_question_id(
-        assessment_id=assessment_id
-    )
+    return assessment_qa
+
 
+def render_wheel(
+    assessment_qa: list[AssessmentQA],
+    template_name: str,
+    current_question: AssessmentQA | None = None,
+    base_url: str = "",
+) -> Markup:
 
-def prepare_wheel_context(assessment_qa: list[AssessmentQA]) -> dict:
+    fills = tuple(
+        (qa.category_order, qa.question_order, answer_color(answer_option=qa.answer_option))
+        for qa in assessment_qa
+    )
+    labels = tuple({qa.category_order: qa.category_name for qa in assessment_qa}.items())
+
+    return wheel.render_wheel(
+        name=template_name,
+        assessment_id=assessment_qa[0].assessment_id,
+        fills=fills,
+        labels=labels,
+        active_category=current_question.category_order if current_question else None,
+        base_url=base_url,
+    )
 
-    context: dict = {"assessment_id": assessment_qa[0].assessment_id}
 
-    for qa in assessment_qa:
-        category_name_key = f"category_name_{qa.category_order:02}"
-        if category_name_key not in context:
-            context[category_name_key] = qa.category_name
-
-        category_order_key = f"category_{qa.category_order:02}_order"
-        if category_order_key not in context:
-            context[category_order_key] = f"{qa.category_order}"
-
-        field_color: str = "#000000"
-        match qa.answer_option:
-            case "yes":
-                field_color = "#00cd00"
-            case "mid":
-                field_color = "#cdcd00"
-            case "no":
-                field_color = "#cd0000"
-            case _:
-                field_color = "#0000cd"
-        question_key = f"category_{qa.category_order:02}_question_{qa.question_order}"
-        context[question_key] = field_color
-
-    return context
+def answer_color(answer_option: str | None) -> str:
+
+    match answer_option:
+        case "yes":
+            return "#00cd00"
+        case "mid":
+            return "#cdcd00"
+        case "no":
+            return "#cd0000"
+        case _:
+            return "#0000cd"
 
 
 def filter_assessment_qa_by_category_order_and_question_id(
@@ -241,10 +292,24 @@ def save_answer(answer_data: AssessmentAnswerPost, current_user: User):
         current_user.can_manage_assessments()
         or current_user.user_id == targeted_assessment.owner_id
     ):
-        data.save_answer(answer_data=answer_data)
-        data.update_last_edit(
+        # Last edit goes first, a reader seeing the version bumped by the
+        # answer also sees the last edit
+        last_edit = data.update_last_edit(
             assessment_id=answer_data.assessment_id, current_user=current_user
         )
+        qa_cache.update_meta(
+            assessment_id=answer_data.assessment_id,
+            last_edit=last_edit,
+            last_editor=current_user.user_id,
+        )
+        version = data.save_answer(answer_data=answer_data)
+        qa_cache.update_answer(
+            assessment_id=answer_data.assessment_id,
+            answer_id=answer_data.answer_id,
+            answer_option=answer_data.answer_option,
+            answer_description=answer_data.answer_description,
+            version=version,
+        )
 
 
 def chown(assessment_chown: AssessmentChown, current_user: User) -> bool:
@@ -252,7 +317,13 @@ def chown(assessment_chown: AssessmentChown, current_user: User) -> bool:
     if not current_user.can_manage_assessments():
         raise Unauthorized(msg="You cannot view all assessments.")
 
-    return data.chown(assessment_chown=assessment_chown)
+    version = data.chown(assessment_chown=assessment_chown)
+    qa_cache.update_meta(
+        assessment_id=assessment_chown.assessment_id,
+        owner_id=assessment_chown.new_owner_id,
+        version=version,
+    )
+    return version is not None
 
 
 def rename(assessment_id: str, new_name: str, current_user: User) -> bool:
@@ -262,4 +333,9 @@ def rename(assessment_id: str, new_name: str, current_user: User) -> bool:
 
     assessment = get_assessment(assessment_id=assessment_id, current_user=current_user)
     assessment.assessment_name = new_name
-    return data.rename(assessment=assessment)
+    version = data.rename(assessment=assessment)
+    if version is not None:
+        qa_cache.update_meta(
+            assessment_id=assessment_id, assessment_name=new_name, version=version
+        )
+    return version is not None
@@ -1,15 +1,26 @@
-from fastapi import HTTPException, Request
+import asyncio
+import os
+import statistics
+import time
+from concurrent.futures import ThreadPoolExecutor
+from fastapi import HTTPException, Request, Response
+from fastapi.concurrency import run_in_threadpool
 from app.config import (
     ACCESS_TOKEN_EXPIRE_MINUTES,
     SECRET_KEY,
     ALGORITHM,
     CF_TURNSTILE_SECRET_KEY,
+    PASSWORD_HASH_WORKERS,
+    AUTH_CACHE_SIZE,
+    AUTH_CACHE_TTL,
+    BCRYPT_TARGET_MS,
 )
 
-import requests
+import httpx
 
 from jose import ExpiredSignatureError, JWTError, jwt
 from passlib.context import CryptContext
+from passlib.hash import bcrypt
 from datetime import datetime, timedelta, timezone
 
 from app.exception.auth import CFTurnstileVerificationFailed
@@ -19,32 +30,119 @@ from app.exception.service import IncorectCredentials, InvalidBearerToken
 from app.model.user import User
 
 # Function to retrieve the user and pasword hash
+from app.data.cache import TTLCache
 from app.data.user import get_one as get_user_by_user_id
+from app.data.user import get_one_cached as get_cached_user_by_user_id
 from app.data.user import get_by as get_user_by
+from app.data.user import set_hash as set_user_hash
 
 
 """From all of this, there are 2 main functions to keep in mind.
-1) handle_token_creation()
-    - takes in username and password and creates token if credentials valid
+1) auth_user() and handle_token_creation()
+    - checks username and password and creates token for the user if valid
 2) get_current_user()
     - takes in token and returns user if token is valid"""
 
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# Bounds of the calibrated work factor, under 10 bcrypt is cheap to brute
+# force and over 16 a single login takes seconds
+BCRYPT_MIN_ROUNDS = 10
+BCRYPT_MAX_ROUNDS = 16
+
+# bcrypt is cpu bound and releases the GIL, so password checks of the login
+# requests run on these threads instead of blocking the event loop
+password_executor = ThreadPoolExecutor(
+    max_workers=PASSWORD_HASH_WORKERS, thread_name_prefix="password-hash"
+)
+
 
 def verify_password(password: str, hash: str) -> bool:
     return pwd_context.verify(password, hash)
 
 
+async def verify_password_async(password: str, hash: str) -> tuple[bool, str | None]:
+    """Verifies <password> against <hash> on the password_executor. Returns
+    whether it matches and, when <hash> was made with another work factor
+    than the current one, new hash of the password to replace it with."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        password_executor, pwd_context.verify_and_update, password, hash
+    )
+
+
 def get_password_hash(plain: str) -> str:
     return pwd_context.hash(plain)
 
 
+def measure_bcrypt(rounds: int, samples: int = 5) -> float:
+    """Returns median seconds one bcrypt hash with <rounds> takes"""
+
+    handler = bcrypt.using(rounds=rounds)
+    timings = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        handler.hash("calibration")
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def calibrate_bcrypt_rounds(target_ms: float = BCRYPT_TARGET_MS) -> int:
+    """Returns highest work factor whose hash takes at most <target_ms> on
+    this machine. Every round doubles the cost, so it is extrapolated from
+    a few cheap hashes instead of timing the expensive ones."""
+
+    base_rounds = 8
+    base_ms = measure_bcrypt(base_rounds) * 1000
+
+    rounds = base_rounds
+    while rounds < BCRYPT_MAX_ROUNDS and base_ms * 2 ** (rounds + 1 - base_rounds) <= target_ms:
+        rounds += 1
+
+    return max(rounds, BCRYPT_MIN_ROUNDS)
+
+
+def configure_password_hashing(rounds: int | None = None) -> int:
+    """Sets work factor of new hashes to <rounds>, or calibrates it for
+    BCRYPT_TARGET_MS when None. Hashes made with fewer rounds, or with more
+    than one round over, are replaced on the next successful login."""
+
+    if rounds is None:
+        rounds = calibrate_bcrypt_rounds()
+
+    # One round of slack keeps calibration noise between restarts from
+    # rehashing everybody back and forth
+    pwd_context.update(
+        bcrypt__default_rounds=rounds,
+        bcrypt__min_rounds=rounds,
+        bcrypt__max_rounds=rounds + 1,
+    )
+    return rounds
+
+
+# Claims of verified access tokens, kept until the token expires at the latest
+token_cache: TTLCache[str, dict] = TTLCache(
+    name="tokens", max_entries=AUTH_CACHE_SIZE, ttl=AUTH_CACHE_TTL
+)
+
+
+def jwt_decode_cached(token: str) -> dict:
+    """Decodes and verifies <token> or returns its claims from token_cache.
+    Invalid and expired tokens raise JWTError and are never cached."""
+
+    if (payload := token_cache.get(token)) is not None:
+        return payload
+
+    payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+    token_cache.set(token, payload, expires_at=payload.get("exp"))
+    return payload
+
+
 def jwt_to_user_id(token: str) -> str | None:
     """Return user id from JWT access <token>"""
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        payload = jwt_decode_cached(token)
         if not (username := payload.get("user_id")):
             return None
     except ExpiredSignatureError:
@@ -54,31 +152,13 @@ def jwt_to_user_id(token: str) -> str | None:
     return username
 
 
-def jwt_to_expiry_status(token: str) -> int:
-    """
-    Return value based on the expiration window of the token.
-    0 - Token missing or not valid
-    1 - Token OK
-    2 - Token ready for renewal
-    """
+def jwt_to_expiry(token: str) -> int | None:
+    """Return expiry timestamp of a valid access <token>, None when the token
+    is invalid or expired"""
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        exp = payload.get("exp")
-        if not exp:
-            return 0
+        return jwt_decode_cached(token).get("exp")
     except JWTError:
-        return 0
-
-    time_now = datetime.now(timezone.utc)
-    exp_time = datetime.fromtimestamp(exp, tz=timezone.utc)
-    time_remaining = (exp_time - time_now).total_seconds()
-
-    if time_remaining <= 0:
-        return 0  # Token expired
-    elif time_remaining < 180:
-        return 2  # Ready for renewal
-    else:
-        return 1  # Token OK
+        return None
 
 
 def jwt_extract_object(token: str) -> dict:
@@ -86,10 +166,10 @@ def jwt_extract_object(token: str) -> dict:
     Returns for example user_id, and expiry time stamp."""
 
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+        payload = jwt_decode_cached(token)
         if not payload:
             return {}
-        return payload
+        return dict(payload)
     except JWTError:
         return {}
 
@@ -106,19 +186,26 @@ def generate_bearer_token(data: dict, expires_delta: timedelta | None = None) ->
     return bearer_token
 
 
-def auth_user(username: str, password: str) -> User:
-    """Authenticate user <name> and <plain> password"""
-    user: User = get_user_by(field="username", value=username)
-    if not verify_password(password=password, hash=user.hash):
+async def auth_user(username: str, password: str) -> User:
+    """Authenticate user <name> and <plain> password. The database calls run
+    on the thread pool, waiting for the write lock never blocks the event
+    loop."""
+    user: User = await run_in_threadpool(get_user_by, field="username", value=username)
+    verified, new_hash = await verify_password_async(password=password, hash=user.hash)
+    if not verified:
         raise IncorectCredentials("Incorrect Credentials")
+    if new_hash:
+        # Work factor changed since the password was set, keep the new hash
+        await run_in_threadpool(
+            set_user_hash, user_id=user.user_id, old_hash=user.hash, new_hash=new_hash
+        )
+        user.hash = new_hash
     return user
 
 
-def handle_token_creation(username: str, password: str) -> str:
-    """Handles creation on the sign in. Takes in username and password and returns
-    bearer token: Bearer <token-value>."""
-    # Checks username and password validity
-    user: User = auth_user(username=username, password=password)
+def handle_token_creation(user: User) -> str:
+    """Handles creation on the sign in. Takes in user authenticated by auth_user()
+    and returns bearer token: Bearer <token-value>."""
     expires_delta: timedelta = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     token: str = generate_bearer_token(
         data={"user_id": user.user_id}, expires_delta=expires_delta
@@ -126,14 +213,27 @@ def handle_token_creation(username: str, password: str) -> str:
     return token
 
 
+def set_access_token_cookie(response: Response, token: str):
+    """Sets bearer <token> as the access_token cookie of <response>"""
+    # Disable secure for non https - since cookies will be rejected on LAN IP's
+    if os.getenv("FORCE_HTTPS_PATHS_ENV"):
+        response.set_cookie(
+            key="access_token",
+            value=token,
+            httponly=True,
+            secure=True,
+            samesite="strict",
+        )
+    else:
+        response.set_cookie(
+            key="access_token", value=token, httponly=True, samesite="strict"
+        )
+
+
 def handle_token_renewal(current_user: User) -> str:
     """Handles recreation of the token in case token is timing out. If token is ready
     for refresh this function will generate new one based on the current_user object."""
-    expires_delta: timedelta = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
-    token: str = generate_bearer_token(
-        data={"user_id": current_user.user_id}, expires_delta=expires_delta
-    )
-    return token
+    return handle_token_creation(user=current_user)
 
 
 # -------------------------------------
@@ -152,7 +252,7 @@ def get_current_user(token: str) -> User | None:
 
     if not (user_id := jwt_to_user_id(token)):
         raise InvalidBearerToken(msg="Invalid Bearer Token")
-    if user := get_user_by_user_id(user_id=user_id):
+    if user := get_cached_user_by_user_id(user_id=user_id):
         return user
 
 
@@ -164,6 +264,9 @@ async def user_htmx_dep(request: Request) -> User | None:
         try:
             token_stripped = access_token.split("Bearer ")[1]
             current_user = get_current_user(token=token_stripped)
+            # Read by the SlidingSessionMiddleware to renew the session
+            request.state.current_user = current_user
+            request.state.access_token = token_stripped
             return current_user
         except IndexError as e:
             raise RedirectToLoginException(detail="Bearer token doesn't contain token.")
@@ -182,34 +285,53 @@ async def user_htmx_dep(request: Request) -> User | None:
 # -------------------------------------
 
 
-def cf_verify_response(response: str | None) -> bool:
+CF_SITEVERIFY_ENDPOINT = "https://challenges.cloudflare.com/turnstile/v0/siteverify"
+
+# Shared client, keeps the connection to cloudflare open between the logins
+_cf_client: httpx.AsyncClient | None = None
+
+
+def get_cf_client() -> httpx.AsyncClient:
+
+    global _cf_client
+
+    if _cf_client is None:
+        _cf_client = httpx.AsyncClient(timeout=10.0)
+    return _cf_client
+
+
+async def close_cf_client():
+
+    global _cf_client
+
+    if _cf_client is not None:
+        await _cf_client.aclose()
+        _cf_client = None
+
+
+async def cf_verify_response(response: str | None) -> bool:
 
     if not response:
         raise CFTurnstileVerificationFailed(
             msg="Captcha verification failed. Try again or contact admins if problem persists."
         )
 
-    cf_siteverify_endpoint = "https://challenges.cloudflare.com/turnstile/v0/siteverify"
-
     data = {
         "secret": CF_TURNSTILE_SECRET_KEY,
         "response": response,
     }
 
-    r = requests.post(cf_siteverify_endpoint, data=data)
-    r_json = r.json()
-
     try:
-        if r_json["success"] == True:
-            return True
-        else:
-            CFTurnstileVerificationFailed(
-                msg="Captcha verification failed. Try again or contact admins if problem persists."
-            )
+        r = await get_cf_client().post(CF_SITEVERIFY_ENDPOINT, data=data)
+        r_json = r.json()
+        success = r_json["success"] == True
     except Exception as e:
         print(str(e))
+        success = False
+
+    if not success:
         raise CFTurnstileVerificationFailed(
             msg="Captcha verification failed. Try again or contact admins if problem persists."
         )
 
-    return False
+    return True
@@ -1,74 +1,80 @@
+import time
 from fastapi import Request
-import smtplib
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
-from email.utils import formatdate
-
-from app.config import (
-    SMTP_LOGIN,
-    SMTP_PORT,
-    SMTP_EMAIL,
-    SMTP_SERVER,
-    SMTP_ENABLED,
-    SMTP_PASSWORD,
-)
+
+from app.config import SMTP_ENABLED
 
 from app.exception.database import RecordNotFound
 import app.service.user as user_service
+from app.service.outbox import worker as outbox_worker
+import app.data.outbox as outbox_data
 
-from app.template.init import jinja
+from app.template.email import render_email
 from app.model.user import User, UserPasswordResetToken
 from app.model.report import Report, ReportExtended
+from app.model.outbox import OutboxEmailCreate
 from app.exception.service import (
     SMTPCredentialsNotSet,
-    SendingEmailFailed,
     Unauthorized,
 )
 
 
 def notify_user_created(new_user: User, request: Request, current_user: User) -> bool:
 
-    if not current_user.can_send_emails:
-        raise Unauthorized(msg="You cannot send e-mails")
+    notify_users_created(new_users=[new_user], request=request, current_user=current_user)
 
-    username = new_user.username
-    email = new_user.email
+    return True
 
-    subject = f"Hello {username}, welcome to BAT App!"
 
-    context = {
-        "username": username,
-        "website_url": request.base_url,
-        "url_for": request.url_for,
-    }
+def notify_users_created(
+    new_users: list[User], request: Request, current_user: User
+) -> list[int]:
+    """Queues welcome e-mails of all <new_users> in one outbox transaction,
+    the outbox worker sends them over a single SMTP session."""
 
-    template = jinja.env.get_template("email/new-user.html")
-    content = template.render(context)
+    if not current_user.can_send_emails:
+        raise Unauthorized(msg="You cannot send e-mails")
 
-    try:
-        send_html_email(recipient_email=email, subject=subject, html_message=content)
-        return True
-    except Exception as e:
-        # NotImplemented
-        raise e
+    emails = []
+    for new_user in new_users:
+        content = render_email(
+            "new-user",
+            url_for=request.url_for,
+            base_url=str(request.base_url),
+            username=new_user.username,
+        )
+        emails.append(
+            OutboxEmailCreate(
+                recipient=new_user.email,
+                subject=f"Hello {new_user.username}, welcome to BAT App!",
+                html=content.html,
+                text=content.text,
+            )
+        )
 
-    return False
+    return queue_html_emails(emails)
 
 
 def send_password_reset(token_object: UserPasswordResetToken, request: Request) -> bool:
 
     subject = "Set you new password"
 
-    context = {"token_object": token_object, "url_for": request.url_for}
-
-    print("again stuck on template?")
-    template = jinja.env.get_template("email/set-password.html")
-    print("no we got stuck on render:")
-    content = template.render(context)
+    content = render_email(
+        "set-password",
+        url_for=request.url_for,
+        base_url=str(request.base_url),
+        username=token_object.username,
+        reset_token=str(token_object.password_reset_token),
+    )
 
-    print("sending mail?")
-    send_html_email(
-        recipient_email=token_object.email, subject=subject, html_message=content
+    queue_html_emails(
+        [
+            OutboxEmailCreate(
+                recipient=token_object.email,
+                subject=subject,
+                html=content.html,
+                text=content.text,
+            )
+        ]
     )
 
     return True
@@ -88,47 +94,44 @@ def notify_report_published(
     else:
         raise RecordNotFound(msg="Report owner seems not to exist. Maybe deleted user?")
 
-    context = {
-        "username": report_owner.username,
-        "report_name": report.report_name,
-        "website_url": request.base_url,
-    }
-
-    template = jinja.env.get_template("email/report-published.html")
-    content = template.render(context)
-
-    context = {
-        "username": report_owner.username,
-        "report_name": report.report_name,
-        "website_url": request.base_url,
-    }
-
-    send_html_email(
-        recipient_email=report_owner.email,
-        subject="New report is now accessible.",
-        html_message=content,
+    content = render_email(
+        "report-published",
+        url_for=request.url_for,
+        base_url=str(request.base_url),
+        username=report_owner.username,
+        report_name=report.report_name,
     )
 
-    send_html_email(
-        recipient_email=current_user.email,
-        subject="COPY: New report is now accessible.",
-        html_message=content,
+    queue_html_emails(
+        [
+            OutboxEmailCreate(
+                recipient=report_owner.email,
+                subject="New report is now accessible.",
+                html=content.html,
+                text=content.text,
+            ),
+            OutboxEmailCreate(
+                recipient=current_user.email,
+                subject="COPY: New report is now accessible.",
+                html=content.html,
+                text=content.text,
+            ),
+        ]
     )
 
-    return False
+    return True
 
 
-def send_html_email(recipient_email: str, subject: str, html_message: str) -> bool:
+def queue_html_emails(emails: list[OutboxEmailCreate]) -> list[int]:
     """
-    Sends an HTML-encoded email through SMTP using predefined constants.
+    Queues HTML-encoded emails in the outbox, in one transaction, and wakes
+    the outbox worker which sends them in the background.
 
     Parameters:
-    - recipient_email: The email address of the recipient.
-    - subject: The subject of the email.
-    - html_message: The HTML content of the email.
+    - emails: Recipients, subjects, HTML and plain text contents of the emails.
 
     Returns:
-    - True if the email was sent successfully, False otherwise.
+    - Outbox ids of the queued emails.
     """
 
     if not SMTP_ENABLED:
@@ -136,26 +139,7 @@ def send_html_email(recipient_email: str, subject: str, html_message: str) -> bo
             msg="SMTP credentials are not set. You need to notify user manually."
         )
 
-    try:
-        # Create the MIMEMultipart message object
-        msg = MIMEMultipart()
-        msg["From"] = f"BAT App <{SMTP_EMAIL}>"
-        msg["To"] = recipient_email
-        msg["Subject"] = subject
-        msg["Date"] = formatdate(localtime=True)
-
-        # Attach the HTML message to the email
-        msg.attach(MIMEText(html_message, "html"))
-
-        # Connect to the SMTP server using SSL
-        with smtplib.SMTP_SSL(SMTP_SERVER, SMTP_PORT) as server:
-            server.login(SMTP_EMAIL, SMTP_PASSWORD)  # Log in to the SMTP server
-            server.sendmail(
-                SMTP_EMAIL, recipient_email, msg.as_string()
-            )  # Send the email
-
-        return True
-
-    except Exception as e:
-        print(f"Failed to send email: {e}")
-        raise SendingEmailFailed(msg=str(e))
+    email_ids = outbox_data.enqueue(emails=emails, now=time.time())
+    outbox_worker.wake()
+
+    return email_ids
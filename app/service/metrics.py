@@ -0,0 +1,217 @@
+"""Request, SQL and template metrics in the Prometheus text format.
+
+MetricsMiddleware times every request and keeps a RequestMetrics of it in a
+context variable, the SQL statements run by the request add up there. The
+totals go to the metrics below, together with the render times of the
+templates, and /metrics exposes them.
+
+Requests running more than SQL_QUERIES_WARN statements are counted and
+printed together with their most repeated statement, which is how N+1
+patterns show up: the same select once for every row of the page.
+
+Metrics are kept in the memory of each app process.
+"""
+
+import math
+import threading
+from collections import Counter as StatementCounter
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from app.config import SQL_QUERIES_WARN
+
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200, 500)
+SQL_LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1)
+
+
+def escape_label(value: str) -> str:
+
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def format_labels(names: tuple[str, ...], values: tuple[str, ...], extra: str = "") -> str:
+
+    pairs = [f'{name}="{escape_label(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def format_value(value: float) -> str:
+
+    if math.isinf(value):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class Counter:
+
+    def __init__(self, name: str, help: str, labels: tuple[str, ...] = ()):
+
+        self.name = name
+        self.help = help
+        self.labels = labels
+        self._values: dict[tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *label_values: str, value: float = 1):
+
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0) + value
+
+    def render(self) -> list[str]:
+
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            for label_values, value in sorted(self._values.items()):
+                lines.append(f"{self.name}{format_labels(self.labels, label_values)} {format_value(value)}")
+        return lines
+
+
+class Histogram:
+
+    def __init__(
+        self, name: str, help: str, buckets: tuple[float, ...], labels: tuple[str, ...] = ()
+    ):
+
+        self.name = name
+        self.help = help
+        self.labels = labels
+        self.buckets = tuple(buckets) + (math.inf,)
+        # label values -> (count per bucket, sum, count)
+        self._values: dict[tuple[str, ...], tuple[list[int], float, int]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *label_values: str):
+
+        with self._lock:
+            counts, total, count = self._values.get(label_values, ([0] * len(self.buckets), 0.0, 0))
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    counts[index] += 1
+                    break
+            self._values[label_values] = (counts, total + value, count + 1)
+
+    def render(self) -> list[str]:
+
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            for label_values, (counts, total, count) in sorted(self._values.items()):
+                cumulative = 0
+                for bound, bucket_count in zip(self.buckets, counts):
+                    cumulative += bucket_count
+                    labels = format_labels(self.labels, label_values, f'le="{format_value(bound)}"')
+                    lines.append(f"{self.name}_bucket{labels} {cumulative}")
+                labels = format_labels(self.labels, label_values)
+                lines.append(f"{self.name}_sum{labels} {format_value(total)}")
+                lines.append(f"{self.name}_count{labels} {count}")
+        return lines
+
+
+http_requests = Counter(
+    name="bat_http_requests_total",
+    help="HTTP requests by route and status code.",
+    labels=("method", "route", "status"),
+)
+http_request_duration = Histogram(
+    name="bat_http_request_duration_seconds",
+    help="Time from receiving the request to sending the last byte of the response.",
+    buckets=LATENCY_BUCKETS,
+    labels=("method", "route"),
+)
+request_sql_queries = Histogram(
+    name="bat_http_request_sql_queries",
+    help="SQL statements run by one request.",
+    buckets=QUERY_COUNT_BUCKETS,
+    labels=("method", "route"),
+)
+request_sql_duration = Histogram(
+    name="bat_http_request_sql_seconds",
+    help="Total time of the SQL statements of one request.",
+    buckets=LATENCY_BUCKETS,
+    labels=("method", "route"),
+)
+requests_over_query_limit = Counter(
+    name="bat_http_requests_over_query_limit_total",
+    help="Requests running more SQL statements than SQL_QUERIES_WARN.",
+    labels=("method", "route"),
+)
+sql_queries = Histogram(
+    name="bat_sql_query_seconds",
+    help="Time of single SQL statements, also those run outside of requests.",
+    buckets=SQL_LATENCY_BUCKETS,
+)
+template_renders = Histogram(
+    name="bat_template_render_seconds",
+    help="Render time of the top level jinja templates.",
+    buckets=LATENCY_BUCKETS,
+    labels=("template",),
+)
+
+METRICS = (
+    http_requests,
+    http_request_duration,
+    request_sql_queries,
+    request_sql_duration,
+    requests_over_query_limit,
+    sql_queries,
+    template_renders,
+)
+
+
+@dataclass
+class RequestMetrics:
+    queries: int = 0
+    query_seconds: float = 0.0
+    statements: StatementCounter = field(default_factory=StatementCounter)
+
+
+current_request: ContextVar[RequestMetrics | None] = ContextVar("current_request", default=None)
+
+
+def record_query(sql: str, seconds: float):
+    """Called by the data layer for every executed statement"""
+
+    sql_queries.observe(seconds)
+
+    request_metrics = current_request.get()
+    if request_metrics is not None:
+        request_metrics.queries += 1
+        request_metrics.query_seconds += seconds
+        request_metrics.statements[sql] += 1
+
+
+def record_template(name: str | None, seconds: float):
+
+    template_renders.observe(seconds, name or "<string>")
+
+
+def record_request(
+    method: str, route: str, status: int, seconds: float, request_metrics: RequestMetrics
+):
+
+    http_requests.inc(method, route, str(status))
+    http_request_duration.observe(seconds, method, route)
+    request_sql_queries.observe(request_metrics.queries, method, route)
+    request_sql_duration.observe(request_metrics.query_seconds, method, route)
+
+    if SQL_QUERIES_WARN and request_metrics.queries > SQL_QUERIES_WARN:
+        requests_over_query_limit.inc(method, route)
+        statement, repeats = request_metrics.statements.most_common(1)[0]
+        print(
+            f"{method} {route} ran {request_metrics.queries} SQL statements in "
+            f"{request_metrics.query_seconds * 1000:.1f} ms, {repeats}x: {' '.join(statement.split())[:200]}"
+        )
+
+
+def render() -> str:
+    """All metrics in the Prometheus text exposition format"""
+
+    lines: list[str] = []
+    for metric in METRICS:
+        lines.extend(metric.render())
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,265 @@
+"""Background sender of the e-mail outbox.
+
+The web handlers only insert e-mails into the email_outbox table and wake
+the worker, a daemon thread which claims due e-mails in batches and sends
+them over a single authenticated SMTP session. The session is kept open
+between batches and closed after SMTP_IDLE_SECONDS without e-mails.
+
+E-mails failing with a temporary error (connection problems, 4xx replies)
+are retried with exponential backoff, permanent 5xx rejections and e-mails
+out of attempts are marked failed. Every app process runs its own worker,
+claims keep them from sending the same e-mail twice.
+
+For local testing point SMTP_SERVER and SMTP_PORT to a stand-in server, e.g.
+python -m aiosmtpd -n -l localhost:8025, with SMTP_SECURITY=none.
+"""
+
+import random
+import smtplib
+import threading
+import time
+from dataclasses import dataclass
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+from email.utils import formatdate
+
+from app.config import (
+    OUTBOX_BATCH_SIZE,
+    OUTBOX_MAX_ATTEMPTS,
+    OUTBOX_POLL_SECONDS,
+    OUTBOX_RETRY_SECONDS,
+    SMTP_EMAIL,
+    SMTP_ENABLED,
+    SMTP_IDLE_SECONDS,
+    SMTP_PASSWORD,
+    SMTP_PORT,
+    SMTP_SECURITY,
+    SMTP_SERVER,
+)
+from app.model.outbox import OutboxEmail
+
+import app.data.outbox as data
+
+
+# Claimed e-mails not sent by then are picked up again, e.g. by another
+# process when this one died mid batch
+CLAIM_SECONDS = 300
+SMTP_TIMEOUT_SECONDS = 30
+KEEP_SENT_SECONDS = 30 * 24 * 60 * 60
+CLEANUP_EVERY_SECONDS = 60 * 60
+
+
+def build_message(email: OutboxEmail) -> MIMEMultipart:
+
+    # Clients show the last part they can display, so html goes after text
+    msg = MIMEMultipart("alternative")
+    msg["From"] = f"BAT App <{SMTP_EMAIL}>"
+    msg["To"] = email.recipient
+    msg["Subject"] = email.subject
+    msg["Date"] = formatdate(localtime=True)
+    if email.text:
+        msg.attach(MIMEText(email.text, "plain"))
+    msg.attach(MIMEText(email.html, "html"))
+
+    return msg
+
+
+def is_permanent(error: Exception) -> bool:
+    """5xx replies won't change by retrying the same e-mail"""
+
+    if isinstance(error, smtplib.SMTPRecipientsRefused):
+        return all(code >= 500 for code, _ in error.recipients.values())
+    if isinstance(error, smtplib.SMTPResponseException):
+        return error.smtp_code >= 500
+    return False
+
+
+class SMTPSession:
+    """Lazily connected, authenticated SMTP connection reused between e-mails"""
+
+    def __init__(self):
+
+        self._server: smtplib.SMTP | None = None
+        self._last_used = 0.0
+
+    def connect(self) -> smtplib.SMTP:
+
+        if SMTP_SECURITY == "ssl":
+            server = smtplib.SMTP_SSL(SMTP_SERVER, int(SMTP_PORT), timeout=SMTP_TIMEOUT_SECONDS)
+        else:
+            server = smtplib.SMTP(SMTP_SERVER, int(SMTP_PORT), timeout=SMTP_TIMEOUT_SECONDS)
+            if SMTP_SECURITY == "starttls":
+                server.starttls()
+
+        try:
+            server.ehlo_or_helo_if_needed()
+            # Local test servers usually don't offer authentication
+            if server.has_extn("auth"):
+                server.login(SMTP_EMAIL, SMTP_PASSWORD)
+        except Exception:
+            server.close()
+            raise
+
+        return server
+
+    def open(self):
+
+        if self._server is None:
+            self._server = self.connect()
+            self._last_used = time.monotonic()
+
+    def send(self, msg: MIMEMultipart):
+
+        self.open()
+
+        try:
+            self._server.send_message(msg)
+        except smtplib.SMTPServerDisconnected:
+            # Server dropped the idle connection, reconnect once
+            self.close()
+            self._server = self.connect()
+            self._server.send_message(msg)
+
+        self._last_used = time.monotonic()
+
+    def close_if_idle(self):
+
+        if self._server is not None and time.monotonic() - self._last_used > SMTP_IDLE_SECONDS:
+            self.close()
+
+    def close(self):
+
+        if self._server is None:
+            return
+        try:
+            self._server.quit()
+        except Exception:
+            self._server.close()
+        self._server = None
+
+
+@dataclass
+class OutboxStats:
+    sent: int = 0
+    retried: int = 0
+    failed: int = 0
+
+
+class OutboxWorker:
+
+    def __init__(self):
+
+        self.session = SMTPSession()
+        self.stats = OutboxStats()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._last_cleanup = 0.0
+
+    def start(self):
+
+        if not SMTP_ENABLED or self._thread is not None:
+            return
+
+        self._stop.clear()
+        self._thread = threading.Thread(target=self.run, name="email-outbox", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 10):
+
+        if self._thread is None:
+            return
+
+        self._stop.set()
+        self._wake.set()
+        self._thread.join(timeout=timeout)
+        self._thread = None
+
+    def wake(self):
+        """Sends newly queued e-mails right away instead of the next poll"""
+
+        self._wake.set()
+
+    def run(self):
+
+        while not self._stop.is_set():
+            try:
+                if self.send_batch() == OUTBOX_BATCH_SIZE:
+                    continue
+                self.cleanup()
+            except Exception as e:
+                print(f"E-mail outbox worker failed: {e}")
+
+            self.session.close_if_idle()
+            self._wake.wait(timeout=OUTBOX_POLL_SECONDS)
+            self._wake.clear()
+
+        self.session.close()
+
+    def send_batch(self) -> int:
+        """Sends one batch of due e-mails, returns how many were claimed"""
+
+        now = time.time()
+        emails = data.claim_due(now=now, claim_until=now + CLAIM_SECONDS, limit=OUTBOX_BATCH_SIZE)
+
+        if not emails:
+            return 0
+
+        try:
+            self.session.open()
+        except (smtplib.SMTPException, OSError) as e:
+            # Unreachable server or wrong credentials, none of the e-mails
+            # is at fault so all of them are retried later
+            print(f"Failed to connect to the SMTP server: {e}")
+            for email in emails:
+                self.fail(email=email, error=e, permanent=False)
+            return len(emails)
+
+        sent: list[int] = []
+        for index, email in enumerate(emails):
+            if self._stop.is_set():
+                data.release(email_ids=[e.email_id for e in emails[index:]], now=time.time())
+                break
+            try:
+                self.session.send(build_message(email))
+                sent.append(email.email_id)
+            except (smtplib.SMTPRecipientsRefused, smtplib.SMTPResponseException) as e:
+                # Server refused this e-mail, the session is still fine
+                self.fail(email=email, error=e, permanent=is_permanent(e))
+            except (smtplib.SMTPException, OSError) as e:
+                # Connection lost, don't try the rest of the batch now
+                self.session.close()
+                for rest in emails[index:]:
+                    self.fail(email=rest, error=e, permanent=False)
+                break
+
+        if sent:
+            data.mark_sent(email_ids=sent, now=time.time())
+            self.stats.sent += len(sent)
+
+        return len(emails)
+
+    def fail(self, email: OutboxEmail, error: Exception, permanent: bool):
+
+        attempts = email.attempts + 1
+        if permanent or attempts >= OUTBOX_MAX_ATTEMPTS:
+            print(f"Failed to send email {email.email_id} to {email.recipient}: {error}")
+            data.mark_failed(email_id=email.email_id, error=str(error))
+            self.stats.failed += 1
+            return
+
+        # Jitter keeps the retries of one outage from arriving all at once
+        delay = OUTBOX_RETRY_SECONDS * 2 ** email.attempts * random.uniform(0.8, 1.2)
+        data.mark_retry(email_id=email.email_id, next_attempt_at=time.time() + delay, error=str(error))
+        self.stats.retried += 1
+
+    def cleanup(self):
+
+        now = time.time()
+        if now - self._last_cleanup < CLEANUP_EVERY_SECONDS:
+            return
+        self._last_cleanup = now
+        data.delete_sent_before(sent_before=now - KEEP_SENT_SECONDS)
+
+
+worker = OutboxWorker()
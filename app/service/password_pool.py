@@ -0,0 +1,69 @@
+"""Hashing of many passwords at once in worker processes.
+
+Bulk operations hash hundreds of passwords, with bcrypt that is seconds of
+cpu per password batch. The hashes are spread over a process pool, which
+keeps the GIL of the app process and its threads out of the way.
+
+The pool uses spawned processes, they import only this module, so it is
+kept free of any app imports.
+"""
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from typing import Callable
+
+from passlib.context import CryptContext
+
+
+@lru_cache(maxsize=4)
+def crypt_context(config: str) -> CryptContext:
+
+    return CryptContext.from_string(config)
+
+
+def hash_password(config: str, password: str) -> str:
+    """Runs in the worker processes, <config> is the serialized CryptContext
+    of the app which carries its calibrated work factor"""
+
+    return crypt_context(config).hash(password)
+
+
+def hash_passwords(
+    passwords: list[str],
+    context: CryptContext,
+    workers: int,
+    on_progress: Callable[[int], None] | None = None,
+) -> list[str]:
+    """
+    Hashes <passwords> with <context> on up to <workers> processes.
+
+    Parameters:
+    - passwords: Plain passwords.
+    - context: CryptContext whose settings the hashes are made with.
+    - workers: Most processes to hash on.
+    - on_progress: Called with the number of passwords hashed so far.
+
+    Returns:
+    - Hashes in the order of <passwords>.
+    """
+
+    if not passwords:
+        return []
+
+    workers = max(1, min(workers, len(passwords)))
+    # Small chunks keep the progress moving and the processes evenly loaded
+    chunksize = max(1, min(8, len(passwords) // (workers * 4)))
+
+    hashes: list[str] = []
+    with ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        for hash in executor.map(
+            partial(hash_password, context.to_string()), passwords, chunksize=chunksize
+        ):
+            hashes.append(hash)
+            if on_progress is not None:
+                on_progress(len(hashes))
+
+    return hashes
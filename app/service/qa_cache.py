@@ -0,0 +1,291 @@
+"""In-process cache of assessment Q&A.
+
+Questions and categories of an assessment are copied from the templates when
+the assessment is created and never change afterwards, so they are kept here
+frozen and keyed by assessment_id. The few mutable parts, the answers and the
+assessment name, owner and last edit, are kept next to them and updated in
+place by the service functions that write them, which keeps the cache
+consistent without refetching the whole assessment after every answer.
+
+Every write bumps the version of the assessment, which is cached along with
+it. A hit compares it with the version in the database, a single primary key
+lookup, and refills the entry when another app process or a note changed the
+assessment meanwhile. An in place update whose version does not follow the
+cached one missed such a change and drops the entry instead.
+
+Entries are evicted least recently used first when either QA_CACHE_SIZE
+entries or QA_CACHE_MAX_BYTES of estimated memory is exceeded.
+"""
+
+import sys
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from threading import Lock
+
+from app.config import QA_CACHE_MAX_BYTES, QA_CACHE_SIZE
+from app.exception.database import RecordNotFound
+from app.model.assesment import AssessmentQA
+
+import app.data.assessment as data
+
+
+# Fields of AssessmentQA which can change after the assessment is created
+META_FIELDS = ("assessment_name", "owner_id", "last_edit", "last_editor", "version")
+ANSWER_FIELDS = ("answer_id", "answer_option", "answer_description")
+
+
+@dataclass
+class CacheEntry:
+    # Frozen question and category fields, one dict per question in the
+    # category_order, question_order order
+    questions: tuple[dict, ...]
+    # question_id -> answer_id
+    answer_ids: dict[int, str | None]
+    # answer_id -> (answer_option, answer_description)
+    answers: dict[str, tuple[str | None, str | None]]
+    meta: dict
+    size: int = 0
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    stale: int = 0
+    entries: int = 0
+    size: int = 0
+    max_entries: int = QA_CACHE_SIZE
+    max_bytes: int = QA_CACHE_MAX_BYTES
+    hit_ratio: float = field(init=False, default=0.0)
+
+    def __post_init__(self):
+        lookups = self.hits + self.misses
+        self.hit_ratio = self.hits / lookups if lookups else 0.0
+
+
+_entries: OrderedDict[str, CacheEntry] = OrderedDict()
+_lock = Lock()
+_size = 0
+_hits = 0
+_misses = 0
+_evictions = 0
+_stale = 0
+# Bumped by every write, a fill that raced with a write is not stored
+_generation = 0
+
+
+def estimate_size(value) -> int:
+
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(
+            estimate_size(k) + estimate_size(v) for k, v in value.items()
+        )
+    if isinstance(value, (tuple, list)):
+        return sys.getsizeof(value) + sum(estimate_size(v) for v in value)
+    return sys.getsizeof(value)
+
+
+def entry_from_qa(assessment_qa: list[AssessmentQA]) -> CacheEntry:
+
+    questions: list[dict] = []
+    answer_ids: dict[int, str | None] = {}
+    answers: dict[str, tuple[str | None, str | None]] = {}
+
+    for qa in assessment_qa:
+        row = qa.model_dump(exclude=set(META_FIELDS + ANSWER_FIELDS))
+        questions.append(row)
+        answer_ids[qa.question_id] = qa.answer_id
+        if qa.answer_id is not None:
+            answers[qa.answer_id] = (qa.answer_option, qa.answer_description)
+
+    meta = {key: getattr(assessment_qa[0], key) for key in META_FIELDS}
+
+    entry = CacheEntry(
+        questions=tuple(questions), answer_ids=answer_ids, answers=answers, meta=meta
+    )
+    entry.size = estimate_size((entry.questions, answer_ids, answers, meta))
+    return entry
+
+
+def entry_to_qa(entry: CacheEntry) -> list[AssessmentQA]:
+
+    assessment_qa: list[AssessmentQA] = []
+    for row in entry.questions:
+        answer_id = entry.answer_ids[row["question_id"]]
+        answer_option, answer_description = entry.answers.get(answer_id, (None, None))
+        # Values were validated when the entry was filled, skip the validation
+        assessment_qa.append(
+            AssessmentQA.model_construct(
+                **row,
+                **entry.meta,
+                answer_id=answer_id,
+                answer_option=answer_option,
+                answer_description=answer_description,
+            )
+        )
+    return assessment_qa
+
+
+def evict():
+
+    global _size, _evictions
+
+    # Most recently used entry is always kept, even when it alone is over the cap
+    while len(_entries) > 1 and (len(_entries) > QA_CACHE_SIZE or _size > QA_CACHE_MAX_BYTES):
+        _, entry = _entries.popitem(last=False)
+        _size -= entry.size
+        _evictions += 1
+
+
+def get(assessment_id: str) -> list[AssessmentQA]:
+
+    global _size, _hits, _misses, _stale
+
+    with _lock:
+        entry = _entries.get(assessment_id)
+        generation = _generation
+
+    if entry is not None:
+        try:
+            version = data.get_version(assessment_id=assessment_id).version
+        except RecordNotFound:
+            invalidate(assessment_id=assessment_id)
+            raise
+
+        with _lock:
+            if _entries.get(assessment_id) is entry:
+                if entry.meta["version"] == version:
+                    _entries.move_to_end(assessment_id)
+                    _hits += 1
+                    return entry_to_qa(entry)
+                invalidate_locked(assessment_id)
+                _stale += 1
+            generation = _generation
+
+    with _lock:
+        _misses += 1
+
+    assessment_qa = data.filter_assessment_qa_by_category_order_and_question_id(
+        assessment_id=assessment_id
+    )
+    if QA_CACHE_SIZE < 1:
+        return assessment_qa
+
+    entry = entry_from_qa(assessment_qa)
+    with _lock:
+        if generation == _generation and assessment_id not in _entries:
+            _entries[assessment_id] = entry
+            _size += entry.size
+            evict()
+
+    return assessment_qa
+
+
+def get_meta(assessment_id: str) -> dict | None:
+    """Returns cached name, owner and last edit of the assessment or None when
+    the assessment is not cached."""
+
+    with _lock:
+        entry = _entries.get(assessment_id)
+        if entry is None:
+            return None
+        return dict(entry.meta)
+
+
+def follows(entry: CacheEntry, version: int | None) -> bool:
+    """Whether <version>, returned by a write, directly follows the cached
+    version, so no other write happened in between"""
+
+    return version is not None and entry.meta["version"] + 1 == version
+
+
+def update_answer(
+    assessment_id: str,
+    answer_id: str,
+    answer_option: str | None,
+    answer_description: str | None,
+    version: int | None,
+):
+
+    global _size, _generation
+
+    with _lock:
+        _generation += 1
+        entry = _entries.get(assessment_id)
+        if entry is None:
+            return
+        if answer_id not in entry.answers or not follows(entry, version):
+            # Unknown answer or missed write, don't guess and let the next
+            # read refill
+            invalidate_locked(assessment_id)
+            return
+        answer = (answer_option, answer_description)
+        size_change = estimate_size(answer) - estimate_size(entry.answers[answer_id])
+        entry.answers[answer_id] = answer
+        entry.meta["version"] = version
+        entry.size += size_change
+        _size += size_change
+        evict()
+
+
+def update_meta(assessment_id: str, **meta):
+    """Updates the cached meta fields, a version among them has to follow
+    the cached one. Fields changed without bumping the version, like the last
+    edit, are updated as they are."""
+
+    global _generation
+
+    with _lock:
+        _generation += 1
+        entry = _entries.get(assessment_id)
+        if entry is None:
+            return
+        if "version" in meta and not follows(entry, meta["version"]):
+            invalidate_locked(assessment_id)
+            return
+        for key, value in meta.items():
+            if key not in META_FIELDS:
+                raise KeyError(f"{key} is not a cached assessment field")
+            entry.meta[key] = value
+
+
+def invalidate_locked(assessment_id: str):
+
+    global _size
+
+    entry = _entries.pop(assessment_id, None)
+    if entry is not None:
+        _size -= entry.size
+
+
+def invalidate(assessment_id: str):
+
+    global _generation
+
+    with _lock:
+        _generation += 1
+        invalidate_locked(assessment_id)
+
+
+def clear():
+
+    global _size, _generation
+
+    with _lock:
+        _generation += 1
+        _entries.clear()
+        _size = 0
+
+
+def stats() -> CacheStats:
+
+    with _lock:
+        return CacheStats(
+            hits=_hits,
+            misses=_misses,
+            evictions=_evictions,
+            stale=_stale,
+            entries=len(_entries),
+            size=_size,
+        )
@@ -0,0 +1,195 @@
+"""Token bucket rate limiter of the login and password reset.
+
+Every key (client ip, username, email) has a bucket of <capacity> tokens
+which refills completely over RATE_LIMIT_PERIOD seconds. An attempt takes a
+token and is rejected with the time until the next one when the bucket is
+empty. Rejections happen before any bcrypt or SMTP work.
+
+Buckets are kept in process memory by default. With several app workers
+RATE_LIMIT_BACKEND=sqlite keeps them in the database, so the workers share
+the limits instead of each granting the full capacity.
+"""
+
+import math
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from threading import Lock
+
+from app.config import (
+    LOGIN_ATTEMPTS_PER_IP,
+    LOGIN_ATTEMPTS_PER_USER,
+    PASSWORD_RESETS_PER_EMAIL,
+    PASSWORD_RESETS_PER_IP,
+    RATE_LIMIT_BACKEND,
+    RATE_LIMIT_MAX_KEYS,
+    RATE_LIMIT_PERIOD,
+)
+from app.exception.service import TooManyRequests
+
+import app.data.rate_limit as data
+
+
+@dataclass(frozen=True)
+class Bucket:
+    name: str
+    capacity: int
+    period: float = RATE_LIMIT_PERIOD
+
+    @property
+    def rate(self) -> float:
+        """Tokens added per second"""
+        return self.capacity / self.period
+
+
+LOGIN_IP = Bucket(name="login-ip", capacity=LOGIN_ATTEMPTS_PER_IP)
+LOGIN_USER = Bucket(name="login-user", capacity=LOGIN_ATTEMPTS_PER_USER)
+RESET_IP = Bucket(name="reset-ip", capacity=PASSWORD_RESETS_PER_IP)
+RESET_EMAIL = Bucket(name="reset-email", capacity=PASSWORD_RESETS_PER_EMAIL)
+
+
+def refill(
+    state: tuple[float, float] | None, bucket: Bucket, now: float
+) -> float:
+    """Returns tokens in the bucket at <now>, from (tokens, updated) <state>"""
+
+    if state is None:
+        return bucket.capacity
+    tokens, updated = state
+    return min(bucket.capacity, tokens + max(now - updated, 0) * bucket.rate)
+
+
+def wait_time(tokens: float, bucket: Bucket) -> float:
+    """Seconds until the bucket holding <tokens> has a whole token"""
+
+    return (1 - tokens) / bucket.rate
+
+
+class MemoryBuckets:
+    """Buckets of this process, ordered by last use. A bucket untouched for
+    the whole period is full again and the same as a missing one, so the
+    oldest entries are dropped as they expire and at most <max_keys> are
+    kept."""
+
+    def __init__(self, max_keys: int):
+
+        self.max_keys = max_keys
+        # key -> (tokens, monotonic time of last update)
+        self._buckets: OrderedDict[str, tuple[float, float]] = OrderedDict()
+        self._lock = Lock()
+
+    def evict(self, now: float):
+
+        while self._buckets:
+            key, (_, updated) = next(iter(self._buckets.items()))
+            if len(self._buckets) <= self.max_keys and now - updated < RATE_LIMIT_PERIOD:
+                break
+            del self._buckets[key]
+
+    def take(self, key: str, bucket: Bucket) -> float:
+
+        now = time.monotonic()
+        with self._lock:
+            self.evict(now)
+            tokens = refill(self._buckets.get(key), bucket, now)
+            if tokens < 1:
+                return wait_time(tokens, bucket)
+            self._buckets[key] = (tokens - 1, now)
+            self._buckets.move_to_end(key)
+            return 0
+
+    def check(self, key: str, bucket: Bucket) -> float:
+
+        now = time.monotonic()
+        with self._lock:
+            tokens = refill(self._buckets.get(key), bucket, now)
+        return wait_time(tokens, bucket) if tokens < 1 else 0
+
+
+class SQLiteBuckets:
+    """Buckets in the rate_limit_buckets table, shared by all workers using
+    the database. Expired rows are deleted every <sweep_every> takes."""
+
+    def __init__(self, sweep_every: int = 1000):
+
+        self.sweep_every = sweep_every
+        self._takes = 0
+
+    def take(self, key: str, bucket: Bucket) -> float:
+
+        now = time.time()
+        wait = 0.0
+
+        def update(state: tuple[float, float] | None) -> tuple[float, float]:
+            nonlocal wait
+            tokens = refill(state, bucket, now)
+            if tokens < 1:
+                wait = wait_time(tokens, bucket)
+                return tokens, now
+            return tokens - 1, now
+
+        data.update_bucket(bucket_key=key, update=update)
+
+        self._takes += 1
+        if self._takes % self.sweep_every == 0:
+            data.delete_buckets_before(updated_before=now - RATE_LIMIT_PERIOD)
+
+        return wait
+
+    def check(self, key: str, bucket: Bucket) -> float:
+
+        tokens = refill(data.get_bucket(bucket_key=key), bucket, time.time())
+        return wait_time(tokens, bucket) if tokens < 1 else 0
+
+
+if RATE_LIMIT_BACKEND == "sqlite":
+    buckets: MemoryBuckets | SQLiteBuckets = SQLiteBuckets()
+else:
+    buckets = MemoryBuckets(max_keys=RATE_LIMIT_MAX_KEYS)
+
+
+def reject(wait: float):
+
+    retry_after = math.ceil(wait)
+    minutes = math.ceil(retry_after / 60)
+    raise TooManyRequests(
+        msg=f"Too many attempts. Try again in {minutes} minute{'s' if minutes > 1 else ''}.",
+        retry_after=retry_after,
+    )
+
+
+# -------------------------------
+#   Limits
+# -------------------------------
+
+
+def check_login(client_ip: str):
+    """Raises TooManyRequests when the client ran out of login attempts,
+    every attempt counts."""
+
+    if wait := buckets.take(f"{LOGIN_IP.name}:{client_ip}", LOGIN_IP):
+        reject(wait)
+
+
+def check_account(username: str):
+    """Raises TooManyRequests when the account ran out of login attempts.
+    Only failed logins drain the account bucket, it caps guessing of one
+    password from many addresses without counting the owner's logins."""
+
+    if wait := buckets.check(f"{LOGIN_USER.name}:{username.lower()}", LOGIN_USER):
+        reject(wait)
+
+
+def login_failed(username: str):
+
+    buckets.take(f"{LOGIN_USER.name}:{username.lower()}", LOGIN_USER)
+
+
+def check_password_reset(client_ip: str, email: str):
+    """Raises TooManyRequests when the client or the address asked for too
+    many password resets."""
+
+    if wait := buckets.take(f"{RESET_IP.name}:{client_ip}", RESET_IP):
+        reject(wait)
+    if wait := buckets.take(f"{RESET_EMAIL.name}:{email.lower()}", RESET_EMAIL):
+        reject(wait)
@@ -8,14 +8,14 @@ from app.data import assessment as assessment_data
 
 from app.service import assessment as assessment_service
 
+from app.model.pagination import Page, ReportListQuery
 from app.model.report import Report, ReportCreate, ReportExtended, ReportUpdate
 from app.model.user import User
 from app.model.assesment import Assessment, AssessmentQA
 
 from app.exception.service import EndpointDataMismatch, Unauthorized
 
-from app.template.init import jinja
-from app.config import UPLOADS_DIR
+from app.config import DASHBOARD_PAGE_SIZE, UPLOADS_DIR
 
 
 # -------------------------------
@@ -127,63 +127,35 @@ def publish_report(report_id: str, public: bool, current_user: User) -> Report:
 
 
 
-def get_all_extended(current_user: User) -> list[ReportExtended]:
+def get_all_extended(query: ReportListQuery, current_user: User) -> Page[ReportExtended]:
 
-    all_reports: list[Report] = get_all(current_user=current_user)
-
-    reports_extended: list[ReportExtended] = []
-    for report in all_reports:
-        extended_report = extend_report(report=report, current_user=current_user)
-        reports_extended.append(extended_report)
+    if not current_user.can_manage_reports():
+        raise Unauthorized(msg="You cannot manage reports.")
 
-    return reports_extended
+    return data.get_all_extended(query=query, limit=DASHBOARD_PAGE_SIZE)
 
 
 def get_report_extended(report_id: str, current_user: User) -> ReportExtended:
 
-    report: Report = get_report(report_id=report_id, current_user=current_user)
-
-    return extend_report(report=report, current_user=current_user)
-
-
-def extend_report(report: Report, current_user: User) -> ReportExtended:
+    if not current_user.can_manage_reports():
+        raise Unauthorized(msg="You cannot manage reports.")
 
-    attached_assessment: Assessment = assessment_service.get_assessment(assessment_id=report.assessment_id, current_user=current_user)
+    return data.get_report_extended(report_id=report_id)
 
-    return ReportExtended(
-            report_id=report.report_id,
-            report_name=report.report_name,
-            assessment_id=attached_assessment.assessment_id,
-            assessment_name=attached_assessment.assessment_name,
-            assessment_owner=attached_assessment.owner_name,
-            public=report.public,
-            key=report.key,
-            wheel_filename=report.wheel_filename,
-            summary=report.summary,
-            recommendation_title_1=report.recommendation_title_1,
-            recommendation_content_1=report.recommendation_content_1,
-            recommendation_title_2=report.recommendation_title_2,
-            recommendation_content_2=report.recommendation_content_2,
-            recommendation_title_3=report.recommendation_title_3,
-            recommendation_content_3=report.recommendation_content_3,
-            )
 
 def create_wheel_snapshot(assessment_id: str, current_user: User) -> str:
     """Takes in the assessment_id and generates the svg file containing the
     report wheel snapshot and returns it's name to the calling function."""
 
-    context = {}
-
     filename = str(uuid.uuid4()) + ".svg"
 
     # Ensure uploads directory exists
     UPLOADS_DIR.mkdir(parents=True, exist_ok=True)
 
     assessment_qa: list[AssessmentQA] = assessment_service.get_all_qa(assessment_id=assessment_id, current_user=current_user)
-    context["wheel"] = assessment_service.prepare_wheel_context(assessment_qa)
-
-    template = jinja.env.get_template("wheel/wheel-report.svg")
-    content = template.render(context)
+    content = assessment_service.render_wheel(
+        assessment_qa=assessment_qa, template_name="wheel/wheel-report.svg"
+    )
 
     with open(UPLOADS_DIR / filename, "w") as file:
         file.write(content)
@@ -0,0 +1,146 @@
+"""Fingerprinted and precompressed static files.
+
+The build copies every file of app/static/{js,css,images} to
+STATIC_BUILD_DIR under a name carrying a hash of its content, e.g.
+js/htmx.min.js -> js/htmx.min.3f2a9c1b7d4e.js, and writes gzip and, with
+the brotli package installed, brotli variants of the text files next to it.
+manifest.json maps the source paths to the built ones.
+
+A changed file gets a new name, so the built files never change and are
+served with immutable caching, and templates link them through the
+static_url jinja global instead of url_for. Files of earlier builds are
+kept for STATIC_KEEP_SECONDS, pages rendered before a deployment still
+load their assets.
+
+The app builds on startup, unchanged files are skipped, so the expensive
+brotli compression only runs for new content. To build ahead of time:
+
+    python -m app.service.static_assets
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import time
+from pathlib import Path, PurePosixPath
+
+from jinja2 import pass_context
+
+from app.config import APP_ROOT, STATIC_BUILD_DIR
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+STATIC_SOURCE_DIR = APP_ROOT / "static"
+STATIC_DIRECTORIES = ("js", "css", "images")
+COMPRESSIBLE_SUFFIXES = {".js", ".css", ".svg", ".json", ".txt", ".map"}
+MANIFEST_NAME = "manifest.json"
+HASH_LENGTH = 12
+STATIC_KEEP_SECONDS = 7 * 24 * 60 * 60
+
+# Source path (js/htmx.min.js) -> built path (js/htmx.min.3f2a9c1b7d4e.js)
+manifest: dict[str, str] = {}
+
+
+def fingerprinted_name(relative: str, content: bytes) -> str:
+
+    path = PurePosixPath(relative)
+    digest = hashlib.sha256(content).hexdigest()[:HASH_LENGTH]
+    return str(path.with_name(f"{path.stem}.{digest}{path.suffix}"))
+
+
+def write_atomic(target: Path, content: bytes):
+    """Other app processes building at the same time never see half a file"""
+
+    target.parent.mkdir(parents=True, exist_ok=True)
+    temporary = target.with_name(f".{target.name}.{os.getpid()}.tmp")
+    temporary.write_bytes(content)
+    os.replace(temporary, target)
+
+
+def compressed_variants(content: bytes) -> dict[str, bytes]:
+    """Returns suffix -> compressed content, of the encodings making it smaller"""
+
+    variants = {".gz": gzip.compress(content, compresslevel=9, mtime=0)}
+    if brotli is not None:
+        variants[".br"] = brotli.compress(content, quality=11)
+
+    return {suffix: data for suffix, data in variants.items() if len(data) < len(content)}
+
+
+def build(source: Path = STATIC_SOURCE_DIR, output: Path = STATIC_BUILD_DIR) -> dict[str, str]:
+    """Builds the static files of <source> into <output>, returns and loads
+    the manifest"""
+
+    built: dict[str, str] = {}
+    written = 0
+
+    for directory in STATIC_DIRECTORIES:
+        for file in sorted((source / directory).rglob("*")):
+            if not file.is_file():
+                continue
+
+            relative = file.relative_to(source).as_posix()
+            content = file.read_bytes()
+            name = fingerprinted_name(relative, content)
+            built[relative] = name
+
+            target = output / name
+            if target.exists():
+                continue
+
+            if file.suffix in COMPRESSIBLE_SUFFIXES:
+                for suffix, data in compressed_variants(content).items():
+                    write_atomic(target.with_name(target.name + suffix), data)
+            # Written last, its presence marks the variants as done
+            write_atomic(target, content)
+            written += 1
+
+    write_atomic(output / MANIFEST_NAME, json.dumps(built, indent=2, sort_keys=True).encode())
+    prune(output=output, keep=set(built.values()))
+
+    print(f"Static files: {len(built)} in {output}, {written} built")
+
+    manifest.clear()
+    manifest.update(built)
+    return built
+
+
+def prune(output: Path, keep: set[str]):
+    """Deletes built files of earlier builds older than STATIC_KEEP_SECONDS"""
+
+    expired = time.time() - STATIC_KEEP_SECONDS
+    for directory in STATIC_DIRECTORIES:
+        for file in (output / directory).rglob("*"):
+            relative = file.relative_to(output).as_posix()
+            original = relative.removesuffix(".gz").removesuffix(".br")
+            if file.is_file() and original not in keep and file.stat().st_mtime < expired:
+                file.unlink(missing_ok=True)
+
+
+@pass_context
+def static_url(context, path: str) -> str:
+    """
+    Jinja global returning the url of static file <path>, e.g.
+    {{ static_url("js/htmx.min.js") }}.
+
+    Built files are served from /static under their fingerprinted name, files
+    missing in the manifest, e.g. before the first build, from their plain
+    /js, /css or /images url.
+    """
+
+    request = context["request"]
+    if path in manifest:
+        return str(request.url_for("static", path=manifest[path]))
+
+    directory, _, name = path.partition("/")
+    return str(request.url_for(directory, path=name))
+
+
+if __name__ == "__main__":
+
+    build()
@@ -3,7 +3,7 @@ from passlib import context
 import secrets
 import re
 from datetime import datetime, timedelta, timezone
-from app.config import DEFAULT_USER, DEFAULT_EMAIL, DEFAULT_PASSWORD
+from app.config import DASHBOARD_PAGE_SIZE, DEFAULT_USER, DEFAULT_EMAIL, DEFAULT_PASSWORD
 
 from app.data import user as data
 from app.exception.database import RecordNotFound
@@ -12,12 +12,12 @@ from app.exception.service import (
     IncorectCredentials,
     InvalidFormEntry,
     PasswordResetTokenExpired,
-    SendingEmailFailed,
     Unauthorized,
     SMTPCredentialsNotSet,
 )
 from app.service.authentication import get_password_hash
 from app.service.mail import notify_user_created, send_password_reset
+from app.model.pagination import Page, UserListQuery
 from app.model.user import (
     User,
     UserCreate,
@@ -144,6 +144,17 @@ def get_all(current_user: User) -> list[User]:
     return users
 
 
+def get_page(query: UserListQuery, current_user: User) -> Page[User]:
+
+    if (
+        current_user.role != UserRoleEnum.admin
+        and current_user.role != UserRoleEnum.coach
+    ):
+        raise Unauthorized(msg="You cannot list all users, insufficient rights")
+
+    return data.get_page(query=query, limit=DASHBOARD_PAGE_SIZE)
+
+
 def get_by_token(token: str) -> User:
 
     user = data.get_by_token(token=token)
@@ -261,8 +272,8 @@ def create_password_reset_token(email: str, request: Request) -> bool:
     try:
         send_password_reset(token_object=reset_token_object, request=request)
         return True
-    except SendingEmailFailed as e:
-        print(f"Failed sending password reset e-mail for: {email}.")
+    except SMTPCredentialsNotSet as e:
+        print(f"Failed sending password reset e-mail for: {email}. {e.msg}")
         return False
 
 
@@ -0,0 +1,266 @@
+"""Bulk import of users from a CSV or JSON file.
+
+The whole file is validated before anything is written, a single invalid
+row rejects the import with the errors of all rows. Valid imports run as a
+job on a background thread:
+
+1) passwords are hashed in a process pool
+2) all users are inserted in one transaction
+3) welcome e-mails are queued in the outbox at once, the outbox worker sends
+   them in batches over one SMTP session
+
+The dashboard polls the job for its progress. Jobs are kept in the memory of
+the process running them, the last KEEP_JOBS of them.
+"""
+
+import csv
+import io
+import json
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from uuid import uuid4
+
+from fastapi import Request
+from pydantic import ValidationError
+
+from app.config import PASSWORD_HASH_WORKERS
+from app.data import user as data
+from app.exception.database import RecordNotFound, UsernameOrEmailNotUnique
+from app.exception.service import (
+    InvalidFormEntry,
+    InvalidImportRows,
+    SMTPCredentialsNotSet,
+    Unauthorized,
+)
+from app.model.user import User
+from app.model.user_import import UserImportJob, UserImportRow, UserImportStatusEnum
+from app.service.authentication import pwd_context
+from app.service.mail import notify_users_created
+from app.service.password_pool import hash_passwords
+
+
+MAX_IMPORT_BYTES = 1024 * 1024
+MAX_IMPORT_ROWS = 1000
+IMPORT_FIELDS = ("username", "email", "password", "role")
+KEEP_JOBS = 20
+
+jobs: OrderedDict[str, UserImportJob] = OrderedDict()
+jobs_lock = threading.Lock()
+
+
+# -------------------------------
+#   Parsing and validation
+# -------------------------------
+
+
+def parse(content: bytes, filename: str) -> list[dict]:
+    """Returns rows of the CSV file, or objects of the JSON one, as dicts"""
+
+    if len(content) > MAX_IMPORT_BYTES:
+        raise InvalidFormEntry(
+            msg=f"File is too large. Import at most {MAX_IMPORT_BYTES // 1024} kB at once."
+        )
+
+    try:
+        text = content.decode("utf-8-sig")
+    except UnicodeDecodeError:
+        raise InvalidFormEntry(msg="File needs to be UTF-8 encoded.")
+
+    if filename.lower().endswith(".json") or text.lstrip().startswith("["):
+        try:
+            rows = json.loads(text)
+        except json.JSONDecodeError as e:
+            raise InvalidFormEntry(msg=f"Invalid JSON on line {e.lineno}: {e.msg}.")
+        if not isinstance(rows, list) or not all(isinstance(row, dict) for row in rows):
+            raise InvalidFormEntry(msg="JSON file needs to contain a list of users.")
+    else:
+        reader = csv.DictReader(io.StringIO(text))
+        if not reader.fieldnames:
+            raise InvalidFormEntry(msg="File is empty.")
+        reader.fieldnames = [name.strip().lower() for name in reader.fieldnames]
+        if not {"username", "email"} <= set(reader.fieldnames):
+            raise InvalidFormEntry(
+                msg="CSV file needs a header with username and email columns, password and role are optional."
+            )
+        rows = [
+            {key: value.strip() for key, value in row.items() if key in IMPORT_FIELDS and value is not None}
+            for row in reader
+        ]
+
+    if not rows:
+        raise InvalidFormEntry(msg="File contains no users.")
+    if len(rows) > MAX_IMPORT_ROWS:
+        raise InvalidFormEntry(
+            msg=f"File contains {len(rows)} users. Import at most {MAX_IMPORT_ROWS} at once."
+        )
+
+    return rows
+
+
+def validate(rows: list[dict], current_user: User) -> list[UserImportRow]:
+    """Returns the validated rows or raises InvalidImportRows with the errors
+    of all invalid ones"""
+
+    if not current_user.can_grant_roles():
+        raise Unauthorized(msg="You cannot create users")
+
+    errors: list[str] = []
+    valid: list[tuple[int, UserImportRow]] = []
+    seen_usernames: set[str] = set()
+    seen_emails: set[str] = set()
+
+    for number, row in enumerate(rows, start=1):
+        try:
+            user = UserImportRow.model_validate(
+                {key: value for key, value in row.items() if key in IMPORT_FIELDS}
+            )
+        except ValidationError as e:
+            for error in e.errors():
+                field = ".".join(str(loc) for loc in error["loc"])
+                errors.append(f"Row {number}, {field}: {error['msg']}")
+            continue
+
+        user.email = user.email.lower()
+
+        if not current_user.can_create_user(user):
+            errors.append(f"Row {number}: you cannot create users with role {user.role.value}.")
+        if user.username in seen_usernames:
+            errors.append(f"Row {number}: username {user.username} is in the file more than once.")
+        if user.email in seen_emails:
+            errors.append(f"Row {number}: e-mail {user.email} is in the file more than once.")
+
+        seen_usernames.add(user.username)
+        seen_emails.add(user.email)
+        valid.append((number, user))
+
+    taken_usernames, taken_emails = data.find_taken(
+        usernames=list(seen_usernames), emails=list(seen_emails)
+    )
+    for number, user in valid:
+        if user.username in taken_usernames:
+            errors.append(f"Row {number}: username {user.username} is already used.")
+        if user.email in taken_emails:
+            errors.append(f"Row {number}: e-mail {user.email} is already used.")
+
+    if errors:
+        raise InvalidImportRows(
+            msg=f"Found {len(errors)} problems in the file, no users were imported.",
+            errors=errors,
+        )
+
+    return [user for _, user in valid]
+
+
+# -------------------------------
+#   Jobs
+# -------------------------------
+
+
+def start(
+    content: bytes, filename: str, request: Request, current_user: User
+) -> UserImportJob:
+    """Validates the file and starts its import in the background"""
+
+    rows = validate(rows=parse(content=content, filename=filename), current_user=current_user)
+
+    job = UserImportJob(
+        job_id=str(uuid4()),
+        owner_id=str(current_user.user_id),
+        total=len(rows),
+        started_at=time.time(),
+    )
+
+    with jobs_lock:
+        jobs[job.job_id] = job
+        while len(jobs) > KEEP_JOBS:
+            oldest_id, oldest = next(iter(jobs.items()))
+            if oldest.running:
+                break
+            del jobs[oldest_id]
+
+    threading.Thread(
+        target=run,
+        kwargs={"job_id": job.job_id, "rows": rows, "request": request, "current_user": current_user},
+        name="user-import",
+        daemon=True,
+    ).start()
+
+    return get(job_id=job.job_id, current_user=current_user)
+
+
+def get(job_id: str, current_user: User) -> UserImportJob:
+
+    with jobs_lock:
+        job = jobs.get(job_id)
+        if job is None:
+            raise RecordNotFound(msg="Import was not found. It may have finished long ago.")
+        if job.owner_id != current_user.user_id:
+            raise Unauthorized(msg="You cannot see this import")
+        return job.model_copy()
+
+
+def update(job_id: str, **changes):
+
+    with jobs_lock:
+        job = jobs[job_id]
+        for field, value in changes.items():
+            setattr(job, field, value)
+
+
+def finish(job_id: str, status: UserImportStatusEnum, message: str):
+
+    update(job_id, status=status, message=message, finished_at=time.time())
+
+
+def run(job_id: str, rows: list[UserImportRow], request: Request, current_user: User):
+
+    created = 0
+
+    try:
+        # Same fallback for users without password as service.user.create,
+        # they set their own through the password reset
+        passwords = [row.password or secrets.token_urlsafe(128) for row in rows]
+        hashes = hash_passwords(
+            passwords=passwords,
+            context=pwd_context,
+            workers=PASSWORD_HASH_WORKERS,
+            on_progress=lambda hashed: update(job_id, hashed=hashed),
+        )
+
+        update(job_id, status=UserImportStatusEnum.inserting)
+        new_users = data.create_many(
+            [
+                User(
+                    user_id=str(uuid4()),
+                    username=row.username,
+                    email=row.email,
+                    hash=hash,
+                    role=row.role,
+                )
+                for row, hash in zip(rows, hashes)
+            ]
+        )
+        created = len(new_users)
+        update(job_id, created=created, status=UserImportStatusEnum.queueing)
+
+        try:
+            email_ids = notify_users_created(
+                new_users=new_users, request=request, current_user=current_user
+            )
+            update(job_id, emails_queued=len(email_ids))
+            message = f"{created} users created. Welcome e-mails are on their way."
+        except SMTPCredentialsNotSet as e:
+            message = f"{created} users created. {e.msg}"
+
+        finish(job_id, status=UserImportStatusEnum.done, message=message)
+    except UsernameOrEmailNotUnique as e:
+        finish(job_id, status=UserImportStatusEnum.failed, message=e.msg)
+    except Exception as e:
+        print(f"User import {job_id} failed: {e}")
+        if created:
+            message = f"{created} users created, but their welcome e-mails could not be queued."
+        else:
+            message = "Import failed, no users were created."
+        finish(job_id, status=UserImportStatusEnum.failed, message=message)
@@ -1,90 +1,115 @@
 class JwtManager {
     constructor() {
         this.expiryKey = "jwt_expiry_time";
-        this.checkIntervalMs = 60 * 1000; // 1 minute
-        this.renewThresholdSec = 180; // 3 minutes
-        this.intervalId = null;
+        this.expiryHeader = "X-Session-Expires";
+        this.renewBeforeSec = 60; // renew 1 minute before the session expires
+        this.jitterSec = 30; // spreads renewals of tabs opened at the same time
+        this.timerId = null;
     }
 
-    async init() {
-        let expiry = this.getStoredExpiry();
-        if (!expiry) {
-            expiry = await this.fetchTokenInfo();
-        }
-        if (expiry) {
-            this.storeExpiry(expiry);
-        }
+    init() {
+        // Server sends the session expiry with every authenticated response
+        // and renews the cookie itself when the session is about to expire
+        document.body.addEventListener("htmx:afterRequest", (event) => {
+            const xhr = event.detail.xhr;
+            if (xhr) {
+                this.updateExpiry(xhr.getResponseHeader(this.expiryHeader));
+            }
+        });
+
+        // Cookie is shared by all tabs, follow renewals done by the others
+        window.addEventListener("storage", (event) => {
+            if (event.key === this.expiryKey) {
+                this.schedule();
+            }
+        });
 
-        this.startMonitoring();
-        this.checkRenewalNow();
+        if (this.getStoredExpiry() > this.now()) {
+            this.schedule();
+        }
     }
 
-    startMonitoring() {
-        if (this.intervalId) clearInterval(this.intervalId);
+    now() {
+        return Math.floor(Date.now() / 1000);
+    }
 
-        this.intervalId = setInterval(async () => {
-            const expiry = this.getStoredExpiry();
-            if (!expiry) {
-                // Missing info → attempt re-fetch
-                await this.fetchTokenInfo();
-                return;
-            }
+    /**
+     * Store expiry timestamp (seconds) from the response header and
+     * reschedule the renewal when it changed.
+     * @param {string|null} value
+     */
+    updateExpiry(value) {
+        const expiry = parseInt(value, 10);
+        if (!expiry) return;
+        if (expiry === this.getStoredExpiry() && this.timerId) return;
 
-            const now = Math.floor(Date.now() / 1000);
-            if (expiry - now < this.renewThresholdSec) {
-                await this.fetchTokenInfo(true); // force renew
-            }
-        }, this.checkIntervalMs);
+        this.storeExpiry(expiry);
+        this.schedule();
     }
 
     /**
-     * Fetch token info (and renew if needed).
-     * @param {boolean} renew 
-     * @returns {number|null} expiry timestamp (seconds)
+     * Single timer firing shortly before the stored expiry, replaces
+     * polling of the token state.
      */
-    async fetchTokenInfo(renew = false) {
+    schedule() {
+        if (this.timerId) clearTimeout(this.timerId);
+        this.timerId = null;
+
+        const expiry = this.getStoredExpiry();
+        if (!expiry) return;
+
+        const jitter = Math.random() * this.jitterSec;
+        const delaySec = expiry - this.renewBeforeSec - jitter - this.now();
+        this.timerId = setTimeout(() => this.onTimer(), Math.max(delaySec, 0) * 1000);
+    }
+
+    async onTimer() {
+        this.timerId = null;
+
+        const remaining = this.getStoredExpiry() - this.now();
+        if (remaining <= 0) {
+            // Session is over, next request redirects to the login
+            return;
+        }
+        if (remaining > this.renewBeforeSec + this.jitterSec) {
+            // Another tab or request renewed the session meanwhile
+            this.schedule();
+            return;
+        }
+
+        await this.renew();
+    }
+
+    async renew() {
         const controller = new AbortController();
         const timeout = setTimeout(() => controller.abort(), 5000); // 5s timeout
 
         try {
-            const url = tokenCheckUrl + (renew ? "?renew=1" : "");
-            const resp = await fetch(url, {
+            const resp = await fetch(tokenRenewUrl, {
                 method: "GET",
                 signal: controller.signal,
             });
-            clearTimeout(timeout);
 
             if (!resp.ok) {
-                console.warn("Token check failed with status:", resp.status);
-                return null;
-            }
-
-            let data = null;
-            try {
-                data = await resp.json();
-            } catch (jsonErr) {
-                console.warn("Invalid or empty token response JSON");
-                return null;
+                console.warn("Session renewal failed with status:", resp.status);
+                return;
             }
 
-            if (data && typeof data.exp === "number") {
-                this.storeExpiry(data.exp);
-                this.checkRenewalNow(); // immediate re-check
-                return data.exp;
-            } else {
-                console.warn("Token response missing 'exp'");
+            const expiry = resp.headers.get(this.expiryHeader);
+            if (!expiry) {
+                console.warn("Session renewal response missing expiry");
+                return;
             }
+            this.updateExpiry(expiry);
         } catch (err) {
             if (err.name === "AbortError") {
-                console.warn("Token fetch request timed out");
+                console.warn("Session renewal request timed out");
             } else {
-                console.error("Error fetching token info:", err);
+                console.error("Error renewing session:", err);
             }
         } finally {
             clearTimeout(timeout);
         }
-
-        return null;
     }
 
     storeExpiry(expiry) {
@@ -95,14 +120,4 @@ class JwtManager {
         const val = localStorage.getItem(this.expiryKey);
         return val ? parseInt(val, 10) : null;
     }
-
-    async checkRenewalNow() {
-        const expiry = this.getStoredExpiry();
-        if (!expiry) return;
-        const now = Math.floor(Date.now() / 1000);
-        if (expiry - now < this.renewThresholdSec) {
-            await this.fetchTokenInfo(true);
-        }
-    }
 }
-
@@ -0,0 +1,18 @@
+// Saving an answer returns only the #wheel-segment-update element out of band
+// instead of the whole page. htmx can't swap the svg path itself, so the new
+// color is carried in data attributes and applied to the segment here.
+if (typeof window.isWheelSegmentUpdateLoaded !== "boolean") {
+    window.isWheelSegmentUpdateLoaded = true;
+
+    document.body.addEventListener("htmx:oobAfterSwap", () => {
+        const update = document.querySelector("#wheel-segment-update");
+        if (!update || !update.dataset.fill) return;
+
+        const segment = document.querySelector(
+            `.bat-interactive-circle .category-${update.dataset.category} .question-${update.dataset.question}`
+        );
+        if (segment) {
+            segment.setAttribute("fill", update.dataset.fill);
+        }
+    });
+}
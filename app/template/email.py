@@ -0,0 +1,146 @@
+"""Precompiled renderer of the e-mails.
+
+Every e-mail is the full email/index.html layout with its styles around a
+few sentences, and only the recipient specific fields (username, reset
+token, ...) differ between two e-mails of the same kind. Instead of running
+jinja for each recipient, every e-mail template is rendered once with
+placeholders in place of those fields into a frame, split at the
+placeholders. An e-mail is rendered by joining the frame chunks with the
+field values, escaped for the html part and as they are for the text part.
+
+Frames depend on the site url the links point to, so they are kept per
+e-mail and base url. Fields have to be output as they are by the templates,
+{{ username }} and not {{ username | upper }}, a filter would be applied to
+the placeholder instead of the value.
+"""
+
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable
+
+from markupsafe import escape
+
+from app.template.init import jinja
+
+
+# E-mail templates in jinja/email, with .html and .txt variants, and the
+# fields each of them fills per recipient
+EMAIL_FIELDS: dict[str, tuple[str, ...]] = {
+    "new-user": ("username",),
+    "set-password": ("username", "reset_token"),
+    "report-published": ("username", "report_name"),
+}
+
+# Control characters are left alone by the html escaping and never appear in
+# the templates themselves
+PLACEHOLDER = "\x1e{}\x1e"
+PLACEHOLDER_PATTERN = re.compile("\x1e(\\w+)\x1e")
+
+MAX_FRAMES = 32
+
+
+@dataclass(frozen=True)
+class RenderedEmail:
+    html: str
+    text: str
+
+
+class Frame:
+    """Rendered template split at the field placeholders. The e-mail is
+    chunks[0] + value of fields[0] + chunks[1] + ... + chunks[-1]."""
+
+    def __init__(self, rendered: str, fields: tuple[str, ...]):
+
+        self.chunks: list[str] = []
+        self.fields: list[str] = []
+
+        position = 0
+        for match in PLACEHOLDER_PATTERN.finditer(rendered):
+            if match[1] not in fields:
+                raise ValueError(f"Unknown e-mail field {match[1]}")
+            self.chunks.append(rendered[position : match.start()])
+            self.fields.append(match[1])
+            position = match.end()
+        self.chunks.append(rendered[position:])
+
+    def render(self, values: dict[str, str]) -> str:
+
+        parts: list[str] = [self.chunks[0]]
+        for field, chunk in zip(self.fields, self.chunks[1:]):
+            parts.append(values[field])
+            parts.append(chunk)
+
+        return "".join(parts)
+
+
+class EmailFrames:
+    """Html and text frames of one e-mail template for one base url"""
+
+    def __init__(self, name: str, url_for: Callable, base_url: str):
+
+        fields = EMAIL_FIELDS[name]
+        context = {
+            **{field: PLACEHOLDER.format(field) for field in fields},
+            "url_for": url_for,
+            "website_url": base_url,
+        }
+
+        self.name = name
+        self.fields = fields
+        self.html = Frame(jinja.env.get_template(f"email/{name}.html").render(context), fields)
+        self.text = Frame(jinja.env.get_template(f"email/{name}.txt").render(context), fields)
+
+    def render(self, **fields: str) -> RenderedEmail:
+
+        missing = set(self.fields) - fields.keys()
+        if missing:
+            raise ValueError(f"Missing fields {', '.join(sorted(missing))} of e-mail {self.name}")
+
+        values = {field: str(fields[field]) for field in self.fields}
+        escaped = {field: str(escape(value)) for field, value in values.items()}
+
+        return RenderedEmail(html=self.html.render(escaped), text=self.text.render(values))
+
+
+# (name, base url) -> frames, the least recently used dropped over MAX_FRAMES
+# as the base url follows the Host header of the request
+frames: OrderedDict[tuple[str, str], EmailFrames] = OrderedDict()
+frames_lock = threading.Lock()
+
+
+def get_frames(name: str, url_for: Callable, base_url: str) -> EmailFrames:
+
+    key = (name, base_url)
+    with frames_lock:
+        if key in frames:
+            frames.move_to_end(key)
+            return frames[key]
+
+    # Rendered outside the lock, two threads at worst build the same frames
+    email_frames = EmailFrames(name=name, url_for=url_for, base_url=base_url)
+
+    with frames_lock:
+        frames[key] = email_frames
+        while len(frames) > MAX_FRAMES:
+            frames.popitem(last=False)
+
+    return email_frames
+
+
+def render_email(name: str, url_for: Callable, base_url: str, **fields: str) -> RenderedEmail:
+    """
+    Renders e-mail template <name> with the recipient specific <fields>.
+
+    Parameters:
+    - name: E-mail template in jinja/email, without extension.
+    - url_for: Url builder of the links, usually request.url_for.
+    - base_url: Url of the site the links point to.
+    - fields: Values of the fields listed in EMAIL_FIELDS for the template.
+
+    Returns:
+    - Html and plain text version of the e-mail.
+    """
+
+    return get_frames(name=name, url_for=url_for, base_url=base_url).render(**fields)
@@ -1,9 +1,159 @@
-
+import time
+from dataclasses import dataclass
+from typing import Iterator
+from fastapi.responses import StreamingResponse
 from fastapi.templating import Jinja2Templates
+from jinja2 import FileSystemBytecodeCache, Template
+from jinja2.bccache import Bucket
 from pathlib import Path
 
+from app.config import TEMPLATE_CACHE_DIR
+from app.service.metrics import record_template
+from app.service.static_assets import static_url
+
 root_dir = Path(__file__).resolve().parent
 template_dir = root_dir / "jinja"
 
 
+class TimedTemplate(Template):
+    """Template reporting its render time to the metrics. Included and
+    extended templates are part of the time of the one rendering them."""
+
+    def render(self, *args, **kwargs) -> str:
+
+        start = time.perf_counter()
+        try:
+            return super().render(*args, **kwargs)
+        finally:
+            record_template(self.name, time.perf_counter() - start)
+
+    def generate(self, *args, **kwargs) -> Iterator[str]:
+        """Reports the time spent rendering, not the time the consumer took
+        between the chunks"""
+
+        seconds = 0.0
+        parts = super().generate(*args, **kwargs)
+        try:
+            while True:
+                start = time.perf_counter()
+                try:
+                    part = next(parts)
+                except StopIteration:
+                    return
+                finally:
+                    seconds += time.perf_counter() - start
+                yield part
+        finally:
+            parts.close()
+            record_template(self.name, seconds)
+
+
+class CountingBytecodeCache(FileSystemBytecodeCache):
+    """Bytecode cache counting the templates it loaded and the ones compiled
+    because their bytecode was missing or outdated. Jinja checks the source
+    checksum of every entry, a changed template is compiled again."""
+
+    def __init__(self, directory: Path):
+
+        directory.mkdir(parents=True, exist_ok=True)
+        super().__init__(directory=str(directory))
+        self.loaded = 0
+        self.compiled = 0
+
+    def load_bytecode(self, bucket: Bucket):
+
+        super().load_bytecode(bucket)
+        if bucket.code is not None:
+            self.loaded += 1
+
+    def dump_bytecode(self, bucket: Bucket):
+
+        self.compiled += 1
+        super().dump_bytecode(bucket)
+
+
+@dataclass
+class WarmupStats:
+    templates: int
+    loaded: int
+    compiled: int
+    seconds: float
+
+
 jinja = Jinja2Templates(directory=str(template_dir))
+jinja.env.template_class = TimedTemplate
+jinja.env.globals["static_url"] = static_url
+
+bytecode_cache = CountingBytecodeCache(TEMPLATE_CACHE_DIR) if TEMPLATE_CACHE_DIR else None
+jinja.env.bytecode_cache = bytecode_cache
+
+
+# Rendered html is sent in chunks of about this many bytes, the first one
+# carries the head of the page with the styles and scripts
+STREAM_CHUNK_SIZE = 4096
+
+
+def chunked(parts: Iterator[str], size: int) -> Iterator[bytes]:
+    """Joins the many small strings jinja generates into chunks of <size>
+    characters or more"""
+
+    buffer: list[str] = []
+    length = 0
+    for part in parts:
+        buffer.append(part)
+        length += len(part)
+        if length >= size:
+            yield "".join(buffer).encode()
+            buffer = []
+            length = 0
+
+    if buffer:
+        yield "".join(buffer).encode()
+
+
+def stream_template(
+    name: str,
+    context: dict,
+    status_code: int = 200,
+    headers: dict[str, str] | None = None,
+) -> StreamingResponse:
+    """
+    Response sending template <name> while it renders, instead of rendering
+    all of it first like jinja.TemplateResponse. Meant for the pages of long
+    lists; read the items before, a database connection held while the
+    client downloads the page is unavailable to other requests.
+
+    The status and headers are sent with the first chunk, errors while
+    rendering can only cut the response short.
+    """
+
+    template = jinja.env.get_template(name)
+    return StreamingResponse(
+        chunked(template.generate(context), size=STREAM_CHUNK_SIZE),
+        status_code=status_code,
+        headers=headers,
+        media_type="text/html",
+    )
+
+
+def warm_up() -> WarmupStats:
+    """Loads every template in jinja/, so no request waits for one to compile"""
+
+    loaded = bytecode_cache.loaded if bytecode_cache else 0
+    compiled = bytecode_cache.compiled if bytecode_cache else 0
+
+    start = time.perf_counter()
+    names = jinja.env.list_templates()
+    for name in names:
+        jinja.env.get_template(name)
+    seconds = time.perf_counter() - start
+
+    if bytecode_cache is None:
+        return WarmupStats(templates=len(names), loaded=0, compiled=len(names), seconds=seconds)
+
+    return WarmupStats(
+        templates=len(names),
+        loaded=bytecode_cache.loaded - loaded,
+        compiled=bytecode_cache.compiled - compiled,
+        seconds=seconds,
+    )
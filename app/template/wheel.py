@@ -0,0 +1,143 @@
+"""Precompiled renderer of the assessment wheel.
+
+The wheel templates in jinja/wheel are ~28 KB of static svg paths with 52
+fills, 13 category labels and a few links in between. Instead of running
+them through jinja on every request, each template is split once into its
+static chunks and the slots between them, and a wheel is rendered by joining
+the chunks with the slot values. Rendered wheels are memoized, so a page
+reload with unchanged answers is a dictionary lookup.
+"""
+
+import re
+from functools import cache, lru_cache
+
+from markupsafe import Markup, escape
+
+from app.template.init import template_dir
+
+
+COMMENT = re.compile(r"\{#.*?#\}", re.DOTALL)
+SLOT = re.compile(
+    r"\{\{\s*(?P<expression>.*?)\s*\}\}"
+    r"|\{%\s*if current_question and current_question\.category_order == (?P<active>\d+)\s*%\}"
+    r"active\{%\s*endif\s*%\}"
+)
+FILL_SLOT = re.compile(r"wheel\.category_(\d{2})_question_(\d)")
+LABEL_SLOT = re.compile(r"wheel\.category_name_(\d{2})")
+ORDER_SLOT = re.compile(r"wheel\.category_(\d{2})_order")
+BASE_URL_SLOT = re.compile(r"url_for\(\"\w+\"\)")
+
+
+class WheelTemplate:
+    """Wheel svg template split into static chunks and slots. The rendered
+    wheel is chunks[0] + value of slots[0] + chunks[1] + ... + chunks[-1]."""
+
+    def __init__(self, name: str, source: str):
+
+        self.name = name
+        self.chunks: list[str] = []
+        self.slots: list[tuple] = []
+
+        # Same output as jinja, which drops comments and the trailing newline
+        source = COMMENT.sub("", source).removesuffix("\n")
+
+        position = 0
+        for match in SLOT.finditer(source):
+            self.chunks.append(source[position : match.start()])
+            self.slots.append(self.parse_slot(match))
+            position = match.end()
+        self.chunks.append(source[position:])
+
+    def parse_slot(self, match: re.Match) -> tuple:
+
+        if match["active"] is not None:
+            return ("active", int(match["active"]))
+
+        expression = match["expression"]
+        if fill := FILL_SLOT.fullmatch(expression):
+            return ("fill", int(fill[1]), int(fill[2]))
+        if label := LABEL_SLOT.fullmatch(expression):
+            return ("label", int(label[1]))
+        if order := ORDER_SLOT.fullmatch(expression):
+            return ("order", int(order[1]))
+        if expression == "wheel.assessment_id":
+            return ("assessment_id",)
+        if BASE_URL_SLOT.fullmatch(expression):
+            return ("base_url",)
+
+        raise ValueError(f"Unsupported expression {{{{ {expression} }}}} in {self.name}")
+
+    def render(
+        self,
+        assessment_id: str,
+        fills: dict[tuple[int, int], str],
+        labels: dict[int, str],
+        active_category: int | None,
+        base_url: str,
+    ) -> str:
+
+        assessment_id = str(escape(assessment_id))
+        base_url = str(escape(base_url))
+
+        parts: list[str] = [self.chunks[0]]
+        for slot, chunk in zip(self.slots, self.chunks[1:]):
+            match slot:
+                case ("fill", category_order, question_order):
+                    parts.append(fills.get((category_order, question_order), ""))
+                case ("label", category_order):
+                    parts.append(str(escape(labels.get(category_order, ""))))
+                case ("order", category_order):
+                    parts.append(str(category_order) if category_order in labels else "")
+                case ("active", category_order):
+                    parts.append("active" if category_order == active_category else "")
+                case ("assessment_id",):
+                    parts.append(assessment_id)
+                case ("base_url",):
+                    parts.append(base_url)
+            parts.append(chunk)
+
+        return "".join(parts)
+
+
+@cache
+def get_wheel_template(name: str) -> WheelTemplate:
+
+    source = (template_dir / name).read_text()
+    return WheelTemplate(name=name, source=source)
+
+
+def warm_up() -> int:
+    """Splits every wheel template in jinja/wheel, returns their number"""
+
+    names = [
+        path.relative_to(template_dir).as_posix()
+        for path in sorted((template_dir / "wheel").glob("*.svg"))
+    ]
+    for name in names:
+        get_wheel_template(name)
+    return len(names)
+
+
+@lru_cache(maxsize=256)
+def render_wheel(
+    name: str,
+    assessment_id: str,
+    fills: tuple[tuple[int, int, str], ...],
+    labels: tuple[tuple[int, str], ...],
+    active_category: int | None = None,
+    base_url: str = "",
+) -> Markup:
+    """Renders wheel template <name>. Fills are (category_order,
+    question_order, color) and labels (category_order, category_name) tuples,
+    so the arguments are hashable and identical wheels are served from the
+    cache."""
+
+    template = get_wheel_template(name)
+    content = template.render(
+        assessment_id=assessment_id,
+        fills={(category, question): color for category, question, color in fills},
+        labels=dict(labels),
+        active_category=active_category,
+        base_url=base_url,
+    )
+    return Markup(content)
@@ -52,7 +52,7 @@ def get_assessment_edit(assessment_id: str, request:Request, current_user: User
         assessment_qa: list[AssessmentQA] = service.get_all_qa(assessment_id=assessment_id, current_user=current_user)
         context["title"] = f"{assessment_qa[0].assessment_name}"
         context["assessment_qa"] = assessment_qa
-        context["wheel"] = service.prepare_wheel_context(assessment_qa=assessment_qa)
+        context["wheel"] = service.render_wheel(assessment_qa=assessment_qa, template_name="wheel/wheel-app.svg", base_url=str(request.url_for("app_assessments_page")))
     except:
         # NotImplemented
         raise
@@ -83,7 +83,7 @@ def get_answer_question_page(assessment_id: str, category_order: int, question_o
         context["assessment_qa"] = assessment_qa
         context["title"] = f"{assessment_qa[0].assessment_name}"
         context["current_question"] = current_question
-        context["wheel"] = service.prepare_wheel_context(assessment_qa=assessment_qa)
+        context["wheel"] = service.render_wheel(assessment_qa=assessment_qa, template_name="wheel/wheel-app.svg", current_question=current_question, base_url=str(request.url_for("app_assessments_page")))
         context["previous_question"] = previous_question
         context["next_question"] = next_question
     except:
@@ -110,22 +110,17 @@ def post_answer_question_page(answer_data: AssessmentAnswerPost, assessment_id:
 
     try:
         service.save_answer(answer_data=answer_data, current_user=current_user)
-        assessment_qa: list[AssessmentQA] = service.get_all_qa(assessment_id=assessment_id, current_user=current_user)
-        current_question: AssessmentQA = service.filter_assessment_qa_by_category_order_and_question_id(assessment_qa=assessment_qa, category_order=category_order, question_order=question_order)
-        previous_question, next_question = service.get_neighbouring_questions(assessment_qa=assessment_qa, category_order=category_order, question_order=question_order)
-
-        context["assessment_qa"] = assessment_qa
-        context["title"] = f"{assessment_qa[0].assessment_name}"
-        context["current_question"] = current_question
-        context["wheel"] = service.prepare_wheel_context(assessment_qa=assessment_qa)
-        context["previous_question"] = previous_question
-        context["next_question"] = next_question
+        # Only the saved segment of the wheel changes, so the response is just
+        # its new color instead of the whole page
+        context["category_order"] = category_order
+        context["question_order"] = question_order
+        context["fill"] = service.answer_color(answer_option=answer_data.answer_option)
     except:
         # NotImplemented
         raise
 
     response = jinja.TemplateResponse(
-            name="app/assessment-answer-question.html",
+            name="helpers/wheel-segment-update.html",
             context=context
             )
 
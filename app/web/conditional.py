@@ -0,0 +1,60 @@
+import hashlib
+import json
+from functools import lru_cache
+
+from fastapi import Request, Response
+
+from app.model.user import User
+from app.service import static_assets
+from app.template.init import template_dir
+from app.web.middleware import etag_matches
+
+
+@lru_cache(maxsize=1)
+def release_digest() -> str:
+    """Hash of the templates and static files, pages rendered by another
+    release of the app never match"""
+
+    digest = hashlib.blake2b(digest_size=8)
+    for template in sorted(template_dir.rglob("*")):
+        if template.is_file():
+            digest.update(str(template.relative_to(template_dir)).encode())
+            digest.update(template.read_bytes())
+    digest.update(json.dumps(static_assets.manifest, sort_keys=True).encode())
+    return digest.hexdigest()
+
+
+def version_etag(request: Request, current_user: User, version: int) -> str:
+    """
+    ETag of a page rendered from nothing but the assessment of <version>, the
+    url and the user, known before rendering the page.
+
+    The user is part of it as the pages show its name and differ by role, the
+    HX-Request header as htmx gets the fragment and the browser the full page.
+    """
+
+    page = "\n".join(
+        (
+            str(request.url),
+            request.headers.get("HX-Request", ""),
+            str(current_user.user_id),
+            str(current_user.username),
+            str(current_user.role),
+            release_digest(),
+        )
+    )
+    return f'"v{version}-{hashlib.blake2b(page.encode(), digest_size=8).hexdigest()}"'
+
+
+def not_modified(request: Request, etag: str) -> Response | None:
+    """304 response when the client holds the page of <etag>, otherwise None"""
+
+    if_none_match = request.headers.get("If-None-Match")
+    if if_none_match and etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=etag_headers(etag))
+    return None
+
+
+def etag_headers(etag: str) -> dict[str, str]:
+
+    return {"ETag": etag, "Cache-Control": "private, no-cache"}
@@ -1,5 +1,5 @@
-from fastapi import APIRouter, Depends, Form, Request
-from fastapi.responses import HTMLResponse
+from fastapi import APIRouter, Depends, Form, Query, Request
+from fastapi.responses import HTMLResponse, StreamingResponse
 from typing import Annotated
 import json
 
@@ -7,15 +7,20 @@ from app.data.note import get_note
 from app.exception.service import EndpointDataMismatch, Unauthorized
 from app.model.assesment import (
     AssessmentAnswerPost,
+    AssessmentBatchPost,
     AssessmentChown,
     AssessmentNote,
     AssessmentPost,
     AssessmentQA,
 )
-from app.template.init import jinja
+from app.model.pagination import AssessmentListQuery
+from app.template.init import jinja, stream_template
 from app.model.user import User
 from app.model.notification import Notification
 from app.service.authentication import user_htmx_dep
+from app.web.conditional import etag_headers, not_modified, version_etag
+from app.web.dashboard.cursor import checked_query
+from app.web.pagination import next_page_url
 
 import app.service.user as user_service
 import app.service.assessment as service
@@ -26,25 +31,55 @@ router = APIRouter()
 
 
 @router.get("", response_class=HTMLResponse, name="dashboard_assessments_page")
-def get_assessments(request: Request, current_user: User = Depends(user_htmx_dep)):
+def get_assessments(
+    request: Request,
+    query: Annotated[AssessmentListQuery, Query()],
+    current_user: User = Depends(user_htmx_dep),
+):
 
-    try:
-        assessments = service.get_all(current_user=current_user)
-    except:
-        # NotImplemented
-        raise
+    return assessments_page_response(
+        request=request, query=query, current_user=current_user
+    )
+
+
+def assessments_page_response(
+    request: Request,
+    query: AssessmentListQuery,
+    current_user: User,
+    extra_notification: Notification | None = None,
+) -> StreamingResponse:
+    """Streams the assessments page, or only the cells of the next page when
+    <query> has a cursor, those are loaded by infinite scroll. The page is
+    read before the response starts, only the rendering is streamed."""
+
+    query, cursor_notification = checked_query(request=request, query=query)
+    extra_notification = extra_notification or cursor_notification
+
+    assessments_page = service.get_page(query=query, current_user=current_user)
 
     context = {
         "request": request,
         "title": "Assessments",
         "description": "List of all available assessments.",
         "current_user": current_user,
-        "assessments": assessments,
+        "assessments": assessments_page.items,
+        "query": query,
+        "next_page_url": next_page_url(
+            request=request,
+            route_name="dashboard_assessments_page",
+            query=query,
+            next_cursor=assessments_page.next_cursor,
+        ),
     }
 
-    response = jinja.TemplateResponse(
-        name="dashboard/assessments.html", context=context
-    )
+    if extra_notification:
+        context["notification"] = extra_notification
+
+    template_name = "dashboard/assessments.html"
+    if query.cursor:
+        template_name = "dashboard/assessments-page.html"
+
+    response = stream_template(name=template_name, context=context)
 
     return response
 
@@ -58,25 +93,14 @@ def put_assessments_chown(
 
     try:
         service.chown(assessment_chown=assessment_chown, current_user=current_user)
-        assessments = service.get_all(current_user=current_user)
     except:
         # NotImplemented
         raise
 
-    context = {
-        "request": request,
-        "title": "Assessments",
-        "description": "List of all available assessments.",
-        "current_user": current_user,
-        "assessments": assessments,
-    }
-
-    response = jinja.TemplateResponse(
-        name="dashboard/assessments.html", context=context
+    return assessments_page_response(
+        request=request, query=AssessmentListQuery(), current_user=current_user
     )
 
-    return response
-
 
 @router.get(
     "/create", response_class=HTMLResponse, name="dashboard_assessment_create_page"
@@ -141,6 +165,44 @@ def post_assessment_create(
     return response
 
 
+@router.post(
+    "/create/batch",
+    response_class=HTMLResponse,
+    name="dashboard_assessment_create_batch",
+)
+def post_assessment_create_batch(
+    assessment_batch: AssessmentBatchPost,
+    request: Request,
+    current_user: User = Depends(user_htmx_dep),
+):
+
+    context = {
+        "request": request,
+        "title": "Create Assessment",
+        "description": "Create new assessment.",
+        "current_user": current_user,
+    }
+
+    try:
+        created_assessments = service.create_assessments(
+            assessment_batch=assessment_batch, current_user=current_user
+        )
+        context["notification"] = Notification(
+            style="success",
+            content=f"{len(created_assessments)} assessments {assessment_batch.assessment_name} successfully created.",
+        )
+        context["users"] = user_service.get_all(current_user=current_user)
+    except:
+        # NotImplemented
+        raise
+
+    response = jinja.TemplateResponse(
+        name="dashboard/assessment-create.html", context=context
+    )
+
+    return response
+
+
 @router.get(
     "/edit/{assessment_id}",
     response_class=HTMLResponse,
@@ -163,7 +225,11 @@ def get_assessment_edit(
         )
         context["title"] = f"{assessment_qa[0].assessment_name}"
         context["assessment_qa"] = assessment_qa
-        context["wheel"] = service.prepare_wheel_context(assessment_qa=assessment_qa)
+        context["wheel"] = service.render_wheel(
+            assessment_qa=assessment_qa,
+            template_name="wheel/wheel.svg",
+            base_url=str(request.url_for("dashboard_assessments_page")),
+        )
     except:
         # NotImplemented
         raise
@@ -216,7 +282,12 @@ def get_answer_question_page(
         context["assessment_qa"] = assessment_qa
         context["title"] = f"{assessment_qa[0].assessment_name}"
         context["current_question"] = current_question
-        context["wheel"] = service.prepare_wheel_context(assessment_qa=assessment_qa)
+        context["wheel"] = service.render_wheel(
+            assessment_qa=assessment_qa,
+            template_name="wheel/wheel.svg",
+            current_question=current_question,
+            base_url=str(request.url_for("dashboard_assessments_page")),
+        )
         context["previous_question"] = previous_question
         context["next_question"] = next_question
     except:
@@ -252,34 +323,17 @@ def post_answer_question_page(
 
     try:
         service.save_answer(answer_data=answer_data, current_user=current_user)
-        assessment_qa: list[AssessmentQA] = service.get_all_qa(
-            assessment_id=assessment_id, current_user=current_user
-        )
-        current_question: AssessmentQA = (
-            service.filter_assessment_qa_by_category_order_and_question_id(
-                assessment_qa=assessment_qa,
-                category_order=category_order,
-                question_order=question_order,
-            )
-        )
-        previous_question, next_question = service.get_neighbouring_questions(
-            assessment_qa=assessment_qa,
-            category_order=category_order,
-            question_order=question_order,
-        )
-
-        context["assessment_qa"] = assessment_qa
-        context["title"] = f"{assessment_qa[0].assessment_name}"
-        context["current_question"] = current_question
-        context["wheel"] = service.prepare_wheel_context(assessment_qa=assessment_qa)
-        context["previous_question"] = previous_question
-        context["next_question"] = next_question
+        # Only the saved segment of the wheel changes, so the response is just
+        # its new color instead of the whole page
+        context["category_order"] = category_order
+        context["question_order"] = question_order
+        context["fill"] = service.answer_color(answer_option=answer_data.answer_option)
     except:
         # NotImplemented
         raise
 
     response = jinja.TemplateResponse(
-        name="dashboard/assessment-answer-question.html", context=context
+        name="helpers/wheel-segment-update.html", context=context
     )
 
     return response
@@ -307,15 +361,29 @@ def get_answer_question_review_page(
             assessment_id=assessment_id, current_user=current_user
         )
 
+        # Nothing else goes into the page, an unchanged version means an
+        # unchanged page
+        etag = version_etag(
+            request=request, current_user=current_user, version=assessment_qa[0].version
+        )
+        if (response := not_modified(request=request, etag=etag)) is not None:
+            return response
+
         context["assessment_qa"] = assessment_qa
         context["title"] = f"{assessment_qa[0].assessment_name}"
-        context["wheel"] = service.prepare_wheel_context(assessment_qa=assessment_qa)
+        context["wheel"] = service.render_wheel(
+            assessment_qa=assessment_qa,
+            template_name="wheel/wheel-review.svg",
+            base_url=str(request.url_for("dashboard_assessments_page")),
+        )
     except:
         # NotImplemented
         raise
 
     response = jinja.TemplateResponse(
-        name="dashboard/assessment-review.html", context=context
+        name="dashboard/assessment-review.html",
+        context=context,
+        headers=etag_headers(etag),
     )
 
     return response
@@ -359,6 +427,13 @@ def get_answer_question_category_review_page(
             current_user=current_user,
         )
 
+        # Notes bump the version as well, the page is unchanged with it
+        etag = version_etag(
+            request=request, current_user=current_user, version=assessment_qa[0].version
+        )
+        if (response := not_modified(request=request, etag=etag)) is not None:
+            return response
+
         previous_category, next_category = service.get_neighbouring_categories_number(
             category_order=category_order
         )
@@ -374,7 +449,9 @@ def get_answer_question_category_review_page(
         raise
 
     response = jinja.TemplateResponse(
-        name="dashboard/assessment-category-review.html", context=context
+        name="dashboard/assessment-category-review.html",
+        context=context,
+        headers=etag_headers(etag),
     )
 
     return response
@@ -483,31 +560,22 @@ def delete_assessment(
         deleted_assessment = service.delete_assessment(
             assessment_id=assessment_id, current_user=current_user
         )
-        assessments = service.get_all(current_user=current_user)
     except:
         # NotImplemented
         raise
 
-    context = {
-        "request": request,
-        "title": "Assessment",
-        "description": "Assessment detail page.",
-        "current_user": current_user,
-        "assessment": delete_assessment,
-        "assessments": assessments,
-    }
-
-    context["notification"] = Notification(
+    notification = Notification(
         style="success",
         content=f"Assessment {deleted_assessment.assessment_name} removed!",
     )
 
-    response = jinja.TemplateResponse(
-        name="dashboard/assessments.html", context=context
+    return assessments_page_response(
+        request=request,
+        query=AssessmentListQuery(),
+        current_user=current_user,
+        extra_notification=notification,
     )
 
-    return response
-
 
 @router.get(
     "/chown/{assessment_id}",
@@ -596,4 +664,6 @@ def put_assessment_rename_for(
     except Unauthorized as e:
         raise e
 
-    return get_assessments(request=request, current_user=current_user)
+    return assessments_page_response(
+        request=request, query=AssessmentListQuery(), current_user=current_user
+    )
@@ -0,0 +1,36 @@
+from typing import TypeVar
+
+from fastapi import HTTPException, Request
+
+from app.data.pagination import decode_cursor
+from app.exception.database import InvalidCursor
+from app.model.notification import Notification
+from app.model.pagination import ListQuery
+
+
+Q = TypeVar("Q", bound=ListQuery)
+
+
+def checked_query(request: Request, query: Q) -> tuple[Q, Notification | None]:
+    """
+    Returns <query> and None when its cursor is valid or there is none.
+
+    An invalid cursor, e.g. of an edited or outdated url, starts the list over
+    at the first page: returns <query> without the cursor and a notification
+    telling why. Infinite scroll requests of htmx get a 400 instead, htmx
+    does not swap it and the rows already loaded stay in place.
+    """
+
+    if query.cursor is None:
+        return query, None
+
+    try:
+        decode_cursor(query.cursor)
+    except InvalidCursor as e:
+        if request.headers.get("HX-Request"):
+            raise HTTPException(status_code=400, detail=e.msg)
+
+        first_page = query.model_copy(update={"cursor": None})
+        return first_page, Notification(style="warning", content=e.msg)
+
+    return query, None
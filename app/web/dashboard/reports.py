@@ -1,7 +1,8 @@
-from fastapi import APIRouter, Depends, Request
-from fastapi.responses import HTMLResponse
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import HTMLResponse, StreamingResponse
+from typing import Annotated
 
-from app.exception.service import SendingEmailFailed, Unauthorized
+from app.exception.service import SMTPCredentialsNotSet, Unauthorized
 from app.service import report as service
 from app.service import assessment as assessment_service
 from app.service import note as note_service
@@ -9,12 +10,15 @@ from app.service import mail as mail_service
 
 from app.model.report import ReportCreate, ReportExtended, ReportUpdate
 from app.model.notification import Notification
+from app.model.pagination import Page, ReportListQuery
 from app.model.user import User
 from app.model.assesment import Assessment
 
-from app.template.init import jinja
+from app.template.init import jinja, stream_template
 
 from app.service.authentication import user_htmx_dep
+from app.web.dashboard.cursor import checked_query
+from app.web.pagination import next_page_url
 
 
 router = APIRouter()
@@ -23,40 +27,57 @@ router = APIRouter()
 @router.get("", response_class=HTMLResponse, name="dashboard_reports_page")
 def get_reports(
     request: Request,
-    assessment_filter: str | None = None,
+    query: Annotated[ReportListQuery, Query()],
     current_user: User = Depends(user_htmx_dep),
-    extra_notification=None,
 ):
 
-    reports_extended: list[ReportExtended] = service.get_all_extended(
-        current_user=current_user
-    )
-    assessments: list[Assessment] = assessment_service.get_all(
-        current_user=current_user
+    return reports_page_response(
+        request=request, query=query, current_user=current_user
     )
 
-    if assessment_filter:
-        reports_filtered = list(
-            filter(
-                lambda report: report.assessment_id == assessment_filter,
-                reports_extended,
-            )
-        )
-        reports_extended = reports_filtered
+
+def reports_page_response(
+    request: Request,
+    query: ReportListQuery,
+    current_user: User,
+    extra_notification: Notification | None = None,
+) -> StreamingResponse:
+    """Streams the reports page, or only the cells of the next page when
+    <query> has a cursor, those are loaded by infinite scroll. The page is
+    read before the response starts, only the rendering is streamed."""
+
+    query, cursor_notification = checked_query(request=request, query=query)
+    extra_notification = extra_notification or cursor_notification
+
+    reports_page: Page[ReportExtended] = service.get_all_extended(
+        query=query, current_user=current_user
+    )
 
     context = {
         "request": request,
         "title": "Reports",
         "description": "List of all available reports.",
         "current_user": current_user,
-        "reports": reports_extended,
-        "assessments": assessments,
+        "reports": reports_page.items,
+        "query": query,
+        "next_page_url": next_page_url(
+            request=request,
+            route_name="dashboard_reports_page",
+            query=query,
+            next_cursor=reports_page.next_cursor,
+        ),
     }
 
+    if query.cursor:
+        return stream_template(context=context, name="dashboard/reports-page.html")
+
+    # Only tells whether there are any assessments to create reports for
+    context["any_assessments"] = assessment_service.any_exist(current_user=current_user)
+
     if extra_notification:
-        context.update(extra_notification)
+        context["notification"] = extra_notification
 
-    response = jinja.TemplateResponse(context=context, name="dashboard/reports.html")
+    response = stream_template(context=context, name="dashboard/reports.html")
 
     return response
 
@@ -208,8 +229,8 @@ def patch_report_publish_status(
         report = service.publish_report(
             report_id=report_id, public=public, current_user=current_user
         )
-        report_extended = service.extend_report(
-            report=report, current_user=current_user
+        report_extended = service.get_report_extended(
+            report_id=report.report_id, current_user=current_user
         )
     except Unauthorized as e:
         # NotImplemented
@@ -239,25 +260,9 @@ def delete_report(
         # NotImplemented
         raise
 
-    reports_extended: list[ReportExtended] = service.get_all_extended(
-        current_user=current_user
+    return reports_page_response(
+        request=request, query=ReportListQuery(), current_user=current_user
     )
-    assessments: list[Assessment] = assessment_service.get_all(
-        current_user=current_user
-    )
-
-    context = {
-        "request": request,
-        "title": "Reports",
-        "description": "List of all available reports.",
-        "current_user": current_user,
-        "reports": reports_extended,
-        "assessments": assessments,
-    }
-
-    response = jinja.TemplateResponse(context=context, name="dashboard/reports.html")
-
-    return response
 
 
 @router.get(
@@ -309,17 +314,14 @@ def get_report_notify_user(
         )
         notification = Notification(
             style="success",
-            content=f"User: {report_extended.assessment_owner} was notified about the report.",
-        )
-    except SendingEmailFailed as e:
-        notification = Notification(
-            style="danger",
-            content=f"There was an error sending the e-mail. Check your mailserver credentials.",
+            content=f"E-mail about the report is on its way to user: {report_extended.assessment_owner}.",
         )
+    except SMTPCredentialsNotSet as e:
+        notification = Notification(style="danger", content=e.msg)
 
-    return get_reports(
+    return reports_page_response(
         request=request,
-        assessment_filter=assessment_filter,
+        query=ReportListQuery(assessment_filter=assessment_filter),
         current_user=current_user,
         extra_notification=notification,
     )
@@ -1,21 +1,27 @@
-from fastapi import APIRouter, Request, Depends, HTTPException, Response
+from fastapi import APIRouter, Request, Depends, HTTPException, Query, Response, UploadFile
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import HTMLResponse
 from sqlite3 import IntegrityError
+from typing import Annotated
 
 from app.exception.database import RecordNotFound, UsernameOrEmailNotUnique
 from app.exception.service import SMTPCredentialsNotSet
 from app.exception.service import (
     EndpointDataMismatch,
     InvalidFormEntry,
-    SendingEmailFailed,
+    InvalidImportRows,
     Unauthorized,
 )
 from app.model.user import User, UserCreate, UserUpdate
 from app.model.notification import Notification
+from app.model.pagination import UserListQuery
 from app.config import SMTP_ENABLED
 from app.template.init import jinja
 from app.service.authentication import user_htmx_dep
 import app.service.user as service
+import app.service.user_import as import_service
+from app.web.dashboard.cursor import checked_query
+from app.web.pagination import next_page_url
 
 
 router = APIRouter()
@@ -26,22 +32,49 @@ router = APIRouter()
 
 
 @router.get("", response_class=HTMLResponse, name="dashboard_users_page")
-def get_users(request: Request, current_user: User = Depends(user_htmx_dep)):
-
-    users = service.get_all(current_user)
+def get_users(
+    request: Request,
+    query: Annotated[UserListQuery, Query()],
+    current_user: User = Depends(user_htmx_dep),
+):
 
     context = {
         "request": request,
         "title": "Users",
         "description": "List of users and their details.",
         "current_user": current_user,
-        "users": users,
     }
 
-    template_response = jinja.TemplateResponse(
-        name="dashboard/users.html", context=context
+    return users_page_response(context=context, query=query, current_user=current_user)
+
+
+def users_page_response(
+    context: dict, query: UserListQuery, current_user: User
+) -> HTMLResponse:
+    """Renders the users page into <context>, or only the rows of the next
+    page when <query> has a cursor, those are loaded by infinite scroll."""
+
+    query, cursor_notification = checked_query(request=context["request"], query=query)
+    if cursor_notification:
+        context["notification"] = cursor_notification
+
+    users_page = service.get_page(query=query, current_user=current_user)
+
+    context["users"] = users_page.items
+    context["query"] = query
+    context["next_page_url"] = next_page_url(
+        request=context["request"],
+        route_name="dashboard_users_page",
+        query=query,
+        next_cursor=users_page.next_cursor,
     )
 
+    template_name = "dashboard/users.html"
+    if query.cursor:
+        template_name = "dashboard/users-page.html"
+
+    template_response = jinja.TemplateResponse(name=template_name, context=context)
+
     return template_response
 
 
@@ -89,14 +122,6 @@ async def add_user_post(
             style="warning",
             content=e.msg,
         )
-    except SendingEmailFailed as e:
-        created_user = service.get_by_email(
-            email=new_user.email, current_user=current_user
-        )
-        context["notification"] = Notification(
-            style="warning",
-            content=f"User {created_user.username} was created but email wasn't sent. Verify the credentials.",
-        )
     except Unauthorized as e:
         context["notification"] = Notification(style="danger", content=e.msg)
         status_code = 401
@@ -114,6 +139,88 @@ async def add_user_post(
     return template_response
 
 
+@router.get("/import", response_class=HTMLResponse, name="dashboard_user_import_page")
+async def import_users(request: Request, current_user: User = Depends(user_htmx_dep)):
+
+    context = {
+        "request": request,
+        "title": "Import Users",
+        "description": "BAT App dashboard interface",
+        "max_rows": import_service.MAX_IMPORT_ROWS,
+    }
+
+    template_response = jinja.TemplateResponse(
+        name="dashboard/user-import.html", context=context
+    )
+
+    return template_response
+
+
+@router.post("/import", response_class=HTMLResponse)
+async def import_users_post(
+    request: Request, file: UploadFile, current_user: User = Depends(user_htmx_dep)
+):
+
+    context = {
+        "request": request,
+        "title": "Import Users",
+        "description": "BAT App dashboard interface",
+        "max_rows": import_service.MAX_IMPORT_ROWS,
+    }
+
+    status_code: int = 202
+
+    try:
+        content = await file.read(import_service.MAX_IMPORT_BYTES + 1)
+        # Parsing and the lookup of taken usernames run off the event loop
+        context["job"] = await run_in_threadpool(
+            import_service.start,
+            content=content,
+            filename=file.filename or "",
+            request=request,
+            current_user=current_user,
+        )
+    except InvalidImportRows as e:
+        context["notification"] = Notification(style="warning", content=e.msg)
+        context["import_errors"] = e.errors
+        status_code = 422
+    except InvalidFormEntry as e:
+        context["notification"] = Notification(style="warning", content=e.msg)
+        status_code = 422
+    except Unauthorized as e:
+        context["notification"] = Notification(style="danger", content=e.msg)
+        status_code = 401
+
+    template_response = jinja.TemplateResponse(
+        name="dashboard/user-import.html", context=context, status_code=status_code
+    )
+
+    return template_response
+
+
+@router.get(
+    "/import/{job_id}", response_class=HTMLResponse, name="dashboard_user_import_status"
+)
+async def import_users_status(
+    job_id: str, request: Request, current_user: User = Depends(user_htmx_dep)
+):
+
+    try:
+        job = import_service.get(job_id=job_id, current_user=current_user)
+    except RecordNotFound as e:
+        raise HTTPException(status_code=404, detail=e.msg)
+    except Unauthorized as e:
+        raise HTTPException(status_code=401, detail=e.msg)
+
+    context = {"request": request, "job": job}
+
+    template_response = jinja.TemplateResponse(
+        name="dashboard/user-import-status.html", context=context
+    )
+
+    return template_response
+
+
 @router.get("/{user_id}", response_class=HTMLResponse, name="dashboard_user_edit_page")
 async def edit_user(
     user_id: str, request: Request, current_user: User = Depends(user_htmx_dep)
@@ -219,10 +326,6 @@ async def delete_user(
             )
             context.update(notifcation)
 
-    context["users"] = service.get_all(current_user=current_user)
-
-    template_response = jinja.TemplateResponse(
-        name="dashboard/users.html", context=context
+    return users_page_response(
+        context=context, query=UserListQuery(), current_user=current_user
     )
-
-    return template_response
@@ -0,0 +1,28 @@
+import secrets
+
+from fastapi import APIRouter, HTTPException, Request
+from fastapi.responses import PlainTextResponse
+
+from app.config import METRICS_TOKEN
+import app.service.metrics as metrics
+
+
+router = APIRouter()
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+@router.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+async def get_metrics(request: Request):
+    """Prometheus metrics, for scrapers sending METRICS_TOKEN as bearer token.
+    They show the traffic of every route and the cache sizes, so without a
+    token configured the endpoint does not exist."""
+
+    if not METRICS_TOKEN:
+        raise HTTPException(status_code=404, detail="Not Found")
+
+    authorization = request.headers.get("authorization", "").encode()
+    if not secrets.compare_digest(authorization, f"Bearer {METRICS_TOKEN}".encode()):
+        raise HTTPException(status_code=401, detail="Invalid metrics token")
+
+    return PlainTextResponse(content=metrics.render(), media_type=PROMETHEUS_CONTENT_TYPE)
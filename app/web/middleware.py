@@ -0,0 +1,344 @@
+import hashlib
+import time
+import zlib
+
+from fastapi import Request
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from app.config import COMPRESSION_MIN_SIZE, SESSION_RENEW_WINDOW
+from app.service.metrics import RequestMetrics, current_request, record_request
+from app.service.authentication import (
+    handle_token_renewal,
+    jwt_to_expiry,
+    set_access_token_cookie,
+)
+from app.web.static import accepted_encodings
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+# Unix timestamp at which the session of an authenticated response expires
+SESSION_EXPIRES_HEADER = "X-Session-Expires"
+
+# Response types compressed on the fly, the static files come compressed
+COMPRESSIBLE_TYPES = ("text/html", "image/svg+xml", "application/json", "text/plain")
+# Fast levels, the responses are compressed on every request
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+
+
+class SlidingSessionMiddleware(BaseHTTPMiddleware):
+    """Renews the access token cookie of authenticated requests which arrive
+    within SESSION_RENEW_WINDOW seconds of the token expiry, or which asked
+    for it through request.state.renew_session, and returns the expiry of the
+    session in the X-Session-Expires header. The client schedules its renewal
+    from the header instead of polling the token.
+
+    Requests count as authenticated when user_htmx_dep stored the user and
+    its token on request.state."""
+
+    async def dispatch(self, request: Request, call_next):
+
+        response = await call_next(request)
+
+        current_user = getattr(request.state, "current_user", None)
+        access_token = getattr(request.state, "access_token", None)
+        if current_user is None or access_token is None:
+            return response
+
+        if (expires := jwt_to_expiry(access_token)) is None:
+            return response
+
+        renew = getattr(request.state, "renew_session", False)
+        if renew or expires - time.time() < SESSION_RENEW_WINDOW:
+            bearer_token = handle_token_renewal(current_user=current_user)
+            set_access_token_cookie(response=response, token=bearer_token)
+            expires = jwt_to_expiry(bearer_token.split(" ")[1])
+
+        response.headers[SESSION_EXPIRES_HEADER] = str(expires)
+
+        return response
+
+
+def route_name(scope: dict) -> str:
+    """Path template of the route which handled the request, e.g.
+    /dashboard/users/{user_id}, keeps the metrics to one series per route"""
+
+    if (route := scope.get("route")) is not None:
+        return route.path
+    # Mounted static files directories
+    if scope.get("endpoint") is not None and scope.get("root_path"):
+        return scope["root_path"]
+    return "unmatched"
+
+
+class MetricsMiddleware:
+    """Records latency, status code and SQL statements of every request in
+    the metrics. Plain ASGI middleware, unlike BaseHTTPMiddleware it sees the
+    last chunk of streamed responses, so the latency covers the whole body."""
+
+    def __init__(self, app):
+
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_metrics = RequestMetrics()
+        token = current_request.set(request_metrics)
+        status = 500
+        start = time.perf_counter()
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            current_request.reset(token)
+            record_request(
+                method=scope["method"],
+                route=route_name(scope),
+                status=status,
+                seconds=time.perf_counter() - start,
+                request_metrics=request_metrics,
+            )
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison of If-None-Match with <etag>, compressed responses
+    carry the weak form of the ETag"""
+
+    if if_none_match.strip() == "*":
+        return True
+    tags = (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    return etag.removeprefix("W/") in tags
+
+
+class HeldResponse:
+    """Start message and first body chunk of a response held back by a
+    middleware until it knows whether the response is complete.
+
+    BaseHTTPMiddleware sends every body as one chunk followed by an empty
+    last one, a response whose second message ends it is complete, one
+    sending more chunks is streamed."""
+
+    def __init__(self, start: dict):
+
+        self.start = start
+        self.chunk: bytes | None = None
+
+    def add(self, message: dict) -> tuple[bytes, bool] | None:
+        """Returns the body so far and whether it is complete, None while
+        the first chunk is held"""
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.chunk is None and more_body:
+            self.chunk = body
+            return None
+
+        return (self.chunk or b"") + body, not more_body
+
+
+class ETagMiddleware:
+    """Adds a strong ETag, the hash of the body, to successful GET responses
+    and answers requests whose If-None-Match holds it with 304 Not Modified
+    and no body. The page is still rendered, but an unchanged category
+    review or wheel is not sent again.
+
+    Responses are marked no-cache unless they set their own Cache-Control,
+    so the browser revalidates them on every request. Responses with an
+    ETag or Content-Encoding of their own and streamed ones pass
+    unchanged."""
+
+    def __init__(self, app):
+
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+
+        if scope["type"] != "http" or scope["method"] != "GET":
+            await self.app(scope, receive, send)
+            return
+
+        if_none_match = Headers(scope=scope).get("if-none-match")
+        held: HeldResponse | None = None
+
+        async def send_with_etag(message):
+            nonlocal held
+
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message["headers"])
+                if (
+                    message["status"] == 200
+                    and "etag" not in headers
+                    and "content-encoding" not in headers
+                ):
+                    held = HeldResponse(message)
+                    return
+                await send(message)
+                return
+
+            if message["type"] != "http.response.body" or held is None:
+                await send(message)
+                return
+
+            if (body := held.add(message)) is None:
+                return
+
+            body, complete = body
+            start, held = held.start, None
+            if not complete:
+                await send(start)
+                await send({**message, "body": body})
+                return
+
+            etag = '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+            headers = MutableHeaders(raw=start["headers"])
+            headers["ETag"] = etag
+            if "cache-control" not in headers:
+                headers["Cache-Control"] = "private, no-cache"
+
+            if if_none_match and etag_matches(if_none_match, etag):
+                del headers["Content-Length"]
+                del headers["Content-Type"]
+                await send({**start, "status": 304})
+                await send({"type": "http.response.body", "body": b""})
+                return
+
+            await send(start)
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, send_with_etag)
+
+
+class Encoder:
+    """Streaming gzip or brotli compression of one response body"""
+
+    def __init__(self, encoding: str):
+
+        self.encoding = encoding
+        if encoding == "br":
+            self._brotli = brotli.Compressor(quality=BROTLI_QUALITY)
+        else:
+            self._gzip = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+
+    def compress(self, data: bytes, final: bool) -> bytes:
+        """Compresses a chunk, flushed so the client can decode all chunks
+        sent so far"""
+
+        if self.encoding == "br":
+            chunk = self._brotli.process(data)
+            return chunk + (self._brotli.finish() if final else self._brotli.flush())
+
+        chunk = self._gzip.compress(data)
+        return chunk + self._gzip.flush(zlib.Z_FINISH if final else zlib.Z_SYNC_FLUSH)
+
+
+def negotiate_encoding(headers: Headers) -> str | None:
+
+    accepted = accepted_encodings(headers)
+    if brotli is not None and "br" in accepted:
+        return "br"
+    if "gzip" in accepted:
+        return "gzip"
+    return None
+
+
+class CompressionMiddleware:
+    """Compresses html, svg, json and text responses of at least
+    <minimum_size> bytes with brotli, when installed, or gzip, whichever the
+    client accepts. Streamed responses are compressed chunk by chunk.
+    Responses which already have a Content-Encoding, like the precompressed
+    static files, pass unchanged.
+
+    A compressed response keeps the ETag in its weak form, it is no longer
+    byte for byte the representation the strong ETag stood for."""
+
+    def __init__(self, app, minimum_size: int = COMPRESSION_MIN_SIZE):
+
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope, receive, send):
+
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(Headers(scope=scope))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        held: HeldResponse | None = None
+        encoder: Encoder | None = None
+
+        async def send_compressed(message):
+            nonlocal held, encoder
+
+            if message["type"] == "http.response.start":
+                headers = Headers(raw=message["headers"])
+                content_type = headers.get("content-type", "")
+                if (
+                    message["status"] == 200
+                    and "content-encoding" not in headers
+                    and content_type.startswith(COMPRESSIBLE_TYPES)
+                ):
+                    held = HeldResponse(message)
+                    return
+                await send(message)
+                return
+
+            if message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            if encoder is not None:
+                final = not message.get("more_body", False)
+                await send({**message, "body": encoder.compress(message.get("body", b""), final)})
+                return
+
+            if held is None:
+                await send(message)
+                return
+
+            if (body := held.add(message)) is None:
+                return
+
+            body, complete = body
+            start, held = held.start, None
+            if complete and len(body) < self.minimum_size:
+                await send(start)
+                await send({"type": "http.response.body", "body": body})
+                return
+
+            encoder = Encoder(encoding)
+            compressed = encoder.compress(body, final=complete)
+
+            headers = MutableHeaders(raw=start["headers"])
+            headers["Content-Encoding"] = encoding
+            headers.add_vary_header("Accept-Encoding")
+            if complete:
+                headers["Content-Length"] = str(len(compressed))
+            else:
+                del headers["Content-Length"]
+            if (etag := headers.get("etag")) and not etag.startswith("W/"):
+                headers["ETag"] = "W/" + etag
+
+            await send(start)
+            await send({"type": "http.response.body", "body": compressed, "more_body": not complete})
+
+        await self.app(scope, receive, send_compressed)
@@ -0,0 +1,18 @@
+from fastapi import Request
+
+from app.model.pagination import ListQuery
+
+
+def next_page_url(
+    request: Request, route_name: str, query: ListQuery, next_cursor: str | None
+) -> str | None:
+    """Returns url of the page following the current one with the same sort
+    and filters, or None on the last page. Used by the infinite scroll."""
+
+    if next_cursor is None:
+        return None
+
+    params = query.model_dump(mode="json", exclude_none=True)
+    params["cursor"] = next_cursor
+
+    return str(request.url_for(route_name).include_query_params(**params))
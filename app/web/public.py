@@ -1,15 +1,19 @@
-import os
+import asyncio
 from typing import Annotated
-from fastapi import APIRouter, Depends, Form, HTTPException, Request
+from fastapi import APIRouter, Depends, Form, HTTPException, Request, Response
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import HTMLResponse, RedirectResponse
-from time import sleep
 from random import randrange
 
 from app.config import CF_TURNSTILE_ENABLED, CF_TURNSTILE_SITE_KEY, SMTP_ENABLED
 
 from app.exception.auth import CFTurnstileVerificationFailed
 from app.exception.database import RecordNotFound
-from app.exception.service import IncorectCredentials, InvalidBearerToken
+from app.exception.service import (
+    IncorectCredentials,
+    InvalidBearerToken,
+    TooManyRequests,
+)
 
 from app.model.notification import Notification
 from app.model.user import User, UserSetNewPassword
@@ -19,11 +23,12 @@ from app.model.emailreset import PasswordResetRequest
 from app.template.init import jinja
 
 from app.service import user as user_service
+from app.service import rate_limit
 from app.service.authentication import (
     handle_token_creation,
     auth_user,
     get_current_user,
-    handle_token_renewal,
+    set_access_token_cookie,
     user_htmx_dep,
     cf_verify_response,
 )
@@ -32,6 +37,10 @@ from app.service.authentication import (
 router = APIRouter()
 
 
+def client_ip(request: Request) -> str:
+    return request.client.host if request.client else "unknown"
+
+
 @router.get("/", response_class=HTMLResponse, name="homepage")
 def homepage_get(request: Request):
 
@@ -129,6 +138,20 @@ def post_password_reset(request: Request, email_reset_data: PasswordResetRequest
         "description": "Reset password for your account.",
     }
 
+    try:
+        rate_limit.check_password_reset(
+            client_ip=client_ip(request), email=email_reset_data.email
+        )
+    except TooManyRequests as e:
+        context["notification"] = Notification(style="warning", content=e.msg)
+        response = jinja.TemplateResponse(
+            name="public/password-reset.html",
+            context=context,
+            status_code=429,
+            headers={"Retry-After": str(e.retry_after)},
+        )
+        return response
+
     try:
         user_service.create_password_reset_token(
             email=email_reset_data.email, request=request
@@ -218,10 +241,12 @@ def post_set_password(request: Request, set_new_password: UserSetNewPassword):
 async def post_token_refresh(
     request: Request, current_user: User = Depends(user_htmx_dep)
 ):
+    """Renews the session ahead of the renew window, the new token cookie and
+    its expiry are set by the SlidingSessionMiddleware."""
 
-    new_token = handle_token_renewal(current_user=current_user)
+    request.state.renew_session = True
 
-    return {"access_token": new_token}
+    return Response(status_code=204)
 
 
 @router.get("/login", response_class=HTMLResponse, name="login_page")
@@ -259,6 +284,17 @@ async def login_page_get(
     return response
 
 
+async def login_rejected(request: Request, e: TooManyRequests) -> HTMLResponse:
+    """Login page telling the client to slow down"""
+
+    notification = Notification(style="danger", content=e.msg)
+    response = await login_page_get(notification=notification, request=request)
+    response.status_code = 429
+    response.headers["Retry-After"] = str(e.retry_after)
+
+    return response
+
+
 @router.post("/login", response_class=HTMLResponse)
 async def login_page_post(
     request: Request,
@@ -274,9 +310,17 @@ async def login_page_post(
         "focus_input_name": "username",
     }
 
+    # Rejected before any password hashing or waiting. The rate limit and user
+    # lookups may write to sqlite, they run on the thread pool so a login
+    # waiting for the write lock does not stall the other requests
+    try:
+        await run_in_threadpool(rate_limit.check_login, client_ip=client_ip(request))
+    except TooManyRequests as e:
+        return await login_rejected(request=request, e=e)
+
     # Prevent information leaking through varying server response times
     delay = randrange(100, 500) / 1000
-    sleep(delay)
+    await asyncio.sleep(delay)
 
     token = None
 
@@ -288,15 +332,16 @@ async def login_page_post(
 
     try:
         if CF_TURNSTILE_ENABLED:
-            cf_verify_response(response=cf_token)
+            await cf_verify_response(response=cf_token)
 
         # handle email logins
         if "@" in username:
-            username = user_service.username_from_email(username)
+            username = await run_in_threadpool(user_service.username_from_email, username)
 
-        token = handle_token_creation(username=username, password=password)
+        await run_in_threadpool(rate_limit.check_account, username=username)
 
-        current_user = auth_user(username=username, password=password)
+        current_user = await auth_user(username=username, password=password)
+        token = handle_token_creation(user=current_user)
         user_role = current_user.role.value
 
         response = None
@@ -315,28 +360,20 @@ async def login_page_post(
                 raise IncorectCredentials(
                     msg="Incorrect credentials, unable to authenticate."
                 )
-            # Disable secure for non https - since cookies will be rejected on LAN IP's
-            if os.getenv("FORCE_HTTPS_PATHS_ENV"):
-                response.set_cookie(
-                    key="access_token",
-                    value=token,
-                    httponly=True,
-                    secure=True,
-                    samesite="strict",
-                )
-            else:
-                response.set_cookie(
-                    key="access_token", value=token, httponly=True, samesite="strict"
-                )
+            set_access_token_cookie(response=response, token=token)
 
             return response
 
     except IncorectCredentials as e:
+        await run_in_threadpool(rate_limit.login_failed, username=username)
         notification = Notification(style="danger", content=e.msg)
         status_code = 401
     except RecordNotFound:
+        await run_in_threadpool(rate_limit.login_failed, username=username)
         notification = Notification(style="danger", content="Invalid credentials.")
         status_code = 401
+    except TooManyRequests as e:
+        return await login_rejected(request=request, e=e)
     except CFTurnstileVerificationFailed as e:
         notification = Notification(style="danger", content=e.msg)
         status_code = 401
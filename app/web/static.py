@@ -0,0 +1,76 @@
+import re
+import stat
+
+import anyio
+from fastapi.staticfiles import StaticFiles
+from starlette.datastructures import Headers
+from starlette.responses import Response
+from starlette.types import Scope
+
+
+# Preferred first, the suffix of the variant written by app.service.static_assets
+ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+FINGERPRINTED = re.compile(r"\.[0-9a-f]{12}\.\w+$")
+
+
+def accepted_encodings(headers: Headers) -> set[str]:
+    """Content codings of the Accept-Encoding header, without those refused
+    with q=0"""
+
+    accepted = set()
+    for item in headers.get("accept-encoding", "").split(","):
+        coding, _, parameters = item.partition(";")
+        quality = parameters.strip().removeprefix("q=")
+        if quality and quality.strip() in ("0", "0.0", "0.00", "0.000"):
+            continue
+        accepted.add(coding.strip().lower())
+    return accepted
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """
+    Serves the files built by app.service.static_assets. Clients accepting
+    brotli or gzip get the compressed variant of a file when there is one,
+    with the Content-Encoding set, the others the file itself.
+
+    Fingerprinted files never change under their name and are cached by
+    the clients for a year without revalidation.
+    """
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+
+        response = None
+        if scope["method"] in ("GET", "HEAD"):
+            response = await self.encoded_response(path, scope)
+        if response is None:
+            response = await super().get_response(path, scope)
+
+        response.headers["Vary"] = "Accept-Encoding"
+        if FINGERPRINTED.search(path):
+            response.headers["Cache-Control"] = IMMUTABLE_CACHE_CONTROL
+        return response
+
+    async def encoded_response(self, path: str, scope: Scope) -> Response | None:
+
+        accepted = accepted_encodings(Headers(scope=scope))
+        for encoding, suffix in ENCODINGS:
+            if encoding not in accepted:
+                continue
+
+            try:
+                full_path, stat_result = await anyio.to_thread.run_sync(
+                    self.lookup_path, path + suffix
+                )
+            except OSError:
+                # Left to the plain lookup to answer
+                return None
+
+            if stat_result and stat.S_ISREG(stat_result.st_mode):
+                # The type is guessed from the name before the .br or .gz
+                response = self.file_response(full_path, stat_result, scope)
+                if response.status_code != 304:
+                    response.headers["Content-Encoding"] = encoding
+                return response
+
+        return None
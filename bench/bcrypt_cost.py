@@ -0,0 +1,68 @@
+"""bcrypt cost benchmark and calibration.
+
+Times one hash for each work factor, measures hashes per second on one core
+and on all of them at the calibrated work factor, and prints the
+BCRYPT_ROUNDS the app would pick on this machine for the target latency:
+
+    python bench/bcrypt_cost.py --target-ms 250
+"""
+
+import argparse
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import common
+
+from passlib.hash import bcrypt
+
+from app.service.authentication import (
+    BCRYPT_MAX_ROUNDS,
+    BCRYPT_MIN_ROUNDS,
+    calibrate_bcrypt_rounds,
+    measure_bcrypt,
+)
+
+
+def hashes_per_second(rounds: int, threads: int, duration: float) -> float:
+    """Hashes per second with <threads> threads hashing for <duration> seconds"""
+
+    handler = bcrypt.using(rounds=rounds)
+    deadline = time.perf_counter() + duration
+
+    def worker() -> int:
+        count = 0
+        while time.perf_counter() < deadline:
+            handler.hash("benchmark")
+            count += 1
+        return count
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        total = sum(executor.map(lambda _: worker(), range(threads)))
+    return total / (time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--target-ms", type=float, default=250, help="target latency of one hash")
+    parser.add_argument("--max-rounds", type=int, default=13, help="highest work factor to time")
+    parser.add_argument("--duration", type=float, default=3, help="seconds of each throughput run")
+    args = parser.parse_args()
+
+    cores = os.cpu_count() or 1
+
+    print("rounds   ms/hash   hashes/s/core")
+    for rounds in range(BCRYPT_MIN_ROUNDS, min(args.max_rounds, BCRYPT_MAX_ROUNDS) + 1):
+        seconds = measure_bcrypt(rounds, samples=3)
+        print(f"{rounds:>6}  {seconds * 1000:8.1f}  {1 / seconds:14.1f}")
+
+    rounds = calibrate_bcrypt_rounds(target_ms=args.target_ms)
+    single = hashes_per_second(rounds, threads=1, duration=args.duration)
+    parallel = hashes_per_second(rounds, threads=cores, duration=args.duration)
+
+    print()
+    print(f"Calibrated for {args.target_ms:.0f} ms: BCRYPT_ROUNDS={rounds}")
+    print(f"  1 thread:  {single:.1f} hashes/s")
+    print(f"  {cores} threads: {parallel:.1f} hashes/s, {parallel / cores:.1f} hashes/s per core")
@@ -0,0 +1,362 @@
+"""Load test of coaching sessions against the real ASGI app.
+
+Seeds a throwaway database through app.data with --coaches coach accounts,
+--assessments assessments of each coach, a share of them answered, and
+--reports reports of each coach. Then runs --sessions concurrent coaching
+sessions in process through httpx, every session:
+
+1) logs in as a coach
+2) lists the assessments
+3) opens and answers all 52 questions of one of the coach's assessments
+4) opens the review of every category and saves a note
+5) creates a report of the assessment
+
+and prints latency percentiles and throughput per endpoint:
+
+    python bench/coaching_session.py --sessions 10 --coaches 20 --assessments 10
+
+--save stores the results as json, --baseline compares p95 latencies with
+stored results and exits with 1 when an endpoint got slower than
+--tolerance, so regressions of these paths show up between two commits.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import re
+import sys
+import time
+from collections import defaultdict
+from uuid import uuid4
+
+import common
+
+# Every session logs in from the same address
+os.environ.setdefault("LOGIN_ATTEMPTS_PER_IP", "1000000")
+os.environ.setdefault("LOGIN_ATTEMPTS_PER_USER", "1000000")
+
+import httpx
+
+from app.main import app
+from app.data import assessment as assessment_data
+from app.data import report as report_data
+from app.data import user as user_data
+from app.data.init import pool
+from app.model.assesment import AssessmentAnswerPost, AssessmentNew
+from app.model.report import Report
+from app.model.user import User, UserRoleEnum
+from app.service.authentication import get_password_hash
+
+
+PASSWORD = "benchmark-password"
+ANSWER_OPTIONS = ("yes", "mid", "no")
+ANSWER_ID = re.compile(r'name="answer_id"[^>]*value="([^"]+)"')
+NOTE_ID = re.compile(r'var note_id = "(\d*)";')
+
+
+# -------------------------------
+#   Seed
+# -------------------------------
+
+
+def seed(
+    coaches: int, assessments: int, reports: int, answered: float, rng: random.Random
+) -> dict[str, list[str]]:
+    """Fills the database, returns assessment ids of every coach username"""
+
+    # bcrypt of every coach would take longer than the benchmark, they share
+    # one password
+    password_hash = get_password_hash(PASSWORD)
+    users = [
+        User(
+            user_id=str(uuid4()),
+            username=f"coach{i}",
+            email=f"coach{i}@bench.example.com",
+            hash=password_hash,
+            role=UserRoleEnum.coach,
+        )
+        for i in range(coaches)
+    ]
+    user_data.create_many(users)
+
+    new_assessments = [
+        AssessmentNew(
+            assessment_id=str(uuid4()),
+            assessment_name=f"{user.username} assessment {i}",
+            owner_id=str(user.user_id),
+        )
+        for user in users
+        for i in range(assessments)
+    ]
+    assessment_data.create_assessments(new_assessments)
+
+    with pool.write():
+        for assessment in rng.sample(new_assessments, int(len(new_assessments) * answered)):
+            qa = assessment_data.filter_assessment_qa_by_category_order_and_question_id(
+                assessment_id=assessment.assessment_id
+            )
+            for question in qa:
+                assessment_data.save_answer(
+                    AssessmentAnswerPost(
+                        answer_id=str(question.answer_id),
+                        assessment_id=assessment.assessment_id,
+                        question_order=question.question_order,
+                        answer_option=rng.choice(ANSWER_OPTIONS),
+                        answer_description="",
+                    )
+                )
+
+        for i, assessment in enumerate(new_assessments):
+            if i % assessments >= reports:
+                continue
+            report_data.create_report(
+                Report(
+                    report_id=str(uuid4()),
+                    report_name=f"Report of {assessment.assessment_name}",
+                    assessment_id=assessment.assessment_id,
+                    public=False,
+                    key=str(uuid4()),
+                    wheel_filename=None,
+                    summary=None,
+                    recommendation_title_1=None,
+                    recommendation_content_1=None,
+                    recommendation_title_2=None,
+                    recommendation_content_2=None,
+                    recommendation_title_3=None,
+                    recommendation_content_3=None,
+                )
+            )
+
+    owned: dict[str, list[str]] = defaultdict(list)
+    usernames = {user.user_id: user.username for user in users}
+    for assessment in new_assessments:
+        owned[usernames[assessment.owner_id]].append(assessment.assessment_id)
+    return owned
+
+
+# -------------------------------
+#   Sessions
+# -------------------------------
+
+
+class Recorder:
+    """Latencies of the requests by endpoint"""
+
+    def __init__(self):
+
+        self.latencies: dict[str, list[float]] = defaultdict(list)
+        self.errors: dict[str, int] = defaultdict(int)
+
+    async def request(
+        self, client: httpx.AsyncClient, endpoint: str, method: str, url: str, **kwargs
+    ) -> httpx.Response:
+
+        start = time.perf_counter()
+        response = await client.request(method, url, **kwargs)
+        self.latencies[endpoint].append(time.perf_counter() - start)
+
+        if response.status_code >= 400:
+            self.errors[endpoint] += 1
+            raise RuntimeError(f"{method} {url} failed with {response.status_code}")
+
+        return response
+
+
+async def coaching_session(
+    transport: httpx.ASGITransport,
+    recorder: Recorder,
+    username: str,
+    assessment_id: str,
+    layout: list[tuple[int, int]],
+    rng: random.Random,
+):
+
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://bench", headers={"HX-Request": "true"}
+    ) as client:
+
+        response = await recorder.request(
+            client, "POST /login", "POST", "/login",
+            data={"username": username, "password": PASSWORD},
+        )
+        client.cookies.set("access_token", response.cookies["access_token"].strip('"'))
+
+        await recorder.request(
+            client, "GET /dashboard/assessments", "GET", "/dashboard/assessments"
+        )
+
+        for category_order, question_order in layout:
+            url = f"/dashboard/assessments/edit/{assessment_id}/{category_order}/{question_order}"
+            page = await recorder.request(
+                client, "GET /dashboard/assessments/edit/{id}/{c}/{q}", "GET", url
+            )
+            await recorder.request(
+                client, "POST /dashboard/assessments/edit/{id}/{c}/{q}", "POST", url,
+                json={
+                    "answer_id": ANSWER_ID.search(page.text)[1],
+                    "assessment_id": assessment_id,
+                    "question_order": question_order,
+                    "answer_option": rng.choice(ANSWER_OPTIONS),
+                    "answer_description": "Answered during the coaching session.",
+                },
+            )
+
+        for category_order in sorted({category for category, _ in layout}):
+            url = f"/dashboard/assessments/review/{assessment_id}/{category_order}"
+            page = await recorder.request(
+                client, "GET /dashboard/assessments/review/{id}/{c}", "GET", url
+            )
+            note_id = NOTE_ID.search(page.text)[1]
+            await recorder.request(
+                client, "PUT /dashboard/assessments/review/{id}/{c}", "PUT", url,
+                json={
+                    "note_id": int(note_id) if note_id else None,
+                    "assessment_id": assessment_id,
+                    "category_order": category_order,
+                    "note_content": {"ops": [{"insert": "Agreed next steps.\n"}]},
+                },
+            )
+
+        await recorder.request(
+            client, "POST /dashboard/reports/create", "POST", "/dashboard/reports/create",
+            json={"assessment_id": assessment_id, "report_name": f"{username} session report"},
+        )
+
+
+async def run_sessions(
+    sessions: int, owned: dict[str, list[str]], rng: random.Random, recorder: Recorder
+) -> float:
+    """Runs <sessions> concurrent sessions, returns their wall time"""
+
+    transport = httpx.ASGITransport(app=app, client=("127.0.0.1", 50000))
+    usernames = sorted(owned)
+
+    tasks = []
+    for i in range(sessions):
+        username = usernames[i % len(usernames)]
+        assessment_id = rng.choice(owned[username])
+        layout = [
+            (question.category_order, question.question_order)
+            for question in assessment_data.filter_assessment_qa_by_category_order_and_question_id(
+                assessment_id=assessment_id
+            )
+        ]
+        tasks.append(
+            coaching_session(transport, recorder, username, assessment_id, layout, rng)
+        )
+
+    start = time.perf_counter()
+    await asyncio.gather(*tasks)
+    return time.perf_counter() - start
+
+
+# -------------------------------
+#   Results
+# -------------------------------
+
+
+def results(recorder: Recorder, wall: float) -> dict[str, dict]:
+
+    return {
+        endpoint: {
+            "n": len(latencies),
+            "rps": len(latencies) / wall,
+            "p50": common.percentile(latencies, 50),
+            "p95": common.percentile(latencies, 95),
+            "p99": common.percentile(latencies, 99),
+            "max": max(latencies),
+            "errors": recorder.errors[endpoint],
+        }
+        for endpoint, latencies in recorder.latencies.items()
+    }
+
+
+def print_results(endpoints: dict[str, dict], wall: float):
+
+    print(f"{'endpoint':<50} {'n':>6} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'max ms':>8}")
+    for endpoint, result in endpoints.items():
+        print(
+            f"{endpoint:<50} {result['n']:>6} {result['rps']:>8.1f} "
+            f"{result['p50'] * 1000:>8.1f} {result['p95'] * 1000:>8.1f} "
+            f"{result['p99'] * 1000:>8.1f} {result['max'] * 1000:>8.1f}"
+        )
+    total = sum(result["n"] for result in endpoints.values())
+    print(f"{total} requests in {wall:.2f} s, {total / wall:.1f} req/s")
+
+
+def compare(endpoints: dict[str, dict], baseline: dict[str, dict], tolerance: float) -> bool:
+    """Prints endpoints whose p95 got worse than <tolerance> over the
+    baseline, returns whether there were none"""
+
+    ok = True
+    for endpoint, result in endpoints.items():
+        if endpoint not in baseline:
+            continue
+        before, after = baseline[endpoint]["p95"], result["p95"]
+        if after > before * (1 + tolerance):
+            print(f"REGRESSION {endpoint}: p95 {before * 1000:.1f} ms -> {after * 1000:.1f} ms")
+            ok = False
+    return ok
+
+
+async def main(args: argparse.Namespace) -> int:
+
+    rng = random.Random(args.seed)
+
+    async with app.router.lifespan_context(app):
+        start = time.perf_counter()
+        owned = seed(
+            coaches=args.coaches,
+            assessments=args.assessments,
+            reports=args.reports,
+            answered=args.answered,
+            rng=rng,
+        )
+        print(
+            f"Seeded {args.coaches} coaches, {args.coaches * args.assessments} assessments "
+            f"and {args.coaches * min(args.reports, args.assessments)} reports "
+            f"in {time.perf_counter() - start:.1f} s"
+        )
+
+        # Fills the caches and the jinja environment outside of the results
+        await run_sessions(sessions=args.warmup, owned=owned, rng=rng, recorder=Recorder())
+
+        recorder = Recorder()
+        wall = await run_sessions(sessions=args.sessions, owned=owned, rng=rng, recorder=recorder)
+
+    endpoints = results(recorder, wall)
+    print()
+    print(f"{args.sessions} concurrent coaching sessions")
+    print_results(endpoints, wall)
+
+    if args.save:
+        with open(args.save, "w") as file:
+            json.dump({"args": vars(args), "endpoints": endpoints}, file, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)["endpoints"]
+        if not compare(endpoints, baseline, args.tolerance):
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=10, help="concurrent coaching sessions")
+    parser.add_argument("--warmup", type=int, default=1, help="sessions run before the measured ones")
+    parser.add_argument("--coaches", type=int, default=20, help="seeded coach accounts")
+    parser.add_argument("--assessments", type=int, default=10, help="seeded assessments per coach")
+    parser.add_argument("--reports", type=int, default=2, help="seeded reports per coach")
+    parser.add_argument("--answered", type=float, default=0.5, help="share of seeded assessments answered")
+    parser.add_argument("--seed", type=int, default=1, help="random seed of the data and answers")
+    parser.add_argument("--save", help="write the results to this json file")
+    parser.add_argument("--baseline", help="compare p95 latencies with this json file")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed p95 slowdown over the baseline")
+    args = parser.parse_args()
+
+    sys.exit(asyncio.run(main(args)))
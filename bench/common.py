@@ -0,0 +1,50 @@
+"""Shared setup of the benchmark scripts.
+
+Importing this module points the app to a throwaway database and fills in
+the settings the app refuses to start without, so the benchmarks never touch
+the real data. Import it before anything from app.
+"""
+
+import os
+import statistics
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+BENCH_DIR = tempfile.mkdtemp(prefix="bat-bench-")
+BENCH_ENV = {
+    "DB_PATH": os.path.join(BENCH_DIR, "database.db"),
+    "UPLOADS_DIR": os.path.join(BENCH_DIR, "uploads"),
+    "SECRET_KEY": "bench",
+    "ALGORITHM": "HS256",
+    "ACCESS_TOKEN_EXPIRE_MINUTES": "30",
+    "DEFAULT_USER": "admin",
+    "DEFAULT_EMAIL": "admin@example.com",
+    "DEFAULT_PASSWORD": "password123456",
+}
+for key, value in BENCH_ENV.items():
+    os.environ.setdefault(key, value)
+# Mounted by the app at import, it must exist before app.main is imported
+os.makedirs(os.environ["UPLOADS_DIR"], exist_ok=True)
+# Captcha would call cloudflare from the benchmark
+os.environ.pop("CF_TURNSTILE_SECRET_KEY", None)
+
+
+def percentile(values: list[float], p: float) -> float:
+
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, round(p / 100 * (len(ordered) - 1)))
+    return ordered[index]
+
+
+def summary(name: str, latencies: list[float]) -> str:
+    """One line summary of <latencies> in seconds"""
+
+    ms = [latency * 1000 for latency in latencies]
+    return (
+        f"{name:<8} n={len(ms):<4} mean={statistics.mean(ms):7.1f} ms  "
+        f"p50={percentile(ms, 50):7.1f} ms  p95={percentile(ms, 95):7.1f} ms  "
+        f"max={max(ms):7.1f} ms"
+    )
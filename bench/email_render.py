@@ -0,0 +1,77 @@
+"""E-mail rendering benchmark.
+
+Renders the welcome e-mail for --count recipients, once through jinja for
+every recipient like the app used to and once from the precompiled frames,
+and prints the time per e-mail of each:
+
+    python bench/email_render.py --count 10000
+"""
+
+import argparse
+import time
+
+import common
+
+from starlette.datastructures import URL
+
+from app.main import app
+from app.template.email import render_email
+from app.template.init import jinja
+
+
+BASE_URL = "https://bat.example.com/"
+
+
+def url_for(name: str, **path_params) -> URL:
+
+    return URL(BASE_URL.rstrip("/") + app.url_path_for(name, **path_params))
+
+
+def render_jinja(usernames: list[str], text: bool) -> float:
+    """Seconds to render the e-mail of every username with jinja"""
+
+    start = time.perf_counter()
+    for username in usernames:
+        context = {"username": username, "website_url": BASE_URL, "url_for": url_for}
+        jinja.env.get_template("email/new-user.html").render(context)
+        if text:
+            jinja.env.get_template("email/new-user.txt").render(context)
+    return time.perf_counter() - start
+
+
+def render_frames(usernames: list[str]) -> float:
+    """Seconds to render the e-mail of every username from the frames"""
+
+    start = time.perf_counter()
+    for username in usernames:
+        render_email("new-user", url_for=url_for, base_url=BASE_URL, username=username)
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=10000, help="e-mails to render")
+    args = parser.parse_args()
+
+    usernames = [f"user{i}" for i in range(args.count)]
+
+    # Compiles the templates and builds the frames outside of the timing
+    render_jinja(usernames[:1], text=True)
+    render_frames(usernames[:1])
+
+    # The frames must render the same html as jinja does
+    context = {"username": "O'Brien <ob>", "website_url": BASE_URL, "url_for": url_for}
+    expected = jinja.env.get_template("email/new-user.html").render(context)
+    rendered = render_email("new-user", url_for=url_for, base_url=BASE_URL, username="O'Brien <ob>")
+    assert rendered.html == expected, "frame and jinja output differ"
+
+    results = {
+        "jinja html": render_jinja(usernames, text=False),
+        "jinja html+text": render_jinja(usernames, text=True),
+        "frames html+text": render_frames(usernames),
+    }
+
+    print(f"{args.count} welcome e-mails")
+    for name, seconds in results.items():
+        print(f"  {name:<17} {seconds * 1000:8.1f} ms total  {seconds / args.count * 1e6:7.1f} us/e-mail")
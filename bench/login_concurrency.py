@@ -0,0 +1,89 @@
+"""Login concurrency benchmark.
+
+Fires a burst of concurrent logins at the app in process, while a probe keeps
+requesting the login page. With a blocking login pipeline the probe latency
+grows with every login in flight; with a non-blocking one it stays flat and
+the burst takes about as long as the bcrypt work divided by the hash workers.
+
+Runs against a throwaway database, the real one is never touched:
+
+    python bench/login_concurrency.py --logins 50
+"""
+
+import argparse
+import asyncio
+import os
+import time
+
+from common import summary
+
+# Every login comes from the same address and for the same account
+os.environ.setdefault("LOGIN_ATTEMPTS_PER_IP", "1000000")
+os.environ.setdefault("LOGIN_ATTEMPTS_PER_USER", "1000000")
+
+import httpx
+
+from app.main import app
+
+
+async def login(client: httpx.AsyncClient, password: str) -> float:
+
+    start = time.perf_counter()
+    r = await client.post(
+        "/login",
+        data={"username": os.environ["DEFAULT_USER"], "password": password},
+        follow_redirects=False,
+    )
+    # Failed logins render the login page again
+    if r.status_code not in (200, 303, 401):
+        raise RuntimeError(f"Unexpected login response {r.status_code}")
+    return time.perf_counter() - start
+
+
+async def probe(client: httpx.AsyncClient, stop: asyncio.Event, interval: float) -> list[float]:
+
+    latencies: list[float] = []
+    while not stop.is_set():
+        start = time.perf_counter()
+        await client.get("/login")
+        latencies.append(time.perf_counter() - start)
+        await asyncio.sleep(interval)
+    return latencies
+
+
+async def run(logins: int, failed_ratio: float, interval: float):
+
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+            # Warm up templates and connections
+            await client.get("/login")
+
+            stop = asyncio.Event()
+            probe_task = asyncio.create_task(probe(client, stop, interval))
+
+            failed = int(logins * failed_ratio)
+            passwords = [os.environ["DEFAULT_PASSWORD"]] * (logins - failed) + ["wrong"] * failed
+
+            start = time.perf_counter()
+            login_latencies = await asyncio.gather(*(login(client, p) for p in passwords))
+            elapsed = time.perf_counter() - start
+
+            stop.set()
+            probe_latencies = await probe_task
+
+    print(f"{logins} concurrent logins ({failed} failed) in {elapsed:.2f} s, "
+          f"{logins / elapsed:.1f} logins/s")
+    print(summary("login", login_latencies))
+    print(summary("probe", probe_latencies))
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--logins", type=int, default=50, help="number of concurrent logins")
+    parser.add_argument("--failed", type=float, default=0.2, help="ratio of logins with a wrong password")
+    parser.add_argument("--interval", type=float, default=0.02, help="seconds between probe requests")
+    args = parser.parse_args()
+
+    asyncio.run(run(logins=args.logins, failed_ratio=args.failed, interval=args.interval))